@@ -17,13 +17,19 @@ interface ActivityItem {
 }
 
 function getRecentActivity(members: TeamMember[], limit = 5): ActivityItem[] {
-  const items: ActivityItem[] = members.map((member) => ({
-    memberId: member.id,
-    memberName: member.name,
-    emoji: member.currentMood.emoji,
-    label: member.currentMood.label,
-    timestamp: member.currentMood.timestamp,
-  }));
+  const items: ActivityItem[] = members.flatMap(({ id, name = '', currentMood }) =>
+    currentMood
+      ? [
+          {
+            memberId: id,
+            memberName: name,
+            emoji: currentMood.emoji,
+            label: currentMood.label,
+            timestamp: currentMood.timestamp,
+          },
+        ]
+      : [],
+  );
 
   return items
     .sort((a, b) => new Date(b.timestamp).getTime() - new Date(a.timestamp).getTime())
@@ -13,14 +13,15 @@ function computeTeamVibe(members: TeamMember[]): { emoji: string; label: string
 
   const counts = new Map<string, { emoji: string; label: string; count: number }>();
   for (const member of members) {
-    const key = member.currentMood.label;
-    const existing = counts.get(key);
+    const mood = member.currentMood;
+    if (!mood) continue;
+    const existing = counts.get(mood.label);
     if (existing) {
       existing.count++;
     } else {
-      counts.set(key, {
-        emoji: member.currentMood.emoji,
-        label: member.currentMood.label,
+      counts.set(mood.label, {
+        emoji: mood.emoji,
+        label: mood.label,
         count: 1,
       });
     }
@@ -23,21 +23,24 @@ export function MoodDistribution({ members }: MoodDistributionProps) {
 
   const counts = new Map<string, { label: string; emoji: string; count: number }>();
   for (const member of members) {
-    const key = member.currentMood.label;
-    const existing = counts.get(key);
+    const mood = member.currentMood;
+    if (!mood) continue;
+    const existing = counts.get(mood.label);
     if (existing) {
       existing.count++;
     } else {
-      counts.set(key, {
-        label: key,
-        emoji: member.currentMood.emoji,
+      counts.set(mood.label, {
+        label: mood.label,
+        emoji: mood.emoji,
         count: 1,
       });
     }
   }
 
   const segments = Array.from(counts.values()).sort((a, b) => b.count - a.count);
-  const total = members.length;
+  // Members without a mood yet are left out of the bar
+  const total = segments.reduce((sum, segment) => sum + segment.count, 0);
+  if (total === 0) return null;
 
   return (
     <View>
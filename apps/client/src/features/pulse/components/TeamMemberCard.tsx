@@ -19,14 +19,15 @@ interface TeamMemberCardProps {
 
 export function TeamMemberCard({ member }: TeamMemberCardProps) {
   const [expanded, setExpanded] = useState(false);
-  const moodColor = getMoodColor(member.currentMood.label);
+  const { currentMood, moodHistory = [], name = '', role, status } = member;
+  const moodColor = getMoodColor(currentMood?.label ?? '');
 
   const toggle = () => {
     LayoutAnimation.configureNext(LayoutAnimation.Presets.easeInEaseOut);
     setExpanded((prev) => !prev);
   };
 
-  const lastCheckIn = formatRelativeTime(member.currentMood.timestamp);
+  const lastCheckIn = currentMood ? formatRelativeTime(currentMood.timestamp) : 'never';
 
   return (
     <Pressable onPress={toggle}>
@@ -36,15 +37,17 @@ export function TeamMemberCard({ member }: TeamMemberCardProps) {
       >
         {/* Main row */}
         <View className="flex-row items-center p-4">
-          <Avatar name={member.name} size={52} />
+          <Avatar name={name} size={52} />
           <View className="flex-1 ml-3">
-            <Text className="text-base font-bold text-text-primary">{member.name}</Text>
+            <Text className="text-base font-bold text-text-primary">{name}</Text>
             <View className="flex-row items-center gap-1.5 mt-0.5">
-              <StatusDot status={member.status} />
-              <Text className="text-sm text-text-secondary">{member.role}</Text>
+              {status && <StatusDot status={status} />}
+              <Text className="text-sm text-text-secondary">{role}</Text>
             </View>
           </View>
-          <MoodBadge emoji={member.currentMood.emoji} label={member.currentMood.label} />
+          {currentMood && (
+            <MoodBadge emoji={currentMood.emoji} label={currentMood.label} />
+          )}
           <Text className="text-text-secondary ml-2">{expanded ? '▲' : '▼'}</Text>
         </View>
 
@@ -56,9 +59,9 @@ export function TeamMemberCard({ member }: TeamMemberCardProps) {
                 Last check-in: {lastCheckIn}
               </Text>
 
-              {member.moodHistory.length > 0 ? (
+              {moodHistory.length > 0 ? (
                 <View className="ml-1">
-                  {member.moodHistory.map((entry, index) => (
+                  {moodHistory.map((entry, index) => (
                     <View
                       key={`${entry.timestamp}-${index}`}
                       className="flex-row items-center mb-2"
@@ -8,16 +8,22 @@ interface MoodAnalysis {
   total: number;
 }
 
+// `name`, `currentMood` and `moodHistory` are optional on the wire
+function firstName(member: TeamMember): string {
+  return (member.name ?? '').split(' ')[0];
+}
+
 function analyzeMoods(members: TeamMember[]): MoodAnalysis {
   const counts = new Map<string, { label: string; emoji: string; count: number }>();
 
   for (const member of members) {
-    const key = member.currentMood.label;
-    const existing = counts.get(key);
+    const mood = member.currentMood;
+    if (!mood) continue;
+    const existing = counts.get(mood.label);
     if (existing) {
       existing.count++;
     } else {
-      counts.set(key, { label: key, emoji: member.currentMood.emoji, count: 1 });
+      counts.set(mood.label, { label: mood.label, emoji: mood.emoji, count: 1 });
     }
   }
 
@@ -29,12 +35,14 @@ function analyzeMoods(members: TeamMember[]): MoodAnalysis {
   // Outliers: members with a mood that only 1 person has, especially Tired/Stressed
   const outliers: MoodAnalysis['outliers'] = [];
   for (const member of members) {
-    const moodCount = counts.get(member.currentMood.label)?.count ?? 0;
+    const mood = member.currentMood;
+    if (!mood) continue;
+    const moodCount = counts.get(mood.label)?.count ?? 0;
     if (moodCount === 1) {
       outliers.push({
-        name: member.name.split(' ')[0],
-        mood: member.currentMood.label,
-        emoji: member.currentMood.emoji,
+        name: firstName(member),
+        mood: mood.label,
+        emoji: mood.emoji,
       });
     }
   }
@@ -42,7 +50,7 @@ function analyzeMoods(members: TeamMember[]): MoodAnalysis {
   // Streaks: consecutive same-mood entries in moodHistory (length >= 2)
   const streaks: MoodAnalysis['streaks'] = [];
   for (const member of members) {
-    const history = member.moodHistory;
+    const history = member.moodHistory ?? [];
     if (history.length < 2) continue;
 
     let currentStreak = 1;
@@ -54,7 +62,7 @@ function analyzeMoods(members: TeamMember[]): MoodAnalysis {
       } else {
         if (currentStreak >= 2) {
           streaks.push({
-            name: member.name.split(' ')[0],
+            name: firstName(member),
             mood: streakMood,
             length: currentStreak,
           });
@@ -65,7 +73,7 @@ function analyzeMoods(members: TeamMember[]): MoodAnalysis {
     }
     if (currentStreak >= 2) {
       streaks.push({
-        name: member.name.split(' ')[0],
+        name: firstName(member),
         mood: streakMood,
         length: currentStreak,
       });
@@ -74,7 +82,7 @@ function analyzeMoods(members: TeamMember[]): MoodAnalysis {
 
   // Ship confidence: percentage of Happy or Fired Up members
   const positiveCount = members.filter(
-    (m) => m.currentMood.label === 'Happy' || m.currentMood.label === 'Fired Up',
+    (m) => m.currentMood?.label === 'Happy' || m.currentMood?.label === 'Fired Up',
   ).length;
   const shipConfidence = Math.min(
     99,
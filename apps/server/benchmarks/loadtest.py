@@ -0,0 +1,401 @@
+"""Load-test harness: seed a dataset, drive a mixed workload, report latency.
+
+Usage (from apps/server):
+    python -m benchmarks.loadtest run --members 500 --moods 20 --output base.json
+    python -m benchmarks.loadtest run --server uvicorn --concurrency 32 --output head.json
+    python -m benchmarks.loadtest run --url http://localhost:8000 --duration 30
+    python -m benchmarks.loadtest compare base.json head.json --threshold 0.10
+
+`run` seeds a fresh SQLite file with N members × M moods and either drives the
+app in-process through httpx's ASGI transport (default) or starts it under
+uvicorn on localhost. With `--url` it targets an already running server and
+skips seeding. Workers pick endpoints at random by `--mix` weight for
+`--duration` seconds after a `--warmup`. The report has per-endpoint
+p50/p95/p99 latency and requests per second, as JSON.
+
+`compare` diffs two reports and exits 1 when an endpoint's p95/p99 latency
+grows, or its throughput drops, by more than the threshold.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+API = "/api/v1"
+DEFAULT_MIX = "team_list=3,member_get=3,mood_submit=2,preferences_get=1,preferences_put=1"
+MOODS = [
+    ("\U0001f60a", "Happy"),
+    ("\U0001f525", "Fired Up"),
+    ("\U0001f914", "Thinking"),
+    ("\U0001f610", "Neutral"),
+    ("\U0001f634", "Tired"),
+    ("\U0001f629", "Stressed"),
+]
+
+
+# ── Dataset ────────────────────────────────────────────
+
+
+def seed_dataset(database_url: str, members: int, moods: int, seed: int = 0) -> None:
+    """Create tables and bulk-insert N synthetic members with M moods each."""
+    # Imported here so DATABASE_URL is set before settings are first read
+    from src.infrastructure.database.connection import SessionLocal, create_tables
+    from src.seeds.synthetic import seed_synthetic_data
+
+    create_tables()
+    db = SessionLocal()
+    try:
+        seed_synthetic_data(db, members, moods, seed, end=datetime.now(timezone.utc))
+    finally:
+        db.close()
+
+
+# ── Workload ───────────────────────────────────────────
+
+
+@dataclass
+class Workload:
+    client: httpx.AsyncClient
+    member_ids: list[str]
+    users: list[str]
+    team_query: str
+    rng: random.Random
+
+    async def team_list(self) -> httpx.Response:
+        return await self.client.get(f"{API}/team{self.team_query}")
+
+    async def member_get(self) -> httpx.Response:
+        return await self.client.get(f"{API}/team/{self.rng.choice(self.member_ids)}")
+
+    async def mood_submit(self) -> httpx.Response:
+        emoji, label = self.rng.choice(MOODS)
+        return await self.client.post(
+            f"{API}/team/{self.rng.choice(self.member_ids)}/mood",
+            json={"emoji": emoji, "label": label},
+        )
+
+    async def preferences_get(self) -> httpx.Response:
+        return await self.client.get(f"{API}/preferences/{self.rng.choice(self.users)}")
+
+    async def preferences_put(self) -> httpx.Response:
+        return await self.client.put(
+            f"{API}/preferences/{self.rng.choice(self.users)}",
+            json={
+                "username": f"user{self.rng.randrange(1000)}",
+                "dark_mode": self.rng.random() < 0.5,
+            },
+        )
+
+
+ENDPOINTS = ("team_list", "member_get", "mood_submit", "preferences_get", "preferences_put")
+
+
+@dataclass
+class Samples:
+    latencies: dict[str, list[float]] = field(default_factory=dict)
+    errors: dict[str, int] = field(default_factory=dict)
+
+    def record(self, name: str, seconds: float, ok: bool) -> None:
+        self.latencies.setdefault(name, []).append(seconds)
+        if not ok:
+            self.errors[name] = self.errors.get(name, 0) + 1
+
+
+def parse_mix(spec: str) -> dict[str, float]:
+    mix: dict[str, float] = {}
+    for part in spec.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in ENDPOINTS:
+            raise ValueError(f"Unknown endpoint '{name}' in mix; expected one of {ENDPOINTS}")
+        mix[name] = float(weight or 1)
+    if not any(w > 0 for w in mix.values()):
+        raise ValueError("Mix needs at least one endpoint with a positive weight")
+    return mix
+
+
+async def drive(
+    workload: Workload,
+    mix: dict[str, float],
+    concurrency: int,
+    duration: float,
+    warmup: float,
+) -> tuple[Samples, float]:
+    """Run `concurrency` workers; samples taken during warmup are discarded."""
+    names = list(mix)
+    weights = [mix[n] for n in names]
+    samples = Samples()
+    loop = asyncio.get_running_loop()
+    measure_from = loop.time() + warmup
+    stop_at = measure_from + duration
+
+    async def worker() -> None:
+        while (now := loop.time()) < stop_at:
+            name = workload.rng.choices(names, weights)[0]
+            call: Callable[[], Awaitable[httpx.Response]] = getattr(workload, name)
+            start = time.perf_counter()
+            try:
+                ok = (await call()).is_success
+            except httpx.HTTPError:
+                ok = False
+            elapsed = time.perf_counter() - start
+            if now >= measure_from:
+                samples.record(name, elapsed, ok)
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return samples, duration
+
+
+# ── Report ─────────────────────────────────────────────
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, round(q / 100 * len(sorted_values) + 0.5 - 1e-9))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize(latencies: list[float], errors: int, duration: float) -> dict[str, Any]:
+    ordered = sorted(latencies)
+    ms = 1000.0
+    return {
+        "requests": len(ordered),
+        "errors": errors,
+        "rps": round(len(ordered) / duration, 2) if duration > 0 else 0.0,
+        "latency_ms": {
+            "p50": round(percentile(ordered, 50) * ms, 3),
+            "p95": round(percentile(ordered, 95) * ms, 3),
+            "p99": round(percentile(ordered, 99) * ms, 3),
+            "mean": round(sum(ordered) / len(ordered) * ms, 3) if ordered else 0.0,
+            "max": round(ordered[-1] * ms, 3) if ordered else 0.0,
+        },
+    }
+
+
+def build_report(samples: Samples, duration: float, meta: dict[str, Any]) -> dict[str, Any]:
+    endpoints = {
+        name: summarize(values, samples.errors.get(name, 0), duration)
+        for name, values in sorted(samples.latencies.items())
+    }
+    everything = [v for values in samples.latencies.values() for v in values]
+    return {
+        "meta": meta,
+        "endpoints": endpoints,
+        "total": summarize(everything, sum(samples.errors.values()), duration),
+    }
+
+
+def compare_reports(base: dict[str, Any], head: dict[str, Any], threshold: float) -> dict[str, Any]:
+    """Relative change per endpoint; regressions exceed `threshold` (0.10 = 10%)."""
+    endpoints: dict[str, Any] = {}
+    regressions: list[str] = []
+    base_eps = {**base["endpoints"], "total": base["total"]}
+    head_eps = {**head["endpoints"], "total": head["total"]}
+    for name in sorted(base_eps.keys() & head_eps.keys()):
+        b, h = base_eps[name], head_eps[name]
+        metrics = {
+            "rps": (b["rps"], h["rps"]),
+            **{f"{k}_ms": (b["latency_ms"][k], h["latency_ms"][k]) for k in ("p50", "p95", "p99")},
+            "errors": (b["errors"], h["errors"]),
+        }
+        diff = {}
+        for metric, (old, new) in metrics.items():
+            change = (new - old) / old if old else None
+            diff[metric] = {
+                "base": old,
+                "head": new,
+                "change": round(change, 4) if change is not None else None,
+            }
+        endpoints[name] = diff
+
+        if name == "total":
+            continue
+        for metric in ("p95_ms", "p99_ms"):
+            change = diff[metric]["change"]
+            if change is not None and change > threshold:
+                regressions.append(f"{name}.{metric} +{change:.1%}")
+        change = diff["rps"]["change"]
+        if change is not None and change < -threshold:
+            regressions.append(f"{name}.rps {change:.1%}")
+        if h["errors"] > b["errors"]:
+            regressions.append(f"{name}.errors {b['errors']} -> {h['errors']}")
+    return {"threshold": threshold, "endpoints": endpoints, "regressions": regressions}
+
+
+# ── Targets ────────────────────────────────────────────
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def _wait_ready(
+    client: httpx.AsyncClient, proc: subprocess.Popen, timeout: float = 30
+) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"uvicorn exited with status {proc.returncode}")
+        try:
+            if (await client.get("/health")).is_success:
+                return
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(0.1)
+    raise RuntimeError("uvicorn did not become ready in time")
+
+
+async def _member_ids(client: httpx.AsyncClient, limit: int = 500) -> list[str]:
+    resp = await client.get(f"{API}/team", params={"limit": limit, "history_limit": 0})
+    resp.raise_for_status()
+    ids = [m["id"] for m in resp.json()["items"]]
+    if not ids:
+        raise RuntimeError("Target has no team members to exercise")
+    return ids
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    mix = parse_mix(args.mix)
+    rng = random.Random(args.seed)
+    users = [f"bench-user-{i}" for i in range(args.users)]
+    meta: dict[str, Any] = {
+        "started_at": datetime.now(timezone.utc).isoformat(),
+        "target": args.url or args.server,
+        "members": None if args.url else args.members,
+        "moods_per_member": None if args.url else args.moods,
+        "concurrency": args.concurrency,
+        "duration_s": args.duration,
+        "warmup_s": args.warmup,
+        "mix": mix,
+        "team_query": args.team_query,
+        "python": platform.python_version(),
+        "git_sha": _git_sha(),
+    }
+    timeout = httpx.Timeout(args.timeout)
+
+    async def measure(client: httpx.AsyncClient) -> tuple[Samples, float]:
+        workload = Workload(client, await _member_ids(client), users, args.team_query, rng)
+        return await drive(workload, mix, args.concurrency, args.duration, args.warmup)
+
+    if args.url:
+        async with httpx.AsyncClient(base_url=args.url, timeout=timeout) as client:
+            samples, duration = await measure(client)
+        return build_report(samples, duration, meta)
+
+    with tempfile.TemporaryDirectory(prefix="loadtest-") as tmp:
+        database_url = f"sqlite:///{Path(tmp) / 'bench.db'}"
+        os.environ["DATABASE_URL"] = database_url
+        seed_dataset(database_url, args.members, args.moods, args.seed)
+
+        if args.server == "uvicorn":
+            port = _free_port()
+            server = [sys.executable, "-m", "uvicorn", "src.api.main:app"]
+            proc = subprocess.Popen(
+                [*server, "--port", str(port), "--log-level", "warning"],
+                env=os.environ.copy(),
+            )
+            base_url = f"http://127.0.0.1:{port}"
+            try:
+                async with httpx.AsyncClient(base_url=base_url, timeout=timeout) as client:
+                    await _wait_ready(client, proc)
+                    samples, duration = await measure(client)
+            finally:
+                proc.terminate()
+                proc.wait(timeout=10)
+        else:
+            from src.api.main import app
+
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://bench", timeout=timeout
+            ) as client:
+                samples, duration = await measure(client)
+    return build_report(samples, duration, meta)
+
+
+def _git_sha() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
+
+
+# ── CLI ────────────────────────────────────────────────
+
+
+def _write(data: dict[str, Any], output: str | None) -> None:
+    text = json.dumps(data, indent=2, ensure_ascii=False)
+    if output:
+        Path(output).write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.loadtest")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_p = commands.add_parser("run", help="Seed a dataset and run a mixed workload")
+    run_p.add_argument("--server", choices=["inprocess", "uvicorn"], default="inprocess")
+    run_p.add_argument("--url", help="Target an already running server instead (no seeding)")
+    run_p.add_argument("--members", type=int, default=200)
+    run_p.add_argument("--moods", type=int, default=20, help="Moods per member")
+    run_p.add_argument("--users", type=int, default=100, help="Distinct preferences user ids")
+    run_p.add_argument("--concurrency", type=int, default=16)
+    run_p.add_argument("--duration", type=float, default=10.0, help="Measured seconds")
+    run_p.add_argument("--warmup", type=float, default=2.0, help="Unmeasured seconds before that")
+    run_p.add_argument("--mix", default=DEFAULT_MIX, help="endpoint=weight,... (%(default)s)")
+    run_p.add_argument(
+        "--team-query", default="", help="Query string for team_list, e.g. '?limit=50'"
+    )
+    run_p.add_argument("--timeout", type=float, default=30.0, help="Per-request timeout in seconds")
+    run_p.add_argument("--seed", type=int, default=0)
+    run_p.add_argument("--output", help="Write the JSON report here instead of stdout")
+
+    cmp_p = commands.add_parser("compare", help="Diff two run reports")
+    cmp_p.add_argument("base")
+    cmp_p.add_argument("head")
+    cmp_p.add_argument("--threshold", type=float, default=0.10, help="Allowed relative change")
+    cmp_p.add_argument("--output")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        try:
+            report = asyncio.run(run(args))
+        except ValueError as e:
+            parser.error(str(e))
+        _write(report, args.output)
+        return 0
+
+    base = json.loads(Path(args.base).read_text(encoding="utf-8"))
+    head = json.loads(Path(args.head).read_text(encoding="utf-8"))
+    result = compare_reports(base, head, args.threshold)
+    _write(result, args.output)
+    return 1 if result["regressions"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
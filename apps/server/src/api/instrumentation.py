@@ -0,0 +1,102 @@
+"""Request metrics for GET /metrics, recorded by a pure ASGI middleware.
+
+Routes are labelled by their path template (e.g. /api/v1/team/{id}), so
+label cardinality stays bounded by the number of routes. Unmatched paths
+share one label.
+"""
+
+import logging
+from time import perf_counter
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.config.settings import settings
+from src.infrastructure.database.query_metrics import QueryStats, track_queries
+from src.infrastructure.metrics.registry import COUNT_BUCKETS, SIZE_BUCKETS, MetricsRegistry
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+logger = logging.getLogger(__name__)
+
+registry = MetricsRegistry()
+
+requests_total = registry.counter(
+    "http_requests_total", "Completed HTTP requests.", ["method", "route", "status"]
+)
+request_duration = registry.histogram(
+    "http_request_duration_seconds",
+    "Time from request start until the response finished sending.",
+    ["method", "route"],
+)
+requests_in_flight = registry.gauge(
+    "http_requests_in_flight", "HTTP requests currently being served."
+)
+response_size = registry.histogram(
+    "http_response_size_bytes", "Response body size.", ["method", "route"], SIZE_BUCKETS
+)
+request_queries = registry.histogram(
+    "http_request_db_queries",
+    "Database statements executed per request.",
+    ["method", "route"],
+    COUNT_BUCKETS,
+)
+request_query_time = registry.histogram(
+    "http_request_db_seconds",
+    "Time spent executing database statements per request.",
+    ["method", "route"],
+)
+repeated_queries = registry.counter(
+    "http_request_repeated_query_total",
+    "Requests that ran one statement shape at least QUERY_REPEAT_WARNING times.",
+    ["method", "route"],
+)
+
+
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        size = 0
+
+        async def send_and_measure(message: Message) -> None:
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        start = perf_counter()
+        requests_in_flight.inc()
+        try:
+            with track_queries() as queries:
+                await self.app(scope, receive, send_and_measure)
+        finally:
+            requests_in_flight.dec()
+            elapsed = perf_counter() - start
+            method = scope["method"]
+            # The router stores the matched route in the scope
+            route = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+            requests_total.inc(method, route, str(status))
+            request_duration.observe(elapsed, method, route)
+            response_size.observe(size, method, route)
+            request_queries.observe(queries.count, method, route)
+            request_query_time.observe(queries.seconds, method, route)
+            _check_repeats(queries, method, route)
+
+
+def _check_repeats(queries: QueryStats, method: str, route: str) -> None:
+    threshold = settings.query_repeat_warning
+    if not threshold or queries.count < threshold:
+        return
+    suspects = queries.repeated(threshold)
+    if suspects:
+        repeated_queries.inc(method, route)
+        shape, n = suspects[0]
+        logger.warning("Possible N+1 on %s %s: %dx %s", method, route, n, shape)
@@ -4,20 +4,16 @@ from collections.abc import AsyncGenerator
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from src.api.v1.routes import health, preferences, team
+from src.api.instrumentation import MetricsMiddleware
+from src.api.startup import run_startup
+from src.api.v1.routes import health, metrics, preferences, team
+from src.api.v1.routes.team import NEXT_CURSOR_HEADER
 from src.config.settings import settings
-from src.infrastructure.database.connection import SessionLocal, create_tables
-from src.seeds.team_seed import seed_team_data
 
 
 @asynccontextmanager
-async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
-    create_tables()
-    db = SessionLocal()
-    try:
-        seed_team_data(db)
-    finally:
-        db.close()
+async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
+    app.state.startup = run_startup()
     yield
 
 
@@ -29,8 +25,14 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
+if settings.metrics_enabled:
+    # Added last so it is outermost and times the whole middleware stack
+    app.add_middleware(MetricsMiddleware)
+    app.include_router(metrics.router)
+
 app.include_router(health.router)
 app.include_router(preferences.router)
 app.include_router(team.router)
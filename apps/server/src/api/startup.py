@@ -0,0 +1,101 @@
+"""Startup work for the app lifespan, timed per phase.
+
+A warm boot (stored schema version matches the models) runs one version
+query: no DDL, no seed check and no rollup backfill. Work that would
+otherwise land on the first request is done here instead: mapper
+configuration, a pooled connection, compiling the default team and
+preferences reads into SQLAlchemy's statement cache, and building the async
+engine when it is in use. Pydantic validators are already built at import;
+the OpenAPI schema only serves /docs and stays lazy.
+"""
+
+import logging
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from time import perf_counter
+
+from sqlalchemy.orm import configure_mappers
+
+from src.api.instrumentation import registry
+from src.application.services.team_service import TeamService
+from src.config.settings import settings
+from src.domain.services.team_validation import DEFAULT_MEMBER_FIELDS
+from src.infrastructure.database.connection import (
+    SessionLocal,
+    create_tables,
+    get_async_sessionmaker,
+)
+from src.infrastructure.database.maintenance import ensure_mood_rollups
+from src.infrastructure.database.repositories.preferences_repo import PreferencesRepository
+from src.infrastructure.database.repositories.team_repo import TeamRepository
+from src.seeds.team_seed import seed_team_data
+
+logger = logging.getLogger(__name__)
+
+startup_seconds = registry.gauge(
+    "app_startup_seconds",
+    "Time spent in each startup phase of this process.",
+    ["phase", "boot"],
+)
+
+
+@dataclass
+class StartupReport:
+    boot: str = "warm"  # "cold" when DDL ran
+    seconds: dict[str, float] = field(default_factory=dict)
+
+    def as_dict(self) -> dict[str, object]:
+        return {"boot": self.boot, "seconds": dict(self.seconds)}
+
+
+def run_startup() -> StartupReport:
+    report = StartupReport()
+    started = perf_counter()
+    with _phase(report, "schema"):
+        if create_tables():
+            report.boot = "cold"
+    if report.boot == "cold":
+        with _phase(report, "data"):
+            _prepare_data()
+    with _phase(report, "warm_up"):
+        warm_up()
+    report.seconds["total"] = perf_counter() - started
+
+    for phase, seconds in report.seconds.items():
+        startup_seconds.set(seconds, phase, report.boot)
+    logger.info("Startup (%s) finished in %.1f ms", report.boot, report.seconds["total"] * 1000)
+    return report
+
+
+def warm_up() -> None:
+    configure_mappers()
+    db = SessionLocal()
+    try:
+        TeamService(TeamRepository(db)).get_members_page(limit=1, fields=DEFAULT_MEMBER_FIELDS)
+        PreferencesRepository(db).get_by_user_id("")
+    finally:
+        db.close()
+    if settings.database_async:
+        get_async_sessionmaker()
+
+
+def _prepare_data() -> None:
+    # Only needed after DDL: a new or upgraded schema may lack the demo team
+    # or the rollups of a table that did not exist before
+    db = SessionLocal()
+    try:
+        if settings.seed_on_startup:
+            seed_team_data(db)
+        ensure_mood_rollups(db)
+    finally:
+        db.close()
+
+
+@contextmanager
+def _phase(report: StartupReport, name: str) -> Iterator[None]:
+    started = perf_counter()
+    try:
+        yield
+    finally:
+        report.seconds[name] = perf_counter() - started
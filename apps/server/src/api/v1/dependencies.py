@@ -1,12 +1,44 @@
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from src.application.services.preferences_service import PreferencesService
-from src.application.services.team_service import TeamService
-from src.infrastructure.database.connection import SessionLocal
+from src.application.services.preferences_service import (
+    AsyncPreferencesService,
+    PreferencesService,
+)
+from src.application.services.team_service import AsyncTeamService, TeamService
+from src.config.settings import settings
+from src.domain.models.mood_entry import MoodEntry
+from src.infrastructure.cache.ttl_cache import TTLCache
+from src.infrastructure.database.connection import SessionLocal, get_async_sessionmaker
 from src.infrastructure.database.repositories.preferences_repo import PreferencesRepository
 from src.infrastructure.database.repositories.team_repo import TeamRepository
+from src.infrastructure.database.session_runner import (
+    AsyncSessionRunner,
+    SessionFactoryRunner,
+    SessionRunner,
+    ThreadedSessionRunner,
+)
+from src.infrastructure.events.broker import EventBroker
+
+team_cache: TTLCache = TTLCache(
+    maxsize=settings.team_cache_max_entries,
+    ttl=settings.team_cache_ttl_seconds,
+    stale_ttl=settings.team_cache_stale_seconds,
+)
+
+preferences_cache: TTLCache = TTLCache(
+    maxsize=settings.preferences_cache_max_entries,
+    ttl=settings.preferences_cache_ttl_seconds,
+)
+
+# Mood submissions fan out to stream subscribers, coalesced per member
+team_events: EventBroker[MoodEntry] = EventBroker(
+    key=lambda entry: entry.member_id,
+    maxsize=settings.team_stream_queue_size,
+)
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -17,12 +49,49 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    async with get_async_sessionmaker()() as db:
+        yield db
+
+
+async def get_session_runner(
+    db: Session | AsyncSession = Depends(get_async_db if settings.database_async else get_db),
+) -> SessionRunner:
+    if isinstance(db, AsyncSession):
+        return AsyncSessionRunner(db)
+    return ThreadedSessionRunner(db)
+
+
+def get_background_runner() -> SessionFactoryRunner:
+    if settings.database_async:
+        return SessionFactoryRunner(get_async_sessionmaker())
+    return SessionFactoryRunner(SessionLocal)
+
+
+def get_team_cache() -> TTLCache | None:
+    return team_cache if settings.team_cache_enabled else None
+
+
+def get_preferences_cache() -> TTLCache | None:
+    return preferences_cache if settings.preferences_cache_enabled else None
+
+
+def get_team_events() -> EventBroker[MoodEntry]:
+    return team_events
+
+
 def get_preferences_repo(db: Session) -> PreferencesRepository:
     return PreferencesRepository(db)
 
 
 def get_preferences_service(repo: PreferencesRepository) -> PreferencesService:
-    return PreferencesService(repo)
+    return PreferencesService(repo, settings.preferences_persist_defaults)
+
+
+def get_async_preferences_service(
+    run: SessionRunner, cache: TTLCache | None = None
+) -> AsyncPreferencesService:
+    return AsyncPreferencesService(run, settings.preferences_persist_defaults, cache)
 
 
 def get_team_repo(db: Session) -> TeamRepository:
@@ -31,3 +100,13 @@ def get_team_repo(db: Session) -> TeamRepository:
 
 def get_team_service(repo: TeamRepository) -> TeamService:
     return TeamService(repo)
+
+
+def get_async_team_service(
+    run: SessionRunner,
+    cache: TTLCache | None = None,
+    refresh_run: SessionRunner | None = None,
+    events: EventBroker[MoodEntry] | None = None,
+    sessions: SessionFactoryRunner | None = None,
+) -> AsyncTeamService:
+    return AsyncTeamService(run, cache, refresh_run, events, sessions)
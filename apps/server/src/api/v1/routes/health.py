@@ -1,4 +1,9 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, Request
+
+from src.api.v1.dependencies import get_preferences_cache, get_team_cache, get_team_events
+from src.domain.models.mood_entry import MoodEntry
+from src.infrastructure.cache.ttl_cache import TTLCache
+from src.infrastructure.events.broker import EventBroker
 
 router = APIRouter()
 
@@ -6,3 +11,28 @@ router = APIRouter()
 @router.get("/health")
 def health_check() -> dict[str, str]:
     return {"status": "ok"}
+
+
+@router.get("/health/startup")
+def startup_stats(request: Request) -> dict[str, object] | None:
+    """How long this process took to start, and whether it ran DDL (cold)."""
+    report = getattr(request.app.state, "startup", None)
+    return report.as_dict() if report is not None else None
+
+
+@router.get("/health/cache")
+async def cache_stats(
+    team: TTLCache | None = Depends(get_team_cache),
+    preferences: TTLCache | None = Depends(get_preferences_cache),
+) -> dict[str, dict[str, float] | None]:
+    return {
+        "team": team.stats().as_dict() if team is not None else None,
+        "preferences": preferences.stats().as_dict() if preferences is not None else None,
+    }
+
+
+@router.get("/health/stream")
+async def stream_stats(
+    events: EventBroker[MoodEntry] = Depends(get_team_events),
+) -> dict[str, dict[str, int]]:
+    return {"team": events.stats().as_dict()}
@@ -1,51 +1,213 @@
-from fastapi import APIRouter, Depends, HTTPException
+from datetime import datetime
 
-from src.api.v1.dependencies import get_db, get_team_repo, get_team_service
+from fastapi import APIRouter, Depends, Header, HTTPException, Response
+from fastapi.responses import StreamingResponse
+
+from src.api.v1.dependencies import (
+    get_async_team_service,
+    get_background_runner,
+    get_session_runner,
+    get_team_cache,
+    get_team_events,
+)
 from src.api.v1.schemas.team_schemas import (
+    BatchMoodItem,
+    BatchMoodResult,
+    MoodDistributionResponse,
     MoodEntryResponse,
+    MoodHistoryPageResponse,
     SubmitMoodRequest,
+    TeamChangesResponse,
+    TeamMemberPageResponse,
     TeamMemberResponse,
+    mood_entry_payload,
+    mood_event_payload,
+    parse_member_fields,
+    team_changes_payload,
+    team_member_payload,
 )
-from src.application.services.team_service import TeamService
+from src.api.v1.serialization import NDJSON_MEDIA_TYPE, FastJSONResponse, ndjson_stream
+from src.api.v1.sse import SSE_HEADERS, SSE_MEDIA_TYPE, event_stream, sse_message
+from src.application.services.team_service import AsyncTeamService
+from src.config.settings import settings
+from src.domain.models.mood_entry import MoodEntry
+from src.infrastructure.events.broker import EventBroker
 
 router = APIRouter(prefix="/api/v1/team", tags=["team"])
 
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+NDJSON_HEADERS = {
+    "Vary": "Accept",
+    # Let reverse proxies pass each batch on as it is written
+    "X-Accel-Buffering": "no",
+}
+
+
+async def _get_service(
+    run=Depends(get_session_runner),
+    cache=Depends(get_team_cache),
+    refresh_run=Depends(get_background_runner),
+    events=Depends(get_team_events),
+) -> AsyncTeamService:
+    # Background runs and streamed listings use sessions of their own
+    return get_async_team_service(run, cache, refresh_run, events, sessions=refresh_run)
+
+
+@router.get(
+    "",
+    response_model=list[TeamMemberResponse] | TeamMemberPageResponse,
+    responses={200: {"content": {NDJSON_MEDIA_TYPE: {}}}},
+)
+async def list_team_members(
+    cursor: str | None = None,
+    limit: int | None = None,
+    history_limit: int | None = None,
+    fields: str | None = None,
+    include: str | None = None,
+    stream: bool = False,
+    accept: str | None = Header(default=None),
+    service: AsyncTeamService = Depends(_get_service),
+) -> Response:
+    """A plain list of every member, or with `limit` or `cursor` a page
+    envelope carrying `nextCursor` (also sent as `X-Next-Cursor`).
+
+    With `?stream=1` or `Accept: application/x-ndjson`, members are sent
+    one per line as they are read, without a next cursor."""
+    try:
+        selected = parse_member_fields(fields, include)
+        if history_limit is not None:
+            selected |= {"mood_history"}
+        if stream or NDJSON_MEDIA_TYPE in (accept or ""):
+            batches = await service.stream_members(
+                cursor, limit, history_limit, selected, settings.team_ndjson_batch_size
+            )
+            return StreamingResponse(
+                ndjson_stream(batches, lambda m: team_member_payload(m, selected)),
+                media_type=NDJSON_MEDIA_TYPE,
+                headers=NDJSON_HEADERS,
+            )
+        page = await service.get_members_page(cursor, limit, history_limit, selected)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    headers = {"Vary": "Accept"}
+    if page.next_cursor:
+        headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    items = [team_member_payload(m, selected) for m in page.items]
+    if limit is None and cursor is None:
+        return FastJSONResponse(items, headers=headers)
+    return FastJSONResponse({"items": items, "nextCursor": page.next_cursor}, headers=headers)
+
 
-def _get_service(db=Depends(get_db)) -> TeamService:
-    repo = get_team_repo(db)
-    return get_team_service(repo)
+@router.post("/moods:batch", response_model=list[BatchMoodResult])
+async def submit_moods_batch(
+    body: list[BatchMoodItem],
+    service: AsyncTeamService = Depends(_get_service),
+) -> list[BatchMoodResult]:
+    try:
+        results = await service.submit_moods(
+            [(item.member_id, item.emoji, item.label) for item in body]
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return [BatchMoodResult.model_validate(r) for r in results]
+
+
+# Before the /{id} routes, like analytics below. Holds no database session:
+# the stream only relays broker events.
+@router.get(
+    "/stream",
+    response_class=StreamingResponse,
+    responses={200: {"content": {SSE_MEDIA_TYPE: {}}, "description": "Mood event stream"}},
+)
+async def stream_team_moods(
+    events: EventBroker[MoodEntry] = Depends(get_team_events),
+) -> StreamingResponse:
+    return StreamingResponse(
+        event_stream(events, _mood_message, settings.team_stream_heartbeat_seconds),
+        media_type=SSE_MEDIA_TYPE,
+        headers=SSE_HEADERS,
+    )
 
 
-@router.get("", response_model=list[TeamMemberResponse])
-def list_team_members(
-    service: TeamService = Depends(_get_service),
-) -> list[TeamMemberResponse]:
-    members = service.get_all_members()
-    return [TeamMemberResponse.model_validate(m) for m in members]
+def _mood_message(entry: MoodEntry) -> bytes:
+    return sse_message("mood", mood_event_payload(entry), id=entry.id)
+
+
+# Registered before the /{id} routes so "analytics" is not taken for a member id.
+@router.get("/analytics/moods", response_model=MoodDistributionResponse)
+async def get_mood_distribution(
+    bucket: str = "day",
+    since: datetime | None = None,
+    until: datetime | None = None,
+    role: str | None = None,
+    status: str | None = None,
+    service: AsyncTeamService = Depends(_get_service),
+) -> MoodDistributionResponse:
+    try:
+        distribution = await service.get_mood_distribution(bucket, since, until, role, status)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return MoodDistributionResponse.model_validate(distribution)
+
+
+@router.get("/changes", response_model=TeamChangesResponse)
+async def get_team_changes(
+    since: str | None = None,
+    limit: int = 500,
+    service: AsyncTeamService = Depends(_get_service),
+) -> Response:
+    try:
+        changes = await service.get_changes(since, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return FastJSONResponse(team_changes_payload(changes))
 
 
 @router.get("/{id}", response_model=TeamMemberResponse)
-def get_team_member(
+async def get_team_member(
     id: str,
-    service: TeamService = Depends(_get_service),
-) -> TeamMemberResponse:
+    fields: str | None = None,
+    include: str | None = None,
+    service: AsyncTeamService = Depends(_get_service),
+) -> Response:
     try:
-        member = service.get_member(id)
+        selected = parse_member_fields(fields, include)
+        member = await service.get_member(id, selected)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     if member is None:
         raise HTTPException(status_code=404, detail="Team member not found")
-    return TeamMemberResponse.model_validate(member)
+    return FastJSONResponse(team_member_payload(member, selected))
+
+
+@router.get("/{id}/moods", response_model=MoodHistoryPageResponse)
+async def get_mood_history(
+    id: str,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    cursor: str | None = None,
+    limit: int = 50,
+    service: AsyncTeamService = Depends(_get_service),
+) -> Response:
+    try:
+        page = await service.get_mood_history(id, since, until, cursor, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if page is None:
+        raise HTTPException(status_code=404, detail="Team member not found")
+    return FastJSONResponse(
+        {"items": [mood_entry_payload(e) for e in page.items], "nextCursor": page.next_cursor}
+    )
 
 
 @router.post("/{id}/mood", response_model=MoodEntryResponse, status_code=201)
-def submit_mood(
+async def submit_mood(
     id: str,
     body: SubmitMoodRequest,
-    service: TeamService = Depends(_get_service),
+    service: AsyncTeamService = Depends(_get_service),
 ) -> MoodEntryResponse:
     try:
-        entry = service.submit_mood(id, body.emoji, body.label)
+        entry = await service.submit_mood(id, body.emoji, body.label)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     return MoodEntryResponse.model_validate(entry)
@@ -1,8 +1,18 @@
 from datetime import datetime
+from typing import Any, Literal
 
 from pydantic import BaseModel, ConfigDict
 from pydantic.alias_generators import to_camel
 
+from src.domain.models.mood_entry import MoodEntry
+from src.domain.models.team_changes import TeamChanges
+from src.domain.models.team_member import TeamMember
+from src.domain.services.team_validation import (
+    DEFAULT_MEMBER_FIELDS,
+    MEMBER_FIELDS,
+    validate_member_fields,
+)
+
 
 class MoodEntryResponse(BaseModel):
     model_config = ConfigDict(
@@ -17,6 +27,8 @@ class MoodEntryResponse(BaseModel):
 
 
 class TeamMemberResponse(BaseModel):
+    """Full member shape; `?fields=` and `?include=history` return a subset."""
+
     model_config = ConfigDict(
         from_attributes=True,
         alias_generator=to_camel,
@@ -32,6 +44,217 @@ class TeamMemberResponse(BaseModel):
     mood_history: list[MoodEntryResponse]
 
 
+class TeamMemberPageResponse(BaseModel):
+    """GET /api/v1/team when `limit` or `cursor` is passed."""
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        alias_generator=to_camel,
+        populate_by_name=True,
+    )
+
+    items: list[TeamMemberResponse]
+    next_cursor: str | None
+
+
+class MoodHistoryPageResponse(BaseModel):
+    model_config = ConfigDict(
+        from_attributes=True,
+        alias_generator=to_camel,
+        populate_by_name=True,
+    )
+
+    items: list[MoodEntryResponse]
+    next_cursor: str | None
+
+
+class MoodBucketResponse(BaseModel):
+    model_config = ConfigDict(
+        from_attributes=True,
+        alias_generator=to_camel,
+        populate_by_name=True,
+    )
+
+    start: datetime
+    total: int
+    counts: dict[str, int]
+
+
+class MoodDistributionResponse(BaseModel):
+    model_config = ConfigDict(
+        from_attributes=True,
+        alias_generator=to_camel,
+        populate_by_name=True,
+    )
+
+    bucket: Literal["hour", "day", "week"]
+    since: datetime
+    until: datetime
+    buckets: list[MoodBucketResponse]
+
+
+class MoodChangeResponse(BaseModel):
+    model_config = ConfigDict(
+        from_attributes=True,
+        alias_generator=to_camel,
+        populate_by_name=True,
+    )
+
+    id: str
+    member_id: str
+    emoji: str
+    label: str
+    timestamp: datetime
+
+
+class TeamMemberChangeResponse(BaseModel):
+    """A changed member; its new mood entries are listed under `moods`."""
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        alias_generator=to_camel,
+        populate_by_name=True,
+    )
+
+    id: str
+    name: str
+    role: str
+    avatar_url: str | None
+    status: str
+    current_mood: MoodEntryResponse | None
+
+
+class TeamChangesResponse(BaseModel):
+    model_config = ConfigDict(
+        from_attributes=True,
+        alias_generator=to_camel,
+        populate_by_name=True,
+    )
+
+    members: list[TeamMemberChangeResponse]
+    moods: list[MoodChangeResponse]
+    next_cursor: str
+    has_more: bool
+
+
+class MoodEventResponse(BaseModel):
+    """`data` of a `mood` event on GET /api/v1/team/stream."""
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        alias_generator=to_camel,
+        populate_by_name=True,
+    )
+
+    member_id: str
+    emoji: str
+    label: str
+    timestamp: datetime
+
+
 class SubmitMoodRequest(BaseModel):
     emoji: str
     label: str
+
+
+class BatchMoodItem(BaseModel):
+    model_config = ConfigDict(alias_generator=to_camel, populate_by_name=True)
+
+    member_id: str
+    emoji: str
+    label: str
+
+
+class BatchMoodResult(BaseModel):
+    model_config = ConfigDict(
+        from_attributes=True,
+        alias_generator=to_camel,
+        populate_by_name=True,
+    )
+
+    index: int
+    member_id: str
+    status: Literal["created", "rejected"]
+    entry: MoodEntryResponse | None
+    error: str | None
+
+
+# `?fields=` accepts the response aliases of TeamMember fields
+MEMBER_FIELD_ALIASES = {to_camel(name): name for name in MEMBER_FIELDS}
+MEMBER_INCLUDES = {"history": "mood_history"}
+
+
+def parse_member_fields(fields: str | None, include: str | None) -> frozenset[str]:
+    """TeamMember field names selected by `?fields=a,b` and `?include=history`.
+
+    Without `fields`, every field except the mood history is selected.
+    """
+    if fields:
+        aliases = [a.strip() for a in fields.split(",") if a.strip()]
+        unknown = [a for a in aliases if a not in MEMBER_FIELD_ALIASES]
+        if unknown:
+            raise ValueError(
+                f"Unknown field(s): {', '.join(unknown)}. "
+                f"Must be among: {', '.join(MEMBER_FIELD_ALIASES)}"
+            )
+        selected = {MEMBER_FIELD_ALIASES[a] for a in aliases}
+    else:
+        selected = set(DEFAULT_MEMBER_FIELDS)
+    for item in (include or "").split(","):
+        if not item.strip():
+            continue
+        if item.strip() not in MEMBER_INCLUDES:
+            raise ValueError(f"Include must be one of: {', '.join(MEMBER_INCLUDES)}")
+        selected.add(MEMBER_INCLUDES[item.strip()])
+    return validate_member_fields(selected)
+
+
+# Plain-dict builders mirroring the response models above, for routes that
+# serialize through FastJSONResponse. Keep them in sync with the models;
+# tests compare their output with the models' JSON.
+
+
+def mood_entry_payload(entry: MoodEntry) -> dict[str, Any]:
+    return {"emoji": entry.emoji, "label": entry.label, "timestamp": entry.timestamp}
+
+
+def team_member_payload(
+    member: TeamMember, fields: frozenset[str] | None = None
+) -> dict[str, Any]:
+    """Member JSON; with `fields` (TeamMember field names), only those keys."""
+    payload = {
+        **team_member_change_payload(member),
+        "moodHistory": [mood_entry_payload(e) for e in member.mood_history],
+    }
+    if fields is None:
+        return payload
+    return {alias: payload[alias] for alias, name in MEMBER_FIELD_ALIASES.items() if name in fields}
+
+
+def team_member_change_payload(member: TeamMember) -> dict[str, Any]:
+    current = member.current_mood
+    return {
+        "id": member.id,
+        "name": member.name,
+        "role": member.role,
+        "avatarUrl": member.avatar_url,
+        "status": member.status,
+        "currentMood": mood_entry_payload(current) if current is not None else None,
+    }
+
+
+def mood_event_payload(entry: MoodEntry) -> dict[str, Any]:
+    return {"memberId": entry.member_id, **mood_entry_payload(entry)}
+
+
+def mood_change_payload(entry: MoodEntry) -> dict[str, Any]:
+    return {"id": entry.id, **mood_event_payload(entry)}
+
+
+def team_changes_payload(changes: TeamChanges) -> dict[str, Any]:
+    return {
+        "members": [team_member_change_payload(m) for m in changes.members],
+        "moods": [mood_change_payload(e) for e in changes.moods],
+        "nextCursor": changes.next_cursor,
+        "hasMore": changes.has_more,
+    }
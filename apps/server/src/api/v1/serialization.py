@@ -0,0 +1,59 @@
+"""Fast JSON responses for large payloads.
+
+Returning Pydantic models from a route builds one model instance per
+object and then validates them again against `response_model`. For a
+team list that is one instance per mood entry, and it dominates the
+request's CPU time. Hot routes instead build plain camelCase dicts from
+trusted domain objects (see the `*_payload` helpers in the schema modules)
+and return a `FastJSONResponse`. That encodes with orjson when installed,
+and otherwise with pydantic-core's Rust serializer.
+
+Routes keep `response_model=` so the OpenAPI schema orval consumes does
+not change. FastAPI passes a returned `Response` through untouched.
+
+Listings too large to hold at once are streamed as NDJSON instead: one
+JSON document per line, written batch by batch as rows come off the cursor.
+"""
+
+from collections.abc import AsyncIterable, Callable, Iterable
+from typing import Any, TypeVar
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the extra
+    orjson = None
+
+T = TypeVar("T")
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+_ANY = TypeAdapter(Any)
+
+
+def dumps(content: Any) -> bytes:
+    if orjson is not None:
+        # OPT_UTC_Z matches Pydantic's "Z" suffix for UTC datetimes
+        return orjson.dumps(content, option=orjson.OPT_UTC_Z)
+    return _ANY.dump_json(content)
+
+
+class FastJSONResponse(Response):
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def ndjson_lines(items: Iterable[Any]) -> bytes:
+    return b"".join(dumps(item) + b"\n" for item in items)
+
+
+async def ndjson_stream(
+    batches: AsyncIterable[list[T]], to_payload: Callable[[T], Any]
+) -> AsyncIterable[bytes]:
+    """One body chunk per batch, each item on its own line."""
+    async for batch in batches:
+        yield ndjson_lines(to_payload(item) for item in batch)
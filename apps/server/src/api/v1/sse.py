@@ -0,0 +1,47 @@
+"""Server-Sent Events framing for streaming routes."""
+
+from collections.abc import AsyncIterator, Callable
+from typing import Any, TypeVar
+
+from src.api.v1.serialization import dumps
+from src.infrastructure.events.broker import EventBroker
+
+T = TypeVar("T")
+
+SSE_MEDIA_TYPE = "text/event-stream"
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    # Stop reverse proxies (nginx) from buffering the stream
+    "X-Accel-Buffering": "no",
+}
+HEARTBEAT = b": keepalive\n\n"
+
+
+def sse_message(event: str, data: Any, id: str | None = None) -> bytes:
+    head = f"id: {id}\nevent: {event}\n" if id is not None else f"event: {event}\n"
+    return head.encode() + b"data: " + dumps(data) + b"\n\n"
+
+
+async def event_stream(
+    broker: EventBroker[T],
+    to_message: Callable[[T], bytes],
+    heartbeat: float,
+    retry_ms: int = 3000,
+) -> AsyncIterator[bytes]:
+    """Relay broker events as SSE messages until the client disconnects.
+
+    Sends a comment line every `heartbeat` idle seconds to keep proxies and
+    mobile networks from closing the connection. If the subscriber's queue
+    overflowed, a `resync` event tells the client to refetch current state.
+    """
+    yield f"retry: {retry_ms}\n\n".encode()
+    with broker.subscribe() as subscription:
+        while True:
+            batch = await subscription.next_batch(timeout=heartbeat)
+            dropped = subscription.take_dropped()
+            if dropped:
+                yield sse_message("resync", {"dropped": dropped})
+            if not batch and not dropped:
+                yield HEARTBEAT
+            for event in batch:
+                yield to_message(event)
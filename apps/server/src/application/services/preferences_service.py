@@ -1,21 +1,35 @@
-from datetime import datetime, timezone
+from sqlalchemy.orm import Session
 
 from src.domain.models.user_preferences import UserPreferences, create_default_preferences
 from src.domain.services.validation import validate_user_id, validate_username
+from src.infrastructure.cache.ttl_cache import TTLCache
 from src.infrastructure.database.repositories.preferences_repo import PreferencesRepository
+from src.infrastructure.database.session_runner import SessionRunner
 
 
 class PreferencesService:
-    def __init__(self, repo: PreferencesRepository) -> None:
+    def __init__(self, repo: PreferencesRepository, persist_defaults: bool = False) -> None:
         self._repo = repo
+        self._persist_defaults = persist_defaults
+
+    def get_stored_preferences(self, user_id: str) -> UserPreferences | None:
+        validated_id = validate_user_id(user_id)
+        return self._repo.get_by_user_id(validated_id)
 
     def get_preferences(self, user_id: str) -> UserPreferences:
+        """Stored preferences, or defaults stamped with the current time.
+
+        Defaults are only written when `persist_defaults` is set; otherwise
+        the first update creates the row.
+        """
         validated_id = validate_user_id(user_id)
         existing = self._repo.get_by_user_id(validated_id)
         if existing is not None:
             return existing
         default = create_default_preferences(validated_id)
-        return self._repo.save(default)
+        if self._persist_defaults:
+            return self._repo.save(default)
+        return default
 
     def update_preferences(
         self,
@@ -23,16 +37,78 @@ class PreferencesService:
         username: str | None = None,
         dark_mode: bool | None = None,
     ) -> UserPreferences:
-        current = self.get_preferences(user_id)
-        updated = UserPreferences(
-            user_id=current.user_id,
-            username=validate_username(username) if username is not None else current.username,
-            dark_mode=dark_mode if dark_mode is not None else current.dark_mode,
-            created_at=current.created_at,
-            updated_at=datetime.now(timezone.utc),
-        )
-        return self._repo.save(updated)
+        validated_id = validate_user_id(user_id)
+        changes: dict[str, object] = {}
+        if username is not None:
+            changes["username"] = validate_username(username)
+        if dark_mode is not None:
+            changes["dark_mode"] = dark_mode
+        # Defaults only apply if this is the user's first write.
+        return self._repo.upsert(create_default_preferences(validated_id), changes)
 
     def delete_preferences(self, user_id: str) -> bool:
         validated_id = validate_user_id(user_id)
         return self._repo.delete(validated_id)
+
+
+class AsyncPreferencesService:
+    """Async facade over `PreferencesService`; see `AsyncTeamService`.
+
+    With a cache, stored preferences are read through it by user id. Unknown
+    users are cached as None and writes evict the entry, so repeat reads only
+    reach the database once after each change.
+    """
+
+    def __init__(
+        self,
+        run: SessionRunner,
+        persist_defaults: bool = False,
+        cache: TTLCache[str, UserPreferences | None] | None = None,
+    ) -> None:
+        self._run = run
+        self._persist_defaults = persist_defaults
+        self._cache = cache
+
+    async def get_preferences(self, user_id: str) -> UserPreferences:
+        if self._cache is None:
+            return await self._run(lambda db: self._service(db).get_preferences(user_id))
+        validated_id = validate_user_id(user_id)
+        stored = await self._cache.get_or_load(
+            validated_id,
+            lambda: self._run(lambda db: self._service(db).get_stored_preferences(validated_id)),
+        )
+        if stored is not None:
+            return stored
+        if not self._persist_defaults:
+            return create_default_preferences(validated_id)
+        prefs = await self._run(lambda db: self._service(db).get_preferences(validated_id))
+        self._evict(validated_id)
+        return prefs
+
+    async def update_preferences(
+        self,
+        user_id: str,
+        username: str | None = None,
+        dark_mode: bool | None = None,
+    ) -> UserPreferences:
+        prefs = await self._run(
+            lambda db: self._service(db).update_preferences(user_id, username, dark_mode)
+        )
+        self._evict(prefs.user_id)
+        return prefs
+
+    async def delete_preferences(self, user_id: str) -> bool:
+        deleted = await self._run(lambda db: self._service(db).delete_preferences(user_id))
+        self._evict(validate_user_id(user_id))
+        return deleted
+
+    def _evict(self, user_id: str) -> None:
+        # Not written through: concurrent writes can finish out of order, and
+        # caching the one that finished last may keep the older row. Evicting
+        # also bumps the generation, so a read that loaded the old row before
+        # this write cannot cache it.
+        if self._cache is not None:
+            self._cache.invalidate(lambda key: key == user_id)
+
+    def _service(self, db: Session) -> PreferencesService:
+        return PreferencesService(PreferencesRepository(db), self._persist_defaults)
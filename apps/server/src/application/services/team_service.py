@@ -1,11 +1,42 @@
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from contextlib import nullcontext
+from datetime import datetime, timezone
+from itertools import islice
+from typing import Any, TypeVar
+
+from sqlalchemy.orm import Session
+
+from src.domain.models.mood_bucket import MoodDistribution
 from src.domain.models.mood_entry import MoodEntry, create_mood_entry
+from src.domain.models.mood_submission import MoodSubmission
+from src.domain.models.page import Page
+from src.domain.models.team_changes import TeamChanges
 from src.domain.models.team_member import TeamMember
+from src.domain.services.pagination import (
+    decode_cursor,
+    encode_cursor,
+    validate_history_limit,
+    validate_page_limit,
+)
 from src.domain.services.team_validation import (
+    MEMBER_FIELDS,
+    validate_analytics_window,
+    validate_bucket,
+    validate_member_fields,
     validate_member_id,
+    validate_mood_batch_size,
     validate_mood_emoji,
     validate_mood_label,
+    validate_role,
+    validate_status,
+    validate_time_range,
 )
+from src.infrastructure.cache.ttl_cache import TTLCache
 from src.infrastructure.database.repositories.team_repo import TeamRepository
+from src.infrastructure.database.session_runner import SessionFactoryRunner, SessionRunner
+from src.infrastructure.events.broker import EventBroker
+
+T = TypeVar("T")
 
 
 class TeamService:
@@ -15,22 +46,370 @@ class TeamService:
     def get_all_members(self) -> list[TeamMember]:
         return self._repo.get_all()
 
-    def get_member(self, member_id: str) -> TeamMember | None:
+    def get_members_page(
+        self,
+        cursor: str | None = None,
+        limit: int | None = None,
+        history_limit: int | None = None,
+        fields: Iterable[str] | None = None,
+    ) -> Page[TeamMember]:
+        """A page of members, loading only what `fields` selects (default: all).
+
+        Without "mood_history" no mood entries are read; without
+        "current_mood" the current-mood columns are not selected.
+        """
+        after_id, limit, history_limit, current_mood = _page_args(
+            cursor, limit, history_limit, fields
+        )
+        # Fetch one extra row to learn whether another page exists.
+        members = self._repo.get_page(
+            after_id=after_id,
+            limit=limit + 1 if limit is not None else None,
+            history_limit=history_limit,
+            current_mood=current_mood,
+        )
+        if limit is None or len(members) <= limit:
+            return Page(items=members)
+        members = members[:limit]
+        return Page(items=members, next_cursor=encode_cursor(members[-1].id))
+
+    def iter_members(
+        self,
+        cursor: str | None = None,
+        limit: int | None = None,
+        history_limit: int | None = None,
+        fields: Iterable[str] | None = None,
+        yield_per: int | None = None,
+    ) -> Iterator[TeamMember]:
+        """`get_members_page` as an iterator over the database cursor.
+
+        Arguments are validated before this returns. `limit` caps the number
+        of members; there is no next cursor, since a streamed response has
+        sent its headers before the end is known.
+        """
+        after_id, limit, history_limit, current_mood = _page_args(
+            cursor, limit, history_limit, fields
+        )
+        return self._repo.iter_page(after_id, limit, history_limit, current_mood, yield_per)
+
+    def get_member(
+        self, member_id: str, fields: Iterable[str] | None = None
+    ) -> TeamMember | None:
         validated_id = validate_member_id(member_id)
-        return self._repo.get_by_id(validated_id)
+        fields = validate_member_fields(fields if fields is not None else MEMBER_FIELDS)
+        return self._repo.get_by_id(
+            validated_id,
+            history="mood_history" in fields,
+            current_mood="current_mood" in fields,
+        )
+
+    def get_mood_history(
+        self,
+        member_id: str,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        cursor: str | None = None,
+        limit: int = 50,
+    ) -> Page[MoodEntry] | None:
+        validated_id = validate_member_id(member_id)
+        since, until = validate_time_range(since, until)
+        limit = validate_page_limit(limit)
+        after = None
+        if cursor:
+            after_ts, after_id = decode_cursor(cursor, 2)
+            try:
+                after = (datetime.fromisoformat(after_ts), after_id)
+            except ValueError:
+                raise ValueError("Invalid cursor") from None
+
+        if not self._repo.exists(validated_id):
+            return None
+        entries = self._repo.get_mood_history(
+            validated_id, since=since, until=until, after=after, limit=limit + 1
+        )
+        if len(entries) <= limit:
+            return Page(items=entries)
+        entries = entries[:limit]
+        last = entries[-1]
+        next_cursor = encode_cursor(last.timestamp.isoformat(), last.id)
+        return Page(items=entries, next_cursor=next_cursor)
+
+    def get_mood_distribution(
+        self,
+        bucket: str = "day",
+        since: datetime | None = None,
+        until: datetime | None = None,
+        role: str | None = None,
+        status: str | None = None,
+    ) -> MoodDistribution:
+        """Team mood counts per label and bucket, for the whole team or a role/status."""
+        bucket = validate_bucket(bucket)
+        since, until = validate_analytics_window(
+            bucket, since, until, now=datetime.now(timezone.utc)
+        )
+        role = validate_role(role) if role is not None else None
+        status = validate_status(status) if status is not None else None
+        buckets = self._repo.count_moods_by_bucket(bucket, since, until, role, status)
+        return MoodDistribution(bucket=bucket, since=since, until=until, buckets=buckets)
+
+    def get_changes(self, cursor: str | None = None, limit: int = 500) -> TeamChanges:
+        """Members and moods changed since `cursor`; no cursor starts a full sync.
+
+        Members and moods advance independently, each by up to `limit` rows.
+        The returned cursor is always set, so clients store it and poll again.
+        """
+        limit = validate_page_limit(limit)
+        member_after, mood_after = (0, ""), (0, "")
+        if cursor:
+            member_seq, member_id, mood_seq, mood_id = decode_cursor(cursor, 4)
+            try:
+                member_after = (int(member_seq), member_id)
+                mood_after = (int(mood_seq), mood_id)
+            except ValueError:
+                raise ValueError("Invalid cursor") from None
+
+        # Fetch one extra row per stream to learn whether more changes wait.
+        members = self._repo.get_member_changes(member_after, limit + 1)
+        moods = self._repo.get_mood_changes(mood_after, limit + 1)
+        has_more = len(members) > limit or len(moods) > limit
+        members, moods = members[:limit], moods[:limit]
+        if members:
+            member_after = (members[-1][0], members[-1][1].id)
+        if moods:
+            mood_after = (moods[-1][0], moods[-1][1].id)
+        next_cursor = encode_cursor(
+            str(member_after[0]), member_after[1], str(mood_after[0]), mood_after[1]
+        )
+        return TeamChanges(
+            next_cursor=next_cursor,
+            members=[m for _, m in members],
+            moods=[e for _, e in moods],
+            has_more=has_more,
+        )
 
     def submit_mood(self, member_id: str, emoji: str, label: str) -> MoodEntry:
         validated_id = validate_member_id(member_id)
         validated_emoji = validate_mood_emoji(emoji)
         validated_label = validate_mood_label(label)
 
-        member = self._repo.get_by_id(validated_id)
-        if member is None:
-            raise ValueError(f"Team member '{validated_id}' not found")
-
         entry = create_mood_entry(
             member_id=validated_id,
             emoji=validated_emoji,
             label=validated_label,
         )
-        return self._repo.add_mood_entry(entry)
+        saved = self._repo.add_mood_entry(entry)
+        if saved is None:
+            raise ValueError(f"Team member '{validated_id}' not found")
+        return saved
+
+    def submit_moods(self, items: list[tuple[str, str, str]]) -> list[MoodSubmission]:
+        """Validate and record (member_id, emoji, label) items in one transaction.
+
+        Invalid items are rejected individually; the valid rest is written
+        with a single existence query, one bulk insert and one commit.
+        """
+        validate_mood_batch_size(len(items))
+        results: list[MoodSubmission] = []
+        pending: list[tuple[MoodSubmission, str, str]] = []
+        for index, (member_id, emoji, label) in enumerate(items):
+            result = MoodSubmission(index=index, member_id=member_id)
+            results.append(result)
+            try:
+                result.member_id = validate_member_id(member_id)
+                pending.append((result, validate_mood_emoji(emoji), validate_mood_label(label)))
+            except ValueError as e:
+                result.error = str(e)
+
+        existing = self._repo.existing_ids([r.member_id for r, _, _ in pending])
+        entries: list[MoodEntry] = []
+        for result, emoji, label in pending:
+            if result.member_id not in existing:
+                result.error = f"Team member '{result.member_id}' not found"
+                continue
+            result.entry = create_mood_entry(member_id=result.member_id, emoji=emoji, label=label)
+            entries.append(result.entry)
+        self._repo.add_mood_entries(entries)
+        return results
+
+
+class AsyncTeamService:
+    """Async facade over `TeamService`.
+
+    Each use case runs as one unit of work on the session runner. The
+    business rules stay in the sync service, so both modes share them.
+    With a cache, member reads are served read-through. A stale entry is
+    refreshed on `refresh_run`, which must not be tied to the request.
+    Committed mood entries are published to `events`, if given. Streamed
+    listings read on a session of their own from `sessions`.
+    """
+
+    def __init__(
+        self,
+        run: SessionRunner,
+        cache: TTLCache[tuple, Any] | None = None,
+        refresh_run: SessionRunner | None = None,
+        events: EventBroker[MoodEntry] | None = None,
+        sessions: SessionFactoryRunner | None = None,
+    ) -> None:
+        self._run = run
+        self._cache = cache
+        self._refresh_run = refresh_run
+        self._events = events
+        self._sessions = sessions
+
+    async def get_all_members(self) -> list[TeamMember]:
+        return await self._cached(("members",), lambda db: _team_service(db).get_all_members())
+
+    async def get_members_page(
+        self,
+        cursor: str | None = None,
+        limit: int | None = None,
+        history_limit: int | None = None,
+        fields: Iterable[str] | None = None,
+    ) -> Page[TeamMember]:
+        fields = validate_member_fields(fields) if fields is not None else None
+        return await self._cached(
+            ("members", cursor, limit, history_limit, fields),
+            lambda db: _team_service(db).get_members_page(cursor, limit, history_limit, fields),
+        )
+
+    async def stream_members(
+        self,
+        cursor: str | None = None,
+        limit: int | None = None,
+        history_limit: int | None = None,
+        fields: Iterable[str] | None = None,
+        batch_size: int = 200,
+    ) -> AsyncIterator[list[TeamMember]]:
+        """Members in batches of up to `batch_size`, read from one open cursor.
+
+        Not cached: the point is to never hold the whole listing. Invalid
+        arguments raise here, before the first batch. The batches are read
+        after the caller has returned, so they use a session opened from
+        `sessions` and closed when iteration ends. Without `sessions` they
+        use `run`, whose session must outlive the iteration.
+        """
+        _page_args(cursor, limit, history_limit, fields)
+        return self._stream_members(cursor, limit, history_limit, fields, batch_size)
+
+    async def _stream_members(
+        self,
+        cursor: str | None,
+        limit: int | None,
+        history_limit: int | None,
+        fields: Iterable[str] | None,
+        batch_size: int,
+    ) -> AsyncIterator[list[TeamMember]]:
+        session = self._sessions.session() if self._sessions else nullcontext(self._run)
+        async with session as run:
+            members = await run(
+                lambda db: _team_service(db).iter_members(
+                    cursor, limit, history_limit, fields, yield_per=batch_size
+                )
+            )
+            # One runner call per batch, so the cursor is only used where the
+            # session may be: its worker thread, or inside run_sync
+            while batch := await run(lambda db: list(islice(members, batch_size))):
+                yield batch
+
+    async def get_member(
+        self, member_id: str, fields: Iterable[str] | None = None
+    ) -> TeamMember | None:
+        validated_id = validate_member_id(member_id)
+        fields = validate_member_fields(fields) if fields is not None else None
+        return await self._cached(
+            ("member", validated_id, fields),
+            lambda db: _team_service(db).get_member(validated_id, fields),
+        )
+
+    async def get_mood_history(
+        self,
+        member_id: str,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        cursor: str | None = None,
+        limit: int = 50,
+    ) -> Page[MoodEntry] | None:
+        return await self._run(
+            lambda db: _team_service(db).get_mood_history(member_id, since, until, cursor, limit)
+        )
+
+    async def get_mood_distribution(
+        self,
+        bucket: str = "day",
+        since: datetime | None = None,
+        until: datetime | None = None,
+        role: str | None = None,
+        status: str | None = None,
+    ) -> MoodDistribution:
+        return await self._cached(
+            ("analytics", bucket, since, until, role, status),
+            lambda db: _team_service(db).get_mood_distribution(bucket, since, until, role, status),
+        )
+
+    async def get_changes(self, cursor: str | None = None, limit: int = 500) -> TeamChanges:
+        # Not cached: every cursor is read once by one client.
+        return await self._run(lambda db: _team_service(db).get_changes(cursor, limit))
+
+    async def submit_mood(self, member_id: str, emoji: str, label: str) -> MoodEntry:
+        entry = await self._run(
+            lambda db: _team_service(db).submit_mood(member_id, emoji, label)
+        )
+        self._invalidate_member(entry.member_id)
+        self._publish(entry)
+        return entry
+
+    async def submit_moods(self, items: list[tuple[str, str, str]]) -> list[MoodSubmission]:
+        results = await self._run(lambda db: _team_service(db).submit_moods(items))
+        for member_id in {r.member_id for r in results if r.entry is not None}:
+            self._invalidate_member(member_id)
+        for result in results:
+            if result.entry is not None:
+                self._publish(result.entry)
+        return results
+
+    async def _cached(self, key: tuple, fn: Callable[[Session], T]) -> T:
+        if self._cache is None:
+            return await self._run(fn)
+        refresh = self._refresh_run
+        return await self._cache.get_or_load(
+            key,
+            lambda: self._run(fn),
+            (lambda: refresh(fn)) if refresh is not None else None,
+        )
+
+    def _publish(self, entry: MoodEntry) -> None:
+        # Runs after the unit of work returned, so subscribers never see
+        # an entry that was rolled back.
+        if self._events is not None:
+            self._events.publish(entry)
+
+    def _invalidate_member(self, member_id: str) -> None:
+        if self._cache is not None:
+            # Every list page and analytics series may include the member.
+            self._cache.invalidate(
+                lambda key: key[0] in ("members", "analytics") or key[:2] == ("member", member_id)
+            )
+
+
+def _page_args(
+    cursor: str | None,
+    limit: int | None,
+    history_limit: int | None,
+    fields: Iterable[str] | None,
+) -> tuple[str | None, int | None, int | None, bool]:
+    """Validated (after_id, limit, history_limit, current_mood) for a member
+    listing. Without "mood_history" in `fields`, no mood entries are read."""
+    after_id = decode_cursor(cursor, 1)[0] if cursor else None
+    if limit is not None:
+        limit = validate_page_limit(limit)
+    if history_limit is not None:
+        history_limit = validate_history_limit(history_limit)
+    fields = validate_member_fields(fields if fields is not None else MEMBER_FIELDS)
+    if "mood_history" not in fields:
+        history_limit = 0
+    return after_id, limit, history_limit, "current_mood" in fields
+
+
+def _team_service(db: Session) -> TeamService:
+    return TeamService(TeamRepository(db))
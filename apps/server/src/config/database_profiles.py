@@ -0,0 +1,54 @@
+"""Engine presets selected by `DB_PROFILE`.
+
+- `dev` keeps local runs safe and debuggable: WAL so the API and a DB
+  browser can read while the server writes, and a busy timeout instead of
+  instant "database is locked" errors. Pool and memory settings stay at
+  the SQLAlchemy/SQLite defaults.
+- `production` tunes for many concurrent requests on one SQLite file:
+  WAL with `synchronous=NORMAL` (durable at checkpoints, one fsync per
+  checkpoint instead of per commit), a 64 MiB page cache, 256 MiB of
+  memory-mapped I/O, in-memory temp tables and a bounded, pre-pinged pool.
+
+Any field can be overridden with its own `DB_*` / `SQLITE_*` setting.
+Pragmas only apply to SQLite URLs.
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class DatabaseProfile:
+    journal_mode: str | None = None
+    synchronous: str | None = None
+    cache_size: int | None = None  # pages, or KiB when negative
+    mmap_size: int | None = None  # bytes
+    temp_store: str | None = None
+    busy_timeout_ms: int | None = None
+    foreign_keys: bool | None = None
+    pool_class: str | None = None  # queue | null | static | singleton
+    pool_size: int | None = None
+    max_overflow: int | None = None
+    pool_pre_ping: bool = False
+
+
+DATABASE_PROFILES: dict[str, DatabaseProfile] = {
+    "dev": DatabaseProfile(
+        journal_mode="WAL",
+        synchronous="NORMAL",
+        busy_timeout_ms=5_000,
+        foreign_keys=True,
+    ),
+    "production": DatabaseProfile(
+        journal_mode="WAL",
+        synchronous="NORMAL",
+        cache_size=-64_000,
+        mmap_size=268_435_456,
+        temp_store="MEMORY",
+        busy_timeout_ms=5_000,
+        foreign_keys=True,
+        pool_class="queue",
+        pool_size=10,
+        max_overflow=20,
+        pool_pre_ping=True,
+    ),
+}
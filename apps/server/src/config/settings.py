@@ -1,5 +1,9 @@
+from dataclasses import replace
+
 from pydantic_settings import BaseSettings
 
+from src.config.database_profiles import DATABASE_PROFILES, DatabaseProfile
+
 
 class Settings(BaseSettings):
     # App
@@ -9,6 +13,55 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str = "sqlite:///./demo.db"
+    # Serve requests through an AsyncSession on the event loop instead of
+    # sync sessions on the thread pool. Requires the `async` extra.
+    database_async: bool = False
+    # Seed the demo team when startup creates or upgrades the schema. Warm
+    # boots never seed; `python -m src.seeds` seeds explicitly.
+    seed_on_startup: bool = True
+
+    # Engine profile — preset from src/config/database_profiles.py, with
+    # optional per-field overrides (unset = use the preset's value)
+    db_profile: str = "dev"
+    sqlite_journal_mode: str | None = None
+    sqlite_synchronous: str | None = None
+    sqlite_cache_size: int | None = None
+    sqlite_mmap_size: int | None = None
+    sqlite_temp_store: str | None = None
+    sqlite_busy_timeout_ms: int | None = None
+    sqlite_foreign_keys: bool | None = None
+    db_pool_class: str | None = None
+    db_pool_size: int | None = None
+    db_max_overflow: int | None = None
+    db_pool_pre_ping: bool | None = None
+
+    # Team read cache — TTL + LRU, stale entries refreshed in the background
+    team_cache_enabled: bool = True
+    team_cache_max_entries: int = 1024
+    team_cache_ttl_seconds: float = 5.0
+    team_cache_stale_seconds: float = 30.0
+
+    # Live mood stream (GET /api/v1/team/stream)
+    team_stream_queue_size: int = 256
+    team_stream_heartbeat_seconds: float = 15.0
+
+    # NDJSON team listing (GET /api/v1/team?stream=1): members per write,
+    # also the rows fetched from the cursor at a time
+    team_ndjson_batch_size: int = 200
+
+    # Preferences — GET for an unknown user returns defaults without writing;
+    # true restores the old behaviour of storing them on first read
+    preferences_persist_defaults: bool = False
+    # Preferences read cache — TTL + LRU, evicted on write, unknown users cached too
+    preferences_cache_enabled: bool = True
+    preferences_cache_max_entries: int = 10_000
+    preferences_cache_ttl_seconds: float = 300.0
+
+    # Prometheus metrics at GET /metrics, with per-request DB query timing
+    metrics_enabled: bool = True
+    # Log a possible N+1 when one statement shape repeats this often in a
+    # request (0 = off)
+    query_repeat_warning: int = 10
 
     # CORS — comma-separated origins, or "*" for allow-all (dev only)
     cors_origins: str = "http://localhost:8081,http://localhost:19006"
@@ -21,5 +74,42 @@ class Settings(BaseSettings):
             return ["*"]
         return [o.strip() for o in self.cors_origins.split(",") if o.strip()]
 
+    @property
+    def database_profile(self) -> DatabaseProfile:
+        if self.db_profile not in DATABASE_PROFILES:
+            raise ValueError(
+                f"DB_PROFILE must be one of: {', '.join(sorted(DATABASE_PROFILES))}"
+            )
+        overrides = {
+            "journal_mode": self.sqlite_journal_mode,
+            "synchronous": self.sqlite_synchronous,
+            "cache_size": self.sqlite_cache_size,
+            "mmap_size": self.sqlite_mmap_size,
+            "temp_store": self.sqlite_temp_store,
+            "busy_timeout_ms": self.sqlite_busy_timeout_ms,
+            "foreign_keys": self.sqlite_foreign_keys,
+            "pool_class": self.db_pool_class,
+            "pool_size": self.db_pool_size,
+            "max_overflow": self.db_max_overflow,
+            "pool_pre_ping": self.db_pool_pre_ping,
+        }
+        return replace(
+            DATABASE_PROFILES[self.db_profile],
+            **{k: v for k, v in overrides.items() if v is not None},
+        )
+
+    @property
+    def async_database_url(self) -> str:
+        for sync_prefix, async_prefix in _ASYNC_DRIVERS.items():
+            if self.database_url.startswith(sync_prefix):
+                return async_prefix + self.database_url[len(sync_prefix) :]
+        return self.database_url
+
+
+_ASYNC_DRIVERS = {
+    "sqlite://": "sqlite+aiosqlite://",
+    "postgresql://": "postgresql+asyncpg://",
+}
+
 
 settings = Settings()
@@ -0,0 +1,24 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+
+
+@dataclass
+class MoodBucket:
+    """Mood counts per label for one time bucket starting at `start` (UTC)."""
+
+    start: datetime
+    counts: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+
+@dataclass
+class MoodDistribution:
+    """Bucketed mood counts for the window [since, until)."""
+
+    bucket: str
+    since: datetime
+    until: datetime
+    buckets: list[MoodBucket] = field(default_factory=list)
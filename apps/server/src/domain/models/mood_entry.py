@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MoodEntry:
     id: str
     member_id: str
@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+
+from src.domain.models.mood_entry import MoodEntry
+
+
+@dataclass
+class MoodSubmission:
+    """Outcome of one item in a batch mood submission."""
+
+    index: int
+    member_id: str
+    entry: MoodEntry | None = None
+    error: str | None = None
+
+    @property
+    def status(self) -> str:
+        return "created" if self.entry is not None else "rejected"
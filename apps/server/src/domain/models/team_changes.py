@@ -0,0 +1,17 @@
+from dataclasses import dataclass, field
+
+from src.domain.models.mood_entry import MoodEntry
+from src.domain.models.team_member import TeamMember
+
+
+@dataclass
+class TeamChanges:
+    """Members and mood entries written after a sync cursor, oldest change first.
+
+    Members carry no mood history; new entries arrive in `moods`.
+    """
+
+    next_cursor: str
+    members: list[TeamMember] = field(default_factory=list)
+    moods: list[MoodEntry] = field(default_factory=list)
+    has_more: bool = False
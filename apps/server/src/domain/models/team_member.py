@@ -5,7 +5,7 @@ from dataclasses import dataclass, field
 from src.domain.models.mood_entry import MoodEntry
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TeamMember:
     id: str
     name: str
@@ -13,10 +13,11 @@ class TeamMember:
     status: str
     avatar_url: str | None = None
     mood_entries: list[MoodEntry] = field(default_factory=list)
+    latest_mood: MoodEntry | None = None
 
     @property
     def current_mood(self) -> MoodEntry | None:
-        return self.mood_entries[0] if self.mood_entries else None
+        return self.mood_entries[0] if self.mood_entries else self.latest_mood
 
     @property
     def mood_history(self) -> list[MoodEntry]:
@@ -0,0 +1,39 @@
+import base64
+import binascii
+import json
+
+MAX_PAGE_LIMIT = 500
+
+
+def encode_cursor(*parts: str) -> str:
+    raw = json.dumps(list(parts), separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> list[str]:
+    padded = cursor.strip() + "=" * (-len(cursor.strip()) % 4)
+    try:
+        parts = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError("Invalid cursor") from None
+    if (
+        not isinstance(parts, list)
+        or len(parts) != size
+        or not all(isinstance(p, str) for p in parts)
+    ):
+        raise ValueError("Invalid cursor")
+    return parts
+
+
+def validate_page_limit(limit: int) -> int:
+    if limit < 1:
+        raise ValueError("Limit must be at least 1")
+    if limit > MAX_PAGE_LIMIT:
+        raise ValueError(f"Limit must be {MAX_PAGE_LIMIT} or fewer")
+    return limit
+
+
+def validate_history_limit(history_limit: int) -> int:
+    if history_limit < 0:
+        raise ValueError("History limit must not be negative")
+    return history_limit
@@ -1,6 +1,26 @@
 import re
+from collections.abc import Iterable
+from datetime import datetime, timedelta, timezone
 
 VALID_STATUSES = {"active", "away", "offline"}
+MAX_MOOD_BATCH_SIZE = 500
+
+# Analytics bucket widths and the window used when `since` is omitted
+ANALYTICS_BUCKETS = {
+    "hour": timedelta(hours=1),
+    "day": timedelta(days=1),
+    "week": timedelta(weeks=1),
+}
+DEFAULT_ANALYTICS_WINDOW = {
+    "hour": timedelta(hours=24),
+    "day": timedelta(days=7),
+    "week": timedelta(weeks=12),
+}
+MAX_ANALYTICS_BUCKETS = 1000
+
+# TeamMember fields a reader can select; history is loaded only on request
+MEMBER_FIELDS = ("id", "name", "role", "avatar_url", "status", "current_mood", "mood_history")
+DEFAULT_MEMBER_FIELDS = frozenset(MEMBER_FIELDS) - {"mood_history"}
 
 
 def validate_member_id(member_id: str) -> str:
@@ -34,8 +54,77 @@ def validate_mood_label(label: str) -> str:
     return stripped
 
 
+def validate_mood_batch_size(size: int) -> int:
+    if size > MAX_MOOD_BATCH_SIZE:
+        raise ValueError(f"Mood batch must contain {MAX_MOOD_BATCH_SIZE} items or fewer")
+    return size
+
+
 def validate_status(status: str) -> str:
     stripped = status.strip().lower()
     if stripped not in VALID_STATUSES:
         raise ValueError(f"Status must be one of: {', '.join(sorted(VALID_STATUSES))}")
     return stripped
+
+
+def validate_role(role: str) -> str:
+    stripped = role.strip()
+    if not stripped:
+        raise ValueError("Role must not be empty")
+    if len(stripped) > 100:
+        raise ValueError("Role must be 100 characters or fewer")
+    return stripped
+
+
+def validate_member_fields(fields: Iterable[str]) -> frozenset[str]:
+    selected = frozenset(fields)
+    unknown = selected.difference(MEMBER_FIELDS)
+    if unknown:
+        raise ValueError(
+            f"Unknown field(s): {', '.join(sorted(unknown))}. "
+            f"Must be among: {', '.join(MEMBER_FIELDS)}"
+        )
+    # The id is always returned so clients can key the results
+    return selected | {"id"}
+
+
+def validate_bucket(bucket: str) -> str:
+    stripped = bucket.strip().lower()
+    if stripped not in ANALYTICS_BUCKETS:
+        raise ValueError(f"Bucket must be one of: {', '.join(ANALYTICS_BUCKETS)}")
+    return stripped
+
+
+def validate_analytics_window(
+    bucket: str, since: datetime | None, until: datetime | None, now: datetime
+) -> tuple[datetime, datetime]:
+    """Resolve an open-ended window for `bucket` and bound its bucket count."""
+    since, until = validate_time_range(since, until)
+    if until is None:
+        until = now
+    if since is None:
+        since = until - DEFAULT_ANALYTICS_WINDOW[bucket]
+    if since > until:
+        raise ValueError("'since' must not be after 'until'")
+    if (until - since) / ANALYTICS_BUCKETS[bucket] > MAX_ANALYTICS_BUCKETS:
+        raise ValueError(
+            f"Time range spans more than {MAX_ANALYTICS_BUCKETS} {bucket} buckets"
+        )
+    return since, until
+
+
+def validate_time_range(
+    since: datetime | None, until: datetime | None
+) -> tuple[datetime | None, datetime | None]:
+    since, until = _to_utc(since), _to_utc(until)
+    if since is not None and until is not None and since > until:
+        raise ValueError("'since' must not be after 'until'")
+    return since, until
+
+
+def _to_utc(value: datetime | None) -> datetime | None:
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
@@ -0,0 +1,167 @@
+"""Bounded in-process cache with TTL, LRU eviction and stale-while-revalidate.
+
+Entries are fresh for `ttl` seconds, then stale for a further `stale_ttl`
+seconds. A stale read returns the old value immediately and triggers at most
+one background refresh per key. Every invalidation bumps a generation
+counter. A load or refresh that started before the invalidation is
+discarded instead of re-caching data that is already out of date.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import asdict, dataclass
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    refresh_errors: int = 0
+    size: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.stale_hits + self.misses
+        return (self.hits + self.stale_hits) / lookups if lookups else 0.0
+
+    def as_dict(self) -> dict[str, float]:
+        return {**asdict(self), "hit_ratio": round(self.hit_ratio, 4)}
+
+
+@dataclass
+class _Entry(Generic[V]):
+    value: V
+    fresh_until: float
+    stale_until: float
+
+
+class TTLCache(Generic[K, V]):
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        stale_ttl: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._stale_ttl = stale_ttl
+        self._clock = clock
+        self._entries: OrderedDict[K, _Entry[V]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._refreshing: set[K] = set()
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._stats = CacheStats()
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def lookup(self, key: K) -> tuple[bool, bool, V | None]:
+        """Return (found, stale, value), counting the lookup in the stats."""
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or now >= entry.stale_until:
+                if entry is not None:
+                    del self._entries[key]
+                self._stats.misses += 1
+                return False, False, None
+            self._entries.move_to_end(key)
+            if now < entry.fresh_until:
+                self._stats.hits += 1
+                return True, False, entry.value
+            self._stats.stale_hits += 1
+            return True, True, entry.value
+
+    def set(self, key: K, value: V, generation: int | None = None) -> bool:
+        """Store `value`; skipped if the cache was invalidated since `generation`."""
+        now = self._clock()
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return False
+            self._entries[key] = _Entry(
+                value=value,
+                fresh_until=now + self._ttl,
+                stale_until=now + self._ttl + self._stale_ttl,
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+            return True
+
+    def invalidate(self, predicate: Callable[[K], bool] | None = None) -> int:
+        """Drop every key matching `predicate` (all keys if omitted)."""
+        with self._lock:
+            self._generation += 1
+            self._stats.invalidations += 1
+            if predicate is None:
+                dropped = len(self._entries)
+                self._entries.clear()
+                return dropped
+            doomed = [k for k in self._entries if predicate(k)]
+            for k in doomed:
+                del self._entries[k]
+            return len(doomed)
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(**{**asdict(self._stats), "size": len(self._entries)})
+
+    async def get_or_load(
+        self,
+        key: K,
+        load: Callable[[], Awaitable[V]],
+        refresh: Callable[[], Awaitable[V]] | None = None,
+    ) -> V:
+        """Read-through lookup.
+
+        `load` fills a miss on the caller's path. `refresh` revalidates a
+        stale entry in the background and must not depend on request-scoped
+        resources. Without it, stale entries are served until they expire.
+        """
+        found, stale, value = self.lookup(key)
+        if found:
+            if stale and refresh is not None:
+                self._schedule_refresh(key, refresh)
+            return value  # type: ignore[return-value]
+        generation = self._generation
+        value = await load()
+        self.set(key, value, generation)
+        return value
+
+    def _schedule_refresh(self, key: K, refresh: Callable[[], Awaitable[V]]) -> None:
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+        task = asyncio.get_running_loop().create_task(self._refresh(key, refresh))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _refresh(self, key: K, refresh: Callable[[], Awaitable[V]]) -> None:
+        generation = self._generation
+        try:
+            self.set(key, await refresh(), generation)
+        except Exception:
+            with self._lock:
+                self._stats.refresh_errors += 1
+            logger.exception("Background cache refresh failed for %r", key)
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
@@ -1,25 +1,203 @@
-from sqlalchemy import create_engine
+import hashlib
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any
+
+from sqlalchemy import Dialect, Engine, create_engine, event, inspect, select
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
+from sqlalchemy.schema import CreateIndex, CreateTable
+from sqlalchemy.pool import (
+    AsyncAdaptedQueuePool,
+    NullPool,
+    QueuePool,
+    SingletonThreadPool,
+    StaticPool,
+)
 
+from src.config.database_profiles import DatabaseProfile
 from src.config.settings import settings
+from src.infrastructure.database.dialects import upsert
+from src.infrastructure.database.query_metrics import install_query_metrics
+
+_POOL_CLASSES = {
+    "queue": QueuePool,
+    "null": NullPool,
+    "static": StaticPool,
+    "singleton": SingletonThreadPool,
+}
+
+
+def engine_options(url: str, profile: DatabaseProfile, *, is_async: bool = False) -> dict[str, Any]:
+    """Keyword arguments for create_engine / create_async_engine."""
+    options: dict[str, Any] = {"pool_pre_ping": profile.pool_pre_ping}
+    if url.startswith("sqlite"):
+        options["connect_args"] = {"check_same_thread": False}
+    if profile.pool_class is not None:
+        if profile.pool_class not in _POOL_CLASSES:
+            raise ValueError(f"Pool class must be one of: {', '.join(sorted(_POOL_CLASSES))}")
+        pool_class = _POOL_CLASSES[profile.pool_class]
+        if is_async and pool_class is QueuePool:
+            pool_class = AsyncAdaptedQueuePool
+        options["poolclass"] = pool_class
+    if profile.pool_size is not None:
+        options["pool_size"] = profile.pool_size
+    if profile.max_overflow is not None:
+        options["max_overflow"] = profile.max_overflow
+    return options
+
+
+def sqlite_pragmas(profile: DatabaseProfile) -> list[str]:
+    pragmas = []
+    if profile.busy_timeout_ms is not None:
+        # First, so the journal_mode switch below already waits on locks
+        pragmas.append(f"PRAGMA busy_timeout={int(profile.busy_timeout_ms)}")
+    if profile.journal_mode is not None:
+        pragmas.append(f"PRAGMA journal_mode={_keyword(profile.journal_mode)}")
+    if profile.synchronous is not None:
+        pragmas.append(f"PRAGMA synchronous={_keyword(profile.synchronous)}")
+    if profile.cache_size is not None:
+        pragmas.append(f"PRAGMA cache_size={int(profile.cache_size)}")
+    if profile.mmap_size is not None:
+        pragmas.append(f"PRAGMA mmap_size={int(profile.mmap_size)}")
+    if profile.temp_store is not None:
+        pragmas.append(f"PRAGMA temp_store={_keyword(profile.temp_store)}")
+    if profile.foreign_keys is not None:
+        pragmas.append(f"PRAGMA foreign_keys={'ON' if profile.foreign_keys else 'OFF'}")
+    return pragmas
+
+
+def install_sqlite_pragmas(engine: Engine, profile: DatabaseProfile) -> None:
+    """Apply the profile's pragmas to every new DBAPI connection."""
+    if engine.dialect.name != "sqlite":
+        return
+    pragmas = sqlite_pragmas(profile)
+    if not pragmas:
+        return
+
+    @event.listens_for(engine, "connect")
+    def _apply_pragmas(dbapi_connection, _connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+
+def _keyword(value: str) -> str:
+    if not value.isalpha():
+        raise ValueError(f"Invalid SQLite pragma value: {value!r}")
+    return value.upper()
 
 
 engine = create_engine(
     settings.database_url,
-    connect_args={"check_same_thread": False},
+    **engine_options(settings.database_url, settings.database_profile),
 )
+install_sqlite_pragmas(engine, settings.database_profile)
+if settings.metrics_enabled:
+    install_query_metrics(engine)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+@lru_cache(maxsize=1)
+def get_async_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    # Built on first use so the aiosqlite driver is only imported in async mode
+    url = settings.async_database_url
+    async_engine = create_async_engine(
+        url, **engine_options(url, settings.database_profile, is_async=True)
+    )
+    install_sqlite_pragmas(async_engine.sync_engine, settings.database_profile)
+    if settings.metrics_enabled:
+        install_query_metrics(async_engine.sync_engine)
+    return async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+
 class Base(DeclarativeBase):
     pass
 
 
-def create_tables() -> None:
+def create_tables(bind: Engine = engine) -> bool:
+    """Create missing tables, columns and indexes unless the stored schema
+    is current.
+
+    A database whose `schema_version` row matches `schema_version()` costs
+    one query and no DDL. On an older file, columns added since are ALTERed
+    in and backfilled (see `migrations`); a change that cannot be applied in
+    place raises `SchemaMigrationError` and leaves the stored version as it
+    was. Returns True if DDL ran.
+    """
     # Import models so ORM registers them with Base before creating tables
+    import src.infrastructure.database.models.change_sequence_model  # noqa: F401
     import src.infrastructure.database.models.mood_entry_model  # noqa: F401
+    import src.infrastructure.database.models.mood_rollup_model  # noqa: F401
     import src.infrastructure.database.models.preferences_model  # noqa: F401
+    import src.infrastructure.database.models.schema_version_model  # noqa: F401
     import src.infrastructure.database.models.team_member_model  # noqa: F401
 
-    Base.metadata.create_all(bind=engine)
+    version = schema_version(bind.dialect)
+    with bind.connect() as conn:
+        if _stored_schema_version(conn) == version:
+            return False
+
+    from src.infrastructure.database.migrations import (
+        SchemaMigrationError,
+        add_missing_columns,
+        run_backfills,
+    )
+
+    Base.metadata.create_all(bind=bind)
+    # create_all skips existing tables entirely, so add the columns and
+    # indexes introduced after a database file was first created.
+    with bind.begin() as conn:
+        added = add_missing_columns(conn)
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            try:
+                index.create(bind=bind, checkfirst=True)
+            except DBAPIError as e:
+                raise SchemaMigrationError(
+                    f"Cannot create index {index.name} on {table.name}: {e.orig}"
+                ) from e
+    run_backfills(bind, added)
+
+    table = Base.metadata.tables["schema_version"]
+    stmt = upsert(table, bind.dialect.name).values(
+        id=1, version=version, applied_at=datetime.now(timezone.utc)
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c.id],
+        set_={"version": stmt.excluded.version, "applied_at": stmt.excluded.applied_at},
+    )
+    with bind.begin() as conn:
+        conn.execute(stmt)
+    return True
+
+
+def schema_version(dialect: Dialect) -> str:
+    """Hash of the DDL for every registered table and index on `dialect`.
+
+    Changes whenever a model gains a table, column, index or constraint, so
+    there is no version number to bump by hand.
+    """
+    return _schema_version(dialect, frozenset(Base.metadata.tables))
+
+
+@lru_cache(maxsize=8)
+def _schema_version(dialect: Dialect, _tables: frozenset[str]) -> str:
+    digest = hashlib.sha256()
+    for table in Base.metadata.sorted_tables:
+        digest.update(str(CreateTable(table).compile(dialect=dialect)).encode())
+        for index in sorted(table.indexes, key=lambda i: i.name or ""):
+            digest.update(str(CreateIndex(index).compile(dialect=dialect)).encode())
+    return digest.hexdigest()
+
+
+def _stored_schema_version(conn) -> str | None:
+    if not inspect(conn).has_table("schema_version"):
+        return None
+    table = Base.metadata.tables["schema_version"]
+    return conn.execute(select(table.c.version).where(table.c.id == 1)).scalar()
@@ -0,0 +1,90 @@
+"""Database maintenance commands.
+
+Usage:
+    python -m src.infrastructure.database.maintenance backfill-current-moods
+    python -m src.infrastructure.database.maintenance rebuild-mood-rollups
+    python -m src.infrastructure.database.maintenance check-mood-rollups
+"""
+
+import argparse
+import sys
+
+from sqlalchemy.orm import Session
+
+from src.infrastructure.database.connection import SessionLocal, create_tables
+from src.infrastructure.database.repositories.team_repo import TeamRepository
+
+
+def backfill_current_moods() -> int:
+    create_tables()
+    db = SessionLocal()
+    try:
+        return TeamRepository(db).backfill_current_moods()
+    finally:
+        db.close()
+
+
+def rebuild_mood_rollups() -> int:
+    create_tables()
+    db = SessionLocal()
+    try:
+        return TeamRepository(db).rebuild_mood_rollups()
+    finally:
+        db.close()
+
+
+def check_mood_rollups() -> int:
+    create_tables()
+    db = SessionLocal()
+    try:
+        return TeamRepository(db).check_mood_rollups()
+    finally:
+        db.close()
+
+
+def ensure_mood_rollups(db: Session) -> bool:
+    """Build rollups on a database that has mood history but no rollups yet.
+
+    Covers files created before `mood_daily_rollups` existed. Returns True
+    if a rebuild ran.
+    """
+    repo = TeamRepository(db)
+    if not repo.mood_rollups_missing():
+        return False
+    repo.rebuild_mood_rollups()
+    return True
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m src.infrastructure.database.maintenance")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser(
+        "backfill-current-moods",
+        help="Recompute team_members.current_mood_* from mood_entries",
+    )
+    commands.add_parser(
+        "rebuild-mood-rollups",
+        help="Recount mood_daily_rollups from mood_entries",
+    )
+    commands.add_parser(
+        "check-mood-rollups",
+        help="Compare mood_daily_rollups with mood_entries; exit 1 on mismatch",
+    )
+    args = parser.parse_args(argv)
+
+    if args.command == "backfill-current-moods":
+        count = backfill_current_moods()
+        print(f"Backfilled current mood for {count} team members")
+    elif args.command == "rebuild-mood-rollups":
+        count = rebuild_mood_rollups()
+        print(f"Rebuilt {count} mood rollup rows")
+    elif args.command == "check-mood-rollups":
+        mismatches = check_mood_rollups()
+        if mismatches:
+            print(f"{mismatches} mood rollup rows disagree with mood_entries")
+            sys.exit(1)
+        print("Mood rollups are consistent")
+
+
+if __name__ == "__main__":
+    main()
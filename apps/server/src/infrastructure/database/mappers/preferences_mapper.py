@@ -1,6 +1,18 @@
+from collections.abc import Sequence
+from typing import Any
+
 from src.domain.models.user_preferences import UserPreferences
 from src.infrastructure.database.models.preferences_model import PreferencesModel
 
+# Column order of `from_row`, matching the dataclass fields
+PREFERENCES_COLUMNS = (
+    PreferencesModel.user_id,
+    PreferencesModel.username,
+    PreferencesModel.dark_mode,
+    PreferencesModel.created_at,
+    PreferencesModel.updated_at,
+)
+
 
 def to_domain(model: PreferencesModel) -> UserPreferences:
     return UserPreferences(
@@ -12,6 +24,11 @@ def to_domain(model: PreferencesModel) -> UserPreferences:
     )
 
 
+def from_row(row: Sequence[Any]) -> UserPreferences:
+    """Map a row selecting PREFERENCES_COLUMNS."""
+    return UserPreferences(*row)
+
+
 def to_model(entity: UserPreferences) -> PreferencesModel:
     return PreferencesModel(
         user_id=entity.user_id,
@@ -20,3 +37,13 @@ def to_model(entity: UserPreferences) -> PreferencesModel:
         created_at=entity.created_at,
         updated_at=entity.updated_at,
     )
+
+
+def to_row(entity: UserPreferences) -> dict[str, object]:
+    return {
+        "user_id": entity.user_id,
+        "username": entity.username,
+        "dark_mode": entity.dark_mode,
+        "created_at": entity.created_at,
+        "updated_at": entity.updated_at,
+    }
@@ -1,17 +1,41 @@
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any
+
 from src.domain.models.mood_entry import MoodEntry
 from src.domain.models.team_member import TeamMember
 from src.infrastructure.database.models.mood_entry_model import MoodEntryModel
 from src.infrastructure.database.models.team_member_model import TeamMemberModel
 
-
-def mood_entry_to_domain(model: MoodEntryModel) -> MoodEntry:
-    return MoodEntry(
-        id=model.id,
-        member_id=model.member_id,
-        emoji=model.emoji,
-        label=model.label,
-        timestamp=model.timestamp,
-    )
+# Read paths select these columns with Core and map the rows positionally,
+# skipping ORM instances and the identity map. The order matches the
+# dataclass fields.
+MOOD_ENTRY_COLUMNS = (
+    MoodEntryModel.id,
+    MoodEntryModel.member_id,
+    MoodEntryModel.emoji,
+    MoodEntryModel.label,
+    MoodEntryModel.timestamp,
+)
+MEMBER_COLUMNS = (
+    TeamMemberModel.id,
+    TeamMemberModel.name,
+    TeamMemberModel.role,
+    TeamMemberModel.status,
+    TeamMemberModel.avatar_url,
+)
+# MOOD_ENTRY_COLUMNS without member_id, which a join to members repeats
+JOINED_MOOD_ENTRY_COLUMNS = (
+    MoodEntryModel.id,
+    MoodEntryModel.emoji,
+    MoodEntryModel.label,
+    MoodEntryModel.timestamp,
+)
+CURRENT_MOOD_COLUMNS = (
+    TeamMemberModel.current_mood_id,
+    TeamMemberModel.current_mood_emoji,
+    TeamMemberModel.current_mood_label,
+    TeamMemberModel.current_mood_at,
+)
 
 
 def mood_entry_to_model(entry: MoodEntry) -> MoodEntryModel:
@@ -24,23 +48,96 @@ def mood_entry_to_model(entry: MoodEntry) -> MoodEntryModel:
     )
 
 
-def team_member_to_domain(model: TeamMemberModel) -> TeamMember:
+def mood_entry_to_row(entry: MoodEntry) -> dict[str, Any]:
+    """Column values for a Core insert into mood_entries."""
+    return {
+        "id": entry.id,
+        "member_id": entry.member_id,
+        "emoji": entry.emoji,
+        "label": entry.label,
+        "timestamp": entry.timestamp,
+    }
+
+
+def mood_entry_from_row(row: Sequence[Any]) -> MoodEntry:
+    """Map a row selecting MOOD_ENTRY_COLUMNS."""
+    return MoodEntry(*row)
+
+
+def team_member_from_row(
+    row: Sequence[Any], mood_entries: list[MoodEntry] | None = None
+) -> TeamMember:
+    """Map a row selecting MEMBER_COLUMNS, optionally followed by CURRENT_MOOD_COLUMNS."""
+    member_id, name, role, status, avatar_url = row[:5]
+    latest_mood = None
+    if len(row) > 5 and row[5] is not None:
+        mood_id, emoji, label, timestamp = row[5:9]
+        latest_mood = MoodEntry(mood_id, member_id, emoji, label, timestamp)
     return TeamMember(
-        id=model.id,
-        name=model.name,
-        role=model.role,
-        avatar_url=model.avatar_url,
-        status=model.status,
-        mood_entries=[mood_entry_to_domain(e) for e in model.mood_entries],
+        member_id, name, role, status, avatar_url, mood_entries or [], latest_mood
     )
 
 
+def team_members_from_rows(rows: Iterable[Sequence[Any]], width: int) -> Iterator[TeamMember]:
+    """Group member rows joined to their history into members, in one pass.
+
+    Each row is `width` member columns (see `team_member_from_row`) followed
+    by JOINED_MOOD_ENTRY_COLUMNS, which are NULL for a member without
+    entries. A member's rows must be adjacent, newest entry first. Entries
+    share one string object per distinct member id, emoji and label.
+    Members are yielded as soon as their last row has been read.
+    """
+    shared: dict[str, str] = {}
+    member_row: Sequence[Any] = ()
+    entries: list[MoodEntry] = []
+    for row in rows:
+        if not member_row or row[0] != member_row[0]:
+            if member_row:
+                yield team_member_from_row(member_row, entries)
+            member_row, entries = row[:width], []
+        entry_id = row[width]
+        if entry_id is not None:
+            emoji, label = row[width + 1], row[width + 2]
+            entries.append(
+                MoodEntry(
+                    entry_id,
+                    member_row[0],
+                    shared.setdefault(emoji, emoji),
+                    shared.setdefault(label, label),
+                    row[width + 3],
+                )
+            )
+    if member_row:
+        yield team_member_from_row(member_row, entries)
+
+
 def team_member_to_model(entity: TeamMember) -> TeamMemberModel:
+    current = entity.current_mood
     return TeamMemberModel(
         id=entity.id,
         name=entity.name,
         role=entity.role,
         avatar_url=entity.avatar_url,
         status=entity.status,
+        current_mood_id=current.id if current else None,
+        current_mood_emoji=current.emoji if current else None,
+        current_mood_label=current.label if current else None,
+        current_mood_at=current.timestamp if current else None,
         mood_entries=[mood_entry_to_model(e) for e in entity.mood_entries],
     )
+
+
+def team_member_to_row(entity: TeamMember) -> dict[str, Any]:
+    """Column values for a Core insert into team_members (history excluded)."""
+    current = entity.current_mood
+    return {
+        "id": entity.id,
+        "name": entity.name,
+        "role": entity.role,
+        "avatar_url": entity.avatar_url,
+        "status": entity.status,
+        "current_mood_id": current.id if current else None,
+        "current_mood_emoji": current.emoji if current else None,
+        "current_mood_label": current.label if current else None,
+        "current_mood_at": current.timestamp if current else None,
+    }
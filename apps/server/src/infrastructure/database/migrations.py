@@ -0,0 +1,95 @@
+"""In-place upgrades for database files created by an older schema.
+
+`create_all` creates missing tables but never alters existing ones. Before
+indexes are created, `add_missing_columns` adds the columns models gained
+since the file was created. `run_backfills` then fills them in from the
+data already there, so no read path sees a column that is missing or empty.
+
+Only additive changes are applied. A missing column that cannot be added to
+existing rows raises `SchemaMigrationError` before any table is altered;
+changed types and dropped columns are not detected.
+"""
+
+from collections.abc import Callable
+
+from sqlalchemy import Column, Connection, Dialect, Engine, inspect, literal, text
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.schema import ScalarElementColumnDefault
+
+from src.infrastructure.database.connection import Base
+from src.infrastructure.database.repositories.team_repo import TeamRepository
+
+
+class SchemaMigrationError(RuntimeError):
+    pass
+
+
+def add_missing_columns(conn: Connection) -> list[str]:
+    """ALTER existing tables to add missing model columns.
+
+    Returns the added columns as "table.column".
+    """
+    inspector = inspect(conn)
+    missing = []
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {c["name"] for c in inspector.get_columns(table.name)}
+        missing += [column for column in table.columns if column.name not in existing]
+
+    blocked = [f"{c.table.name}.{c.name}" for c in missing if not _can_add(c)]
+    if blocked:
+        raise SchemaMigrationError(
+            f"Cannot add column(s) {', '.join(blocked)} to existing rows: they are "
+            "keys or NOT NULL without a default. Migrate or recreate the database."
+        )
+    for column in missing:
+        conn.execute(text(_add_column_ddl(column, conn.dialect)))
+    return [f"{c.table.name}.{c.name}" for c in missing]
+
+
+def run_backfills(bind: Engine, added: list[str]) -> None:
+    """Fill columns just added to existing rows, in registration order."""
+    steps = [backfill for columns, backfill in BACKFILLS if set(columns) & set(added)]
+    if not steps:
+        return
+    with Session(bind) as db:
+        for backfill in steps:
+            backfill(db)
+
+
+def _can_add(column: Column) -> bool:
+    if column.primary_key or column.unique:
+        return False
+    return column.nullable or isinstance(column.default, ScalarElementColumnDefault)
+
+
+def _add_column_ddl(column: Column, dialect: Dialect) -> str:
+    preparer = dialect.identifier_preparer
+    ddl = (
+        f"ALTER TABLE {preparer.format_table(column.table)} "
+        f"ADD COLUMN {preparer.format_column(column)} {column.type.compile(dialect=dialect)}"
+    )
+    default = column.default
+    if isinstance(default, ScalarElementColumnDefault):
+        # Existing rows take the default, which NOT NULL requires
+        value = literal(default.arg, column.type)
+        ddl += f" DEFAULT {value.compile(dialect=dialect, compile_kwargs={'literal_binds': True})}"
+    if not column.nullable:
+        ddl += " NOT NULL"
+    return ddl
+
+
+def _backfill_change_seq(db: Session) -> None:
+    TeamRepository(db).backfill_change_seq()
+
+
+def _backfill_current_moods(db: Session) -> None:
+    TeamRepository(db).backfill_current_moods()
+
+
+# (columns whose addition triggers it, backfill), run in this order
+BACKFILLS: list[tuple[tuple[str, ...], Callable[[Session], None]]] = [
+    (("team_members.change_seq", "mood_entries.change_seq"), _backfill_change_seq),
+    (("team_members.current_mood_id",), _backfill_current_moods),
+]
@@ -0,0 +1,17 @@
+from sqlalchemy import Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.infrastructure.database.connection import Base
+
+
+class ChangeSequenceModel(Base):
+    """Single-row counter stamped onto team rows by each write transaction.
+
+    Incrementing it takes a row lock held until commit, so sequence order
+    matches commit order and delta sync never skips a change.
+    """
+
+    __tablename__ = "change_sequence"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    value: Mapped[int] = mapped_column(Integer, default=0)
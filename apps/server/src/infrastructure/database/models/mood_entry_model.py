@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, String
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.infrastructure.database.connection import Base
@@ -10,13 +10,35 @@ class MoodEntryModel(Base):
     __tablename__ = "mood_entries"
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True)
-    member_id: Mapped[str] = mapped_column(
-        String(36), ForeignKey("team_members.id"), index=True
-    )
+    member_id: Mapped[str] = mapped_column(String(36), ForeignKey("team_members.id"))
     emoji: Mapped[str] = mapped_column(String(10))
     label: Mapped[str] = mapped_column(String(50))
     timestamp: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    # Value of change_sequence in the transaction that wrote the row
+    change_seq: Mapped[int] = mapped_column(Integer, default=0)
 
     member: Mapped["TeamMemberModel"] = relationship(
         "TeamMemberModel", back_populates="mood_entries"
     )
+
+
+# Serves per-member history newest-first, keyset paging on (timestamp, id),
+# and plain member_id lookups through its leading column.
+Index(
+    "ix_mood_entries_member_timestamp",
+    MoodEntryModel.member_id,
+    MoodEntryModel.timestamp.desc(),
+    MoodEntryModel.id,
+)
+
+# Covers team-wide analytics: a timestamp range scan that reads label and
+# member_id (for role/status filters) without touching the table.
+Index(
+    "ix_mood_entries_timestamp_label",
+    MoodEntryModel.timestamp,
+    MoodEntryModel.label,
+    MoodEntryModel.member_id,
+)
+
+# Delta sync: keyset scan of rows written after a (change_seq, id) cursor.
+Index("ix_mood_entries_change_seq", MoodEntryModel.change_seq, MoodEntryModel.id)
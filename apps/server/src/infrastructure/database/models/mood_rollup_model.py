@@ -0,0 +1,34 @@
+from datetime import date
+
+from sqlalchemy import Date, ForeignKey, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.infrastructure.database.connection import Base
+
+
+class MoodDailyRollupModel(Base):
+    """Mood entries counted per member, UTC day and label.
+
+    Maintained by `TeamRepository` in the same transaction as every mood
+    write, so analytics never scan raw history for whole days.
+    """
+
+    __tablename__ = "mood_daily_rollups"
+
+    member_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("team_members.id"), primary_key=True
+    )
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    label: Mapped[str] = mapped_column(String(50), primary_key=True)
+    count: Mapped[int] = mapped_column(Integer, default=0)
+
+
+# Covers team-wide analytics: a day range scan reading label, member_id
+# (for role/status filters) and count without touching the table.
+Index(
+    "ix_mood_daily_rollups_day_label",
+    MoodDailyRollupModel.day,
+    MoodDailyRollupModel.label,
+    MoodDailyRollupModel.member_id,
+    MoodDailyRollupModel.count,
+)
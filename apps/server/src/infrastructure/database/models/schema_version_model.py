@@ -0,0 +1,19 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.infrastructure.database.connection import Base
+
+
+class SchemaVersionModel(Base):
+    """Fingerprint of the schema `create_tables()` last applied.
+
+    A single row. When it matches the models, startup skips DDL entirely.
+    """
+
+    __tablename__ = "schema_version"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    version: Mapped[str] = mapped_column(String(64))
+    applied_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
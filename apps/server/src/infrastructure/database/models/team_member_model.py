@@ -1,4 +1,6 @@
-from sqlalchemy import String
+from datetime import datetime
+
+from sqlalchemy import DateTime, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.infrastructure.database.connection import Base
@@ -13,9 +15,26 @@ class TeamMemberModel(Base):
     avatar_url: Mapped[str | None] = mapped_column(String(500), nullable=True)
     status: Mapped[str] = mapped_column(String(20), default="active")
 
+    # Denormalized copy of the newest mood entry, maintained on every mood
+    # write so list views can show "who is feeling what" without a join.
+    current_mood_id: Mapped[str | None] = mapped_column(String(36), nullable=True)
+    current_mood_emoji: Mapped[str | None] = mapped_column(String(10), nullable=True)
+    current_mood_label: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    current_mood_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+
+    # Value of change_sequence in the last transaction that changed the row,
+    # including current mood updates
+    change_seq: Mapped[int] = mapped_column(Integer, default=0)
+
     mood_entries: Mapped[list["MoodEntryModel"]] = relationship(
         "MoodEntryModel",
         back_populates="member",
         cascade="all, delete-orphan",
         order_by="desc(MoodEntryModel.timestamp)",
     )
+
+
+# Delta sync: keyset scan of rows changed after a (change_seq, id) cursor.
+Index("ix_team_members_change_seq", TeamMemberModel.change_seq, TeamMemberModel.id)
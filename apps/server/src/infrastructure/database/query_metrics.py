@@ -0,0 +1,145 @@
+"""Database query tracking: counts, time and statement shapes.
+
+`install_query_metrics` hooks the engine's cursor events once. Each
+statement is timed and added to the `QueryStats` opened by the innermost
+`track_queries()` in the current context. Sync sessions running on a worker
+thread still report here, because anyio copies the caller's context into
+the thread.
+
+`track_engine_queries` records every statement on one engine instead,
+whatever context it runs in. `query_budget` builds on it to fail a test when
+a block runs more statements than it should. Statements that repeat with the
+same shape (see `fingerprint`) are the usual sign of an N+1 query.
+"""
+
+import re
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import lru_cache
+from time import perf_counter
+
+from sqlalchemy import Engine, event
+
+_STARTED = "query_metrics_started"
+
+# A bind placeholder in any paramstyle: ?, :name, $1, %s or %(name)s
+_PARAM = r"(?:\?|:\w+|\$\d+|%s|%\(\w+\)s)"
+_IN_LIST = re.compile(rf"\(\s*{_PARAM}(?:\s*,\s*{_PARAM})*\s*\)")
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_SPACE = re.compile(r"\s+")
+
+
+@dataclass
+class QueryStats:
+    count: int = 0
+    seconds: float = 0.0
+    statements: Counter[str] = field(default_factory=Counter)
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """Statement shapes run at least `threshold` times, most frequent first."""
+        shapes: Counter[str] = Counter()
+        for statement, n in self.statements.items():
+            shapes[fingerprint(statement)] += n
+        return [(shape, n) for shape, n in shapes.most_common() if n >= threshold]
+
+    def report(self) -> str:
+        lines = [f"{self.count} statements in {self.seconds * 1000:.1f} ms"]
+        lines += [f"  {n}x {shape}" for shape, n in self.repeated(1)]
+        return "\n".join(lines)
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+_current: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+@lru_cache(maxsize=1024)
+def fingerprint(statement: str) -> str:
+    """`statement` with literals and IN lists collapsed, to group by shape."""
+    shape = _STRING.sub("?", statement)
+    shape = _IN_LIST.sub("(?)", shape)
+    shape = _NUMBER.sub("?", shape)
+    return _SPACE.sub(" ", shape).strip()
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    stats = QueryStats()
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def track_engine_queries(engine: Engine) -> Iterator[QueryStats]:
+    """Record every statement `engine` executes while the block runs."""
+    stats = QueryStats()
+    started = (_STARTED, id(stats))
+
+    def _start(conn, cursor, statement, parameters, context, executemany) -> None:
+        conn.info.setdefault(started, []).append(perf_counter())
+
+    def _stop(conn, cursor, statement, parameters, context, executemany) -> None:
+        _add(stats, statement, perf_counter() - conn.info[started].pop())
+
+    event.listen(engine, "before_cursor_execute", _start)
+    event.listen(engine, "after_cursor_execute", _stop)
+    try:
+        yield stats
+    finally:
+        event.remove(engine, "before_cursor_execute", _start)
+        event.remove(engine, "after_cursor_execute", _stop)
+
+
+@contextmanager
+def query_budget(
+    engine: Engine, max_queries: int, max_repeats: int | None = None
+) -> Iterator[QueryStats]:
+    """Fail with `QueryBudgetExceeded` if the block runs more than
+    `max_queries` statements, or one shape more than `max_repeats` times."""
+    with track_engine_queries(engine) as stats:
+        yield stats
+    if stats.count > max_queries:
+        raise QueryBudgetExceeded(f"Query budget of {max_queries} exceeded:\n{stats.report()}")
+    if max_repeats is not None and stats.repeated(max_repeats + 1):
+        raise QueryBudgetExceeded(
+            f"A statement ran more than {max_repeats} times (N+1?):\n{stats.report()}"
+        )
+
+
+def install_query_metrics(engine: Engine) -> None:
+    @event.listens_for(engine, "before_cursor_execute")
+    def _start(conn, cursor, statement, parameters, context, executemany) -> None:
+        conn.info.setdefault(_STARTED, []).append(perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _stop(conn, cursor, statement, parameters, context, executemany) -> None:
+        _record(conn, statement)
+
+    @event.listens_for(engine, "handle_error")
+    def _failed(exception_context) -> None:
+        # Failed statements never reach after_cursor_execute
+        conn = exception_context.connection
+        if conn is not None and conn.info.get(_STARTED):
+            _record(conn, exception_context.statement or "")
+
+
+def _record(conn, statement: str) -> None:
+    elapsed = perf_counter() - conn.info[_STARTED].pop()
+    stats = _current.get()
+    if stats is not None:
+        _add(stats, statement, elapsed)
+
+
+def _add(stats: QueryStats, statement: str, elapsed: float) -> None:
+    stats.count += 1
+    stats.seconds += elapsed
+    stats.statements[statement] += 1
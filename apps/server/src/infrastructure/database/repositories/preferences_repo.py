@@ -1,7 +1,17 @@
+from functools import lru_cache
+
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from src.domain.models.user_preferences import UserPreferences
-from src.infrastructure.database.mappers.preferences_mapper import to_domain, to_model
+from src.infrastructure.database.dialects import upsert
+from src.infrastructure.database.mappers.preferences_mapper import (
+    PREFERENCES_COLUMNS,
+    from_row,
+    to_domain,
+    to_model,
+    to_row,
+)
 from src.infrastructure.database.models.preferences_model import PreferencesModel
 
 
@@ -10,10 +20,9 @@ class PreferencesRepository:
         self._db = db
 
     def get_by_user_id(self, user_id: str) -> UserPreferences | None:
-        model = self._db.get(PreferencesModel, user_id)
-        if model is None:
-            return None
-        return to_domain(model)
+        stmt = select(*PREFERENCES_COLUMNS).where(PreferencesModel.user_id == user_id)
+        row = self._db.execute(stmt).first()
+        return from_row(row) if row is not None else None
 
     def save(self, entity: UserPreferences) -> UserPreferences:
         model = self._db.get(PreferencesModel, entity.user_id)
@@ -28,6 +37,18 @@ class PreferencesRepository:
         self._db.refresh(model)
         return to_domain(model)
 
+    def upsert(self, defaults: UserPreferences, changes: dict[str, object]) -> UserPreferences:
+        """Apply `changes` to the stored row, creating it from `defaults` first.
+
+        One INSERT ... ON CONFLICT DO UPDATE ... RETURNING and one commit, so
+        concurrent first writes for a user cannot race. An existing row keeps
+        its `created_at` and every column not named in `changes`.
+        """
+        stmt = _upsert_preferences(self._dialect, frozenset(changes))
+        row = self._db.execute(stmt, {**to_row(defaults), **changes}).one()
+        self._db.commit()
+        return from_row(row)
+
     def delete(self, user_id: str) -> bool:
         model = self._db.get(PreferencesModel, user_id)
         if model is None:
@@ -35,3 +56,19 @@ class PreferencesRepository:
         self._db.delete(model)
         self._db.commit()
         return True
+
+    @property
+    def _dialect(self) -> str:
+        return self._db.get_bind().dialect.name
+
+
+@lru_cache
+def _upsert_preferences(dialect: str, fields: frozenset[str]):
+    # One compiled statement per (dialect, set of updated fields)
+    table = PreferencesModel.__table__
+    stmt = upsert(table, dialect)
+    updated = sorted(fields | {"updated_at"})
+    return stmt.on_conflict_do_update(
+        index_elements=["user_id"],
+        set_={name: stmt.excluded[name] for name in updated},
+    ).returning(*PREFERENCES_COLUMNS)
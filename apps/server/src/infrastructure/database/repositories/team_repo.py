@@ -1,15 +1,48 @@
-from sqlalchemy import func, select
-from sqlalchemy.orm import Session, selectinload
+from collections import Counter, defaultdict
+from collections.abc import Iterable, Iterator
+from datetime import date, datetime, time, timedelta, timezone
+from functools import lru_cache
 
+from sqlalchemy import (
+    Date,
+    DateTime,
+    Result,
+    Select,
+    Update,
+    and_,
+    bindparam,
+    cast,
+    delete,
+    except_,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import ColumnElement
+
+from src.domain.models.mood_bucket import MoodBucket
 from src.domain.models.mood_entry import MoodEntry
 from src.domain.models.team_member import TeamMember
+from src.infrastructure.database.dialects import upsert
 from src.infrastructure.database.mappers.team_mapper import (
-    mood_entry_to_domain,
-    mood_entry_to_model,
-    team_member_to_domain,
+    CURRENT_MOOD_COLUMNS,
+    MEMBER_COLUMNS,
+    JOINED_MOOD_ENTRY_COLUMNS,
+    MOOD_ENTRY_COLUMNS,
+    mood_entry_from_row,
+    mood_entry_to_row,
+    team_member_from_row,
+    team_members_from_rows,
     team_member_to_model,
+    team_member_to_row,
 )
+from src.infrastructure.database.models.change_sequence_model import ChangeSequenceModel
 from src.infrastructure.database.models.mood_entry_model import MoodEntryModel
+from src.infrastructure.database.models.mood_rollup_model import MoodDailyRollupModel
 from src.infrastructure.database.models.team_member_model import TeamMemberModel
 
 
@@ -17,37 +50,600 @@ class TeamRepository:
     def __init__(self, db: Session) -> None:
         self._db = db
 
+    @property
+    def _dialect(self) -> str:
+        return self._db.get_bind().dialect.name
+
     def get_all(self) -> list[TeamMember]:
-        stmt = select(TeamMemberModel).options(
-            selectinload(TeamMemberModel.mood_entries)
+        return self.get_page()
+
+    def get_page(
+        self,
+        after_id: str | None = None,
+        limit: int | None = None,
+        history_limit: int | None = None,
+        current_mood: bool = True,
+    ) -> list[TeamMember]:
+        """Members ordered by id, starting after `after_id` (keyset paging).
+
+        One SELECT: the page of members outer-joined to their mood entries,
+        newest first, grouped into members in a single pass over the rows.
+        With `history_limit`, each member carries at most that many entries,
+        capped in SQL per member; 0 leaves the join out. With history, the
+        current mood is the newest entry and `latest_mood` stays unset;
+        without it, `current_mood=False` leaves the denormalized current-mood
+        columns out.
+        """
+        return list(self.iter_page(after_id, limit, history_limit, current_mood))
+
+    def iter_page(
+        self,
+        after_id: str | None = None,
+        limit: int | None = None,
+        history_limit: int | None = None,
+        current_mood: bool = True,
+        yield_per: int | None = None,
+    ) -> Iterator[TeamMember]:
+        """`get_page`, yielding each member as soon as its rows are read.
+
+        With `yield_per`, the cursor is read in batches of that many rows, so
+        memory stays flat however many members match. The cursor stays open
+        until the iterator is exhausted or the session is closed.
+        """
+        member = TeamMemberModel
+        in_page = [] if after_id is None else [member.id > after_id]
+        if history_limit == 0:
+            stmt = (
+                select(*_member_columns(current_mood))
+                .where(*in_page)
+                .order_by(member.id)
+                .limit(limit)
+            )
+            return map(team_member_from_row, self._stream(stmt, yield_per))
+        if limit is not None:
+            # LIMIT would count joined rows, so pick the page's ids first
+            page_ids = select(member.id).where(*in_page).order_by(member.id).limit(limit)
+            in_page = [member.id.in_(page_ids.correlate(None))]
+        return self._with_history(in_page, history_limit, yield_per)
+
+    def get_by_id(
+        self, member_id: str, history: bool = True, current_mood: bool = True
+    ) -> TeamMember | None:
+        """One member; with `history`, its entries come from the same SELECT."""
+        where = [TeamMemberModel.id == member_id]
+        if not history:
+            stmt = select(*_member_columns(current_mood)).where(*where)
+            row = self._db.execute(stmt).first()
+            return team_member_from_row(row) if row is not None else None
+        return next(self._with_history(where), None)
+
+    def _with_history(
+        self,
+        where: list[ColumnElement[bool]],
+        per_member: int | None = None,
+        yield_per: int | None = None,
+    ) -> Iterator[TeamMember]:
+        """Members matching `where`, outer-joined to their history in one SELECT.
+
+        Rows are ordered by (member id, timestamp DESC). Uncapped, the primary
+        key and `ix_mood_entries_member_timestamp` produce that order without
+        a sort; capped, only each member's `per_member` rows are sorted. Each
+        member's rows are adjacent, so `team_members_from_rows` groups them
+        while the result streams. The current-mood columns are left out: the
+        newest joined entry is the current mood, and they would repeat on
+        every row.
+        """
+        member, history = TeamMemberModel, MoodEntryModel.__table__
+        on = history.c.member_id == member.id
+        if per_member is not None:
+            # The IN list alone must drive the join: the subquery reads the
+            # member's newest `per_member` index entries and each id is a
+            # primary key lookup. ANDed with the member_id term, SQLite
+            # walks the member's whole history and tests every row against it.
+            newest = history.alias("newest")
+            on = history.c.id.in_(
+                select(newest.c.id)
+                .where(newest.c.member_id == member.id)
+                .order_by(newest.c.timestamp.desc())
+                .limit(per_member)
+            )
+        stmt = (
+            select(*MEMBER_COLUMNS, *JOINED_MOOD_ENTRY_COLUMNS)
+            .select_from(member.__table__.outerjoin(history, on))
+            .where(*where)
+            .order_by(member.id, history.c.timestamp.desc())
+        )
+        return team_members_from_rows(self._stream(stmt, yield_per), len(MEMBER_COLUMNS))
+
+    def _stream(self, stmt: Select, yield_per: int | None = None) -> Result:
+        # Executed on the Core connection: the ORM layer would buffer and
+        # re-wrap every row before the first one reached the mapper
+        if yield_per is not None:
+            stmt = stmt.execution_options(yield_per=yield_per)
+        return self._db.connection().execute(stmt)
+
+    def exists(self, member_id: str) -> bool:
+        stmt = select(TeamMemberModel.id).where(TeamMemberModel.id == member_id)
+        return self._db.scalar(stmt) is not None
+
+    def get_mood_history(
+        self,
+        member_id: str,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        after: tuple[datetime, str] | None = None,
+        limit: int = 50,
+    ) -> list[MoodEntry]:
+        """One member's entries, newest first, keyset-paged on (timestamp, id).
+
+        Walks `ix_mood_entries_member_timestamp` in index order, so every page
+        costs the same regardless of how deep into the history it starts.
+        """
+        stmt = (
+            select(*MOOD_ENTRY_COLUMNS)
+            .where(MoodEntryModel.member_id == member_id)
+            .order_by(MoodEntryModel.timestamp.desc(), MoodEntryModel.id)
+            .limit(limit)
+        )
+        if since is not None:
+            stmt = stmt.where(MoodEntryModel.timestamp >= since)
+        if until is not None:
+            stmt = stmt.where(MoodEntryModel.timestamp < until)
+        if after is not None:
+            after_ts, after_id = after
+            # The plain upper bound lets SQLite seek straight to the cursor;
+            # the OR then only breaks ties on equal timestamps.
+            stmt = stmt.where(MoodEntryModel.timestamp <= after_ts).where(
+                or_(
+                    MoodEntryModel.timestamp < after_ts,
+                    and_(MoodEntryModel.timestamp == after_ts, MoodEntryModel.id > after_id),
+                )
+            )
+        return [mood_entry_from_row(row) for row in self._db.execute(stmt)]
+
+    def count_moods_by_bucket(
+        self,
+        bucket: str,
+        since: datetime,
+        until: datetime,
+        role: str | None = None,
+        status: str | None = None,
+    ) -> list[MoodBucket]:
+        """Mood counts per label in each `bucket` within [since, until).
+
+        Whole UTC days are summed from `mood_daily_rollups`. Only hourly
+        buckets and the partial days at either end of the window read raw
+        entries, through `ix_mood_entries_timestamp_label`. Cost follows the
+        number of days and labels, not history size. Empty buckets are omitted.
+        """
+        first_day, last_day = _ceil_day(since), _floor_day(until)
+        if bucket == "hour" or first_day >= last_day:
+            return _to_buckets(self._count_entries(bucket, since, until, role, status))
+        rows = self._count_rollups(bucket, first_day.date(), last_day.date(), role, status)
+        if since < first_day:
+            rows += self._count_entries(bucket, since, first_day, role, status)
+        if last_day < until:
+            rows += self._count_entries(bucket, last_day, until, role, status)
+        return _to_buckets(rows)
+
+    def _count_entries(
+        self, bucket: str, since: datetime, until: datetime, role: str | None, status: str | None
+    ) -> list[tuple[datetime, str, int]]:
+        entry = MoodEntryModel
+        start = _bucket_start(self._dialect, bucket, entry.timestamp).label("start")
+        stmt = (
+            select(start, entry.label, func.count())
+            .where(entry.timestamp >= since, entry.timestamp < until)
+            .group_by(start, entry.label)
+        )
+        stmt = _filter_members(stmt, entry.member_id, role, status)
+        return [(_as_utc(s), label, n) for s, label, n in self._db.execute(stmt)]
+
+    def _count_rollups(
+        self, bucket: str, first_day: date, last_day: date, role: str | None, status: str | None
+    ) -> list[tuple[datetime, str, int]]:
+        rollup = MoodDailyRollupModel
+        start = _bucket_start(self._dialect, bucket, rollup.day).label("start")
+        stmt = (
+            select(start, rollup.label, func.sum(rollup.count))
+            .where(rollup.day >= first_day, rollup.day < last_day)
+            .group_by(start, rollup.label)
         )
-        models = self._db.scalars(stmt).unique().all()
-        return [team_member_to_domain(m) for m in models]
+        stmt = _filter_members(stmt, rollup.member_id, role, status)
+        return [(_as_utc(s), label, n) for s, label, n in self._db.execute(stmt)]
+
+    def add_mood_entry(self, entry: MoodEntry) -> MoodEntry | None:
+        """Insert `entry` if its member exists; None (nothing written) otherwise.
 
-    def get_by_id(self, member_id: str) -> TeamMember | None:
+        Four statements, independent of history size: the change-sequence
+        bump, an INSERT ... SELECT from team_members that doubles as the
+        existence check and returns the stored row, the current-mood update
+        and the daily rollup upsert.
+        """
+        seq = self._next_change_seq()
+        table = MoodEntryModel.__table__
+        source = select(
+            literal(entry.id, table.c.id.type),
+            TeamMemberModel.id,
+            literal(entry.emoji, table.c.emoji.type),
+            literal(entry.label, table.c.label.type),
+            literal(entry.timestamp, table.c.timestamp.type),
+            literal(seq, table.c.change_seq.type),
+        ).where(TeamMemberModel.id == entry.member_id)
         stmt = (
-            select(TeamMemberModel)
-            .where(TeamMemberModel.id == member_id)
-            .options(selectinload(TeamMemberModel.mood_entries))
+            insert(table)
+            .from_select(["id", "member_id", "emoji", "label", "timestamp", "change_seq"], source)
+            .returning(table.c.id, table.c.member_id, table.c.emoji, table.c.label, table.c.timestamp)
         )
-        model = self._db.scalars(stmt).first()
-        if model is None:
+        row = self._db.execute(stmt).first()
+        if row is None:
+            self._db.rollback()
             return None
-        return team_member_to_domain(model)
+        self._db.execute(_SET_CURRENT_MOOD, _current_mood_params(entry, seq))
+        self._db.execute(_bump_rollups(self._dialect), _rollup_rows([entry]))
+        self._db.commit()
+        return mood_entry_from_row(row)
 
-    def add_mood_entry(self, entry: MoodEntry) -> MoodEntry:
-        model = mood_entry_to_model(entry)
-        self._db.add(model)
+    def existing_ids(self, member_ids: list[str]) -> set[str]:
+        if not member_ids:
+            return set()
+        stmt = select(TeamMemberModel.id).where(TeamMemberModel.id.in_(set(member_ids)))
+        return set(self._db.scalars(stmt))
+
+    def add_mood_entries(self, entries: list[MoodEntry]) -> list[MoodEntry]:
+        """Insert many entries with one executemany and a single commit."""
+        if not entries:
+            return []
+        seq = self._next_change_seq()
+        self._db.execute(
+            insert(MoodEntryModel.__table__),
+            [{**mood_entry_to_row(e), "change_seq": seq} for e in entries],
+        )
+        newest: dict[str, MoodEntry] = {}
+        for e in entries:
+            if e.member_id not in newest or e.timestamp >= newest[e.member_id].timestamp:
+                newest[e.member_id] = e
+        self._db.execute(
+            _SET_CURRENT_MOOD, [_current_mood_params(e, seq) for e in newest.values()]
+        )
+        self._db.execute(_bump_rollups(self._dialect), _rollup_rows(entries))
         self._db.commit()
-        self._db.refresh(model)
-        return mood_entry_to_domain(model)
+        return entries
 
     def save_member(self, member: TeamMember) -> TeamMember:
         model = team_member_to_model(member)
+        model.change_seq = self._next_change_seq()
+        for entry_model in model.mood_entries:
+            entry_model.change_seq = model.change_seq
         self._db.merge(model)
+        self._db.flush()
+        # merge may add or replace history, so recount this member's rollups
+        self._db.execute(
+            delete(MoodDailyRollupModel).where(MoodDailyRollupModel.member_id == member.id)
+        )
+        self._db.execute(self._insert_rollups_from_entries(member.id))
         self._db.commit()
         return member
 
+    def bulk_insert_members(
+        self, members: Iterable[TeamMember], chunk_size: int = 5000
+    ) -> tuple[int, int]:
+        """Insert new members and their mood history with Core executemany.
+
+        Rows are flushed and committed every `chunk_size` mood entries (or
+        members), so `members` can be a lazy generator of any size. The
+        current_mood_* columns are written from each member's newest entry.
+        Returns (members inserted, mood entries inserted).
+        """
+        member_rows: list[dict[str, object]] = []
+        entries: list[MoodEntry] = []
+        member_total = mood_total = 0
+
+        def flush() -> None:
+            seq = self._next_change_seq()
+            if member_rows:
+                self._db.execute(
+                    insert(TeamMemberModel.__table__),
+                    [{**row, "change_seq": seq} for row in member_rows],
+                )
+            if entries:
+                self._db.execute(
+                    insert(MoodEntryModel.__table__),
+                    [{**mood_entry_to_row(e), "change_seq": seq} for e in entries],
+                )
+                self._db.execute(_bump_rollups(self._dialect), _rollup_rows(entries))
+            self._db.commit()
+            member_rows.clear()
+            entries.clear()
+
+        for member in members:
+            member_rows.append(team_member_to_row(member))
+            entries.extend(member.mood_entries)
+            member_total += 1
+            mood_total += len(member.mood_entries)
+            if len(entries) >= chunk_size or len(member_rows) >= chunk_size:
+                flush()
+        if member_rows or entries:
+            flush()
+        return member_total, mood_total
+
+    def delete_all(self) -> None:
+        """Remove every member and mood entry in one transaction."""
+        self._db.execute(delete(MoodDailyRollupModel))
+        self._db.execute(delete(MoodEntryModel))
+        self._db.execute(delete(TeamMemberModel))
+        self._db.commit()
+
+    def get_member_changes(
+        self, after: tuple[int, str], limit: int
+    ) -> list[tuple[int, TeamMember]]:
+        """Members changed after the (change_seq, id) cursor, oldest change first.
+
+        Members come without mood history; `latest_mood` carries their
+        current mood. Each is paired with its change_seq.
+        """
+        member = TeamMemberModel
+        stmt = (
+            select(member.change_seq, *MEMBER_COLUMNS, *CURRENT_MOOD_COLUMNS)
+            .where(*_after_change(member.change_seq, member.id, after))
+            .order_by(member.change_seq, member.id)
+            .limit(limit)
+        )
+        return [(row[0], team_member_from_row(row[1:])) for row in self._db.execute(stmt)]
+
+    def get_mood_changes(
+        self, after: tuple[int, str], limit: int
+    ) -> list[tuple[int, MoodEntry]]:
+        """Mood entries written after the (change_seq, id) cursor, with their change_seq."""
+        entry = MoodEntryModel
+        stmt = (
+            select(entry.change_seq, *MOOD_ENTRY_COLUMNS)
+            .where(*_after_change(entry.change_seq, entry.id, after))
+            .order_by(entry.change_seq, entry.id)
+            .limit(limit)
+        )
+        return [(row[0], mood_entry_from_row(row[1:])) for row in self._db.execute(stmt)]
+
+    def _next_change_seq(self) -> int:
+        """Bump the change sequence inside the current transaction."""
+        return self._db.execute(_bump_change_seq(self._dialect)).scalar_one()
+
     def count(self) -> int:
         stmt = select(func.count()).select_from(TeamMemberModel)
         return self._db.scalar(stmt) or 0
+
+    def backfill_change_seq(self) -> int:
+        """Stamp every member and mood entry with one new change sequence value.
+
+        For rows written before `change_seq` existed, which would otherwise
+        all sit at the column default. Delta sync then reports each of them
+        once to any client cursor older than the stamp. Returns the value.
+        """
+        seq = self._next_change_seq()
+        self._db.execute(update(TeamMemberModel).values(change_seq=seq))
+        self._db.execute(update(MoodEntryModel).values(change_seq=seq))
+        self._db.commit()
+        return seq
+
+    def backfill_current_moods(self) -> int:
+        """Recompute every member's denormalized current mood from history.
+
+        Repairs rows written before the columns existed or by code paths
+        that bypassed `add_mood_entry`. Returns the number of members processed.
+        """
+        newest_id = (
+            select(MoodEntryModel.id)
+            .where(MoodEntryModel.member_id == TeamMemberModel.id)
+            .order_by(MoodEntryModel.timestamp.desc(), MoodEntryModel.id)
+            .limit(1)
+            .scalar_subquery()
+        )
+        result = self._db.execute(
+            update(TeamMemberModel).values(
+                current_mood_id=newest_id, change_seq=self._next_change_seq()
+            )
+        )
+
+        def newest(column):
+            return (
+                select(column)
+                .where(MoodEntryModel.id == TeamMemberModel.current_mood_id)
+                .scalar_subquery()
+            )
+
+        self._db.execute(
+            update(TeamMemberModel).values(
+                current_mood_emoji=newest(MoodEntryModel.emoji),
+                current_mood_label=newest(MoodEntryModel.label),
+                current_mood_at=newest(MoodEntryModel.timestamp),
+            )
+        )
+        self._db.commit()
+        return result.rowcount
+
+    def rebuild_mood_rollups(self) -> int:
+        """Recount `mood_daily_rollups` from mood_entries in one transaction.
+
+        Backfills the table on an existing database and repairs drift.
+        Returns the number of rollup rows written.
+        """
+        self._db.execute(delete(MoodDailyRollupModel))
+        result = self._db.execute(self._insert_rollups_from_entries())
+        self._db.commit()
+        return result.rowcount
+
+    def mood_rollups_missing(self) -> bool:
+        """True when mood entries exist but no rollup row does."""
+        has_entries = select(MoodEntryModel.id).limit(1).exists()
+        has_rollups = select(MoodDailyRollupModel.member_id).limit(1).exists()
+        return bool(self._db.scalar(select(and_(has_entries, ~has_rollups))))
+
+    def check_mood_rollups(self) -> int:
+        """Count (member, day, label) keys whose rollup disagrees with raw entries."""
+        table = MoodDailyRollupModel.__table__
+        expected = self._rollup_source()
+        stored = select(table.c.member_id, table.c.day, table.c.label, table.c.count)
+        missing = except_(expected, stored).subquery()
+        extra = except_(stored, expected).subquery()
+        count = select(func.count()).select_from(missing).scalar_subquery() + select(
+            func.count()
+        ).select_from(extra).scalar_subquery()
+        return self._db.scalar(select(count)) or 0
+
+    def _rollup_source(self, member_id: str | None = None) -> Select:
+        entry = MoodEntryModel
+        day = _utc_date(self._dialect, entry.timestamp).label("day")
+        stmt = select(entry.member_id, day, entry.label, func.count().label("count")).group_by(
+            entry.member_id, day, entry.label
+        )
+        if member_id is not None:
+            stmt = stmt.where(entry.member_id == member_id)
+        return stmt
+
+    def _insert_rollups_from_entries(self, member_id: str | None = None):
+        return insert(MoodDailyRollupModel.__table__).from_select(
+            ["member_id", "day", "label", "count"], self._rollup_source(member_id)
+        )
+
+
+def _member_columns(current_mood: bool) -> tuple[ColumnElement, ...]:
+    return MEMBER_COLUMNS + CURRENT_MOOD_COLUMNS if current_mood else MEMBER_COLUMNS
+
+
+# Points a member's current mood at an entry unless a newer one is already
+# recorded. Core statement with bind params, so it also runs as executemany.
+_SET_CURRENT_MOOD: Update = (
+    update(TeamMemberModel.__table__)
+    .where(TeamMemberModel.id == bindparam("b_member_id"))
+    .where(
+        or_(
+            TeamMemberModel.current_mood_at.is_(None),
+            TeamMemberModel.current_mood_at <= bindparam("b_timestamp"),
+        )
+    )
+    .values(
+        current_mood_id=bindparam("b_id"),
+        current_mood_emoji=bindparam("b_emoji"),
+        current_mood_label=bindparam("b_label"),
+        current_mood_at=bindparam("b_timestamp"),
+        change_seq=bindparam("b_change_seq"),
+    )
+)
+
+
+def _current_mood_params(entry: MoodEntry, change_seq: int) -> dict[str, object]:
+    return {
+        "b_change_seq": change_seq,
+        "b_member_id": entry.member_id,
+        "b_id": entry.id,
+        "b_emoji": entry.emoji,
+        "b_label": entry.label,
+        "b_timestamp": entry.timestamp,
+    }
+
+
+def _bucket_start(dialect: str, bucket: str, column: ColumnElement) -> ColumnElement:
+    """SQL expression truncating a UTC timestamp or date to its bucket (weeks start Monday)."""
+    if dialect == "sqlite":
+        # Timestamps and dates are stored as UTC text; strftime re-parses them.
+        if bucket == "hour":
+            return func.strftime("%Y-%m-%d %H:00:00", column)
+        if bucket == "day":
+            return func.strftime("%Y-%m-%d 00:00:00", column)
+        return func.strftime("%Y-%m-%d 00:00:00", column, "weekday 0", "-6 days")
+    if dialect == "postgresql":
+        if isinstance(column.type, Date):
+            return func.date_trunc(bucket, cast(column, DateTime()))
+        return func.date_trunc(bucket, func.timezone("UTC", column))
+    raise NotImplementedError(f"Mood analytics are not supported on {dialect}")
+
+
+def _utc_date(dialect: str, column: ColumnElement) -> ColumnElement:
+    if dialect == "sqlite":
+        return func.date(column)
+    if dialect == "postgresql":
+        return cast(func.timezone("UTC", column), Date)
+    raise NotImplementedError(f"Mood rollups are not supported on {dialect}")
+
+
+def _filter_members(
+    stmt: Select, member_id: ColumnElement, role: str | None, status: str | None
+) -> Select:
+    if role is None and status is None:
+        return stmt
+    stmt = stmt.join(TeamMemberModel, TeamMemberModel.id == member_id)
+    if role is not None:
+        stmt = stmt.where(TeamMemberModel.role == role)
+    if status is not None:
+        stmt = stmt.where(TeamMemberModel.status == status)
+    return stmt
+
+
+def _to_buckets(rows: Iterable[tuple[datetime, str, int]]) -> list[MoodBucket]:
+    merged: dict[datetime, Counter[str]] = defaultdict(Counter)
+    for start, label, n in rows:
+        merged[start][label] += n
+    return [
+        MoodBucket(start=start, counts=dict(sorted(merged[start].items())))
+        for start in sorted(merged)
+    ]
+
+
+def _after_change(
+    seq_column: ColumnElement, id_column: ColumnElement, after: tuple[int, str]
+) -> tuple[ColumnElement, ...]:
+    # The plain `>=` bound lets the (change_seq, id) index seek to the cursor.
+    seq, last_id = after
+    return (
+        seq_column >= seq,
+        or_(seq_column > seq, id_column > last_id),
+    )
+
+
+def _floor_day(value: datetime) -> datetime:
+    return datetime.combine(value.date(), time(), tzinfo=value.tzinfo)
+
+
+def _ceil_day(value: datetime) -> datetime:
+    floor = _floor_day(value)
+    return floor if floor == value else floor + timedelta(days=1)
+
+
+def _as_utc(value: datetime | str) -> datetime:
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+@lru_cache
+def _bump_rollups(dialect: str):
+    """Upsert adding each row's count to its (member_id, day, label) rollup."""
+    stmt = upsert(MoodDailyRollupModel.__table__, dialect)
+    return stmt.on_conflict_do_update(
+        index_elements=["member_id", "day", "label"],
+        set_={"count": MoodDailyRollupModel.__table__.c.count + stmt.excluded.count},
+    )
+
+
+def _rollup_rows(entries: Iterable[MoodEntry]) -> list[dict[str, object]]:
+    counts = Counter(
+        (e.member_id, _as_utc(e.timestamp).date(), e.label) for e in entries
+    )
+    return [
+        {"member_id": member_id, "day": day, "label": label, "count": n}
+        for (member_id, day, label), n in counts.items()
+    ]
+
+
+@lru_cache
+def _bump_change_seq(dialect: str):
+    """Upsert incrementing the single change_sequence row, returning its value."""
+    table = ChangeSequenceModel.__table__
+    return (
+        upsert(table, dialect)
+        .values(id=1, value=1)
+        .on_conflict_do_update(index_elements=["id"], set_={"value": table.c.value + 1})
+        .returning(table.c.value)
+    )
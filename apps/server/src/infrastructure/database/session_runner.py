@@ -0,0 +1,76 @@
+"""Run sync repository code from async callers.
+
+Repositories are written once against a sync `Session`. A runner decides
+where that code executes:
+
+- `AsyncSessionRunner` uses `AsyncSession.run_sync`, so the ORM code runs on
+  the event loop and every database round trip is awaited through the async
+  driver. No worker thread is involved.
+- `ThreadedSessionRunner` hands the call to a worker thread. This is the sync
+  mode, with the same thread-pool behaviour as plain `def` routes.
+- `SessionFactoryRunner` opens a short-lived session per call, for work that
+  outlives a request (e.g. background cache refreshes). Its `session()`
+  holds one session across calls, e.g. for a streamed response that reads
+  an open cursor after the route has returned.
+"""
+
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from typing import Protocol, TypeVar
+
+import anyio
+import anyio.to_thread
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+
+T = TypeVar("T")
+
+
+class SessionRunner(Protocol):
+    async def __call__(self, fn: Callable[[Session], T]) -> T: ...
+
+
+class AsyncSessionRunner:
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def __call__(self, fn: Callable[[Session], T]) -> T:
+        return await self._session.run_sync(fn)
+
+
+class ThreadedSessionRunner:
+    def __init__(self, session: Session) -> None:
+        self._session = session
+
+    async def __call__(self, fn: Callable[[Session], T]) -> T:
+        return await anyio.to_thread.run_sync(fn, self._session)
+
+
+class SessionFactoryRunner:
+    def __init__(self, factory: sessionmaker[Session] | async_sessionmaker[AsyncSession]) -> None:
+        self._factory = factory
+
+    async def __call__(self, fn: Callable[[Session], T]) -> T:
+        if isinstance(self._factory, async_sessionmaker):
+            async with self._factory() as session:
+                return await session.run_sync(fn)
+        return await anyio.to_thread.run_sync(self._run_in_new_session, fn)
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[SessionRunner]:
+        """A runner bound to one new session, closed when the block exits."""
+        if isinstance(self._factory, async_sessionmaker):
+            async with self._factory() as session:
+                yield AsyncSessionRunner(session)
+            return
+        session = self._factory()
+        try:
+            yield ThreadedSessionRunner(session)
+        finally:
+            # Also on cancellation, e.g. a client disconnecting mid-stream
+            with anyio.CancelScope(shield=True):
+                await anyio.to_thread.run_sync(session.close)
+
+    def _run_in_new_session(self, fn: Callable[[Session], T]) -> T:
+        with self._factory() as session:
+            return fn(session)
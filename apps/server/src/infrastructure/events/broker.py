@@ -0,0 +1,110 @@
+"""In-process pub/sub with bounded, coalescing subscriber queues.
+
+Each subscriber holds at most `maxsize` pending events, keyed by
+`key(event)`. A new event for a key that is still pending replaces it
+(coalescing: a slow consumer only sees the latest state per key). When a
+new key arrives at a full queue, the oldest pending event is dropped and
+counted, so the consumer can tell it must resync. Publishing never blocks
+and never waits on a subscriber.
+
+The broker is not thread-safe: publish and consume on the event loop.
+"""
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import asdict, dataclass
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class BrokerStats:
+    subscribers: int = 0
+    published: int = 0
+    coalesced: int = 0
+    dropped: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return asdict(self)
+
+
+class Subscription(Generic[T]):
+    def __init__(self, broker: "EventBroker[T]", maxsize: int) -> None:
+        self._broker = broker
+        self._maxsize = maxsize
+        self._pending: OrderedDict[Hashable, T] = OrderedDict()
+        self._ready = asyncio.Event()
+        self._dropped = 0
+
+    def __enter__(self) -> "Subscription[T]":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._broker._unsubscribe(self)
+
+    def take_dropped(self) -> int:
+        """Events dropped since the last call."""
+        dropped, self._dropped = self._dropped, 0
+        return dropped
+
+    async def next_batch(self, timeout: float | None = None) -> list[T]:
+        """Wait for pending events and return them oldest first.
+
+        Returns an empty list if nothing arrives within `timeout` seconds.
+        """
+        if not self._pending:
+            self._ready.clear()
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout)
+            except TimeoutError:
+                return []
+        batch = list(self._pending.values())
+        self._pending.clear()
+        return batch
+
+    def _offer(self, key: Hashable, event: T) -> str | None:
+        outcome = None
+        if key in self._pending:
+            self._pending.move_to_end(key)
+            outcome = "coalesced"
+        elif len(self._pending) >= self._maxsize:
+            self._pending.popitem(last=False)
+            self._dropped += 1
+            outcome = "dropped"
+        self._pending[key] = event
+        self._ready.set()
+        return outcome
+
+
+class EventBroker(Generic[T]):
+    def __init__(self, key: Callable[[T], Hashable], maxsize: int = 256) -> None:
+        self._key = key
+        self._maxsize = maxsize
+        self._subscribers: set[Subscription[T]] = set()
+        self._stats = BrokerStats()
+
+    def subscribe(self) -> Subscription[T]:
+        subscription = Subscription(self, self._maxsize)
+        self._subscribers.add(subscription)
+        return subscription
+
+    def publish(self, event: T) -> None:
+        key = self._key(event)
+        self._stats.published += 1
+        for subscription in self._subscribers:
+            outcome = subscription._offer(key, event)
+            if outcome == "coalesced":
+                self._stats.coalesced += 1
+            elif outcome == "dropped":
+                self._stats.dropped += 1
+
+    def stats(self) -> BrokerStats:
+        return BrokerStats(**{**asdict(self._stats), "subscribers": len(self._subscribers)})
+
+    def _unsubscribe(self, subscription: Subscription[T]) -> None:
+        self._subscribers.discard(subscription)
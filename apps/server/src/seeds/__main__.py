@@ -0,0 +1,70 @@
+"""Seed the configured database.
+
+Usage:
+    python -m src.seeds                                   # 8-member demo fixture
+    python -m src.seeds --members 10000 --moods 100       # synthetic dataset
+    python -m src.seeds --members 500 --moods 50 --seed 7 --end now --replace
+"""
+
+import argparse
+import time
+from datetime import datetime, timezone
+
+from src.infrastructure.database.connection import SessionLocal, create_tables
+from src.infrastructure.database.repositories.team_repo import TeamRepository
+from src.seeds.synthetic import seed_synthetic_data
+from src.seeds.team_seed import BASE_TIME, seed_team_data
+
+
+def _end_time(value: str) -> datetime:
+    if value == "now":
+        return datetime.now(timezone.utc)
+    parsed = datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m src.seeds")
+    parser.add_argument("--members", type=int, help="Generate this many synthetic members")
+    parser.add_argument("--moods", type=int, default=20, help="Mood entries per member")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (same seed, same data)")
+    parser.add_argument(
+        "--end",
+        type=_end_time,
+        default=BASE_TIME,
+        help="Newest possible timestamp: ISO datetime or 'now' (default: fixture base time)",
+    )
+    parser.add_argument("--days", type=int, default=30, help="Spread moods over this many days")
+    parser.add_argument("--chunk-size", type=int, default=5000, help="Rows per transaction")
+    parser.add_argument(
+        "--replace", action="store_true", help="Delete existing team data before seeding"
+    )
+    args = parser.parse_args(argv)
+
+    create_tables()
+    db = SessionLocal()
+    try:
+        repo = TeamRepository(db)
+        if args.replace:
+            repo.delete_all()
+        if args.members is None:
+            seed_team_data(db)
+            print(f"Team fixture present ({repo.count()} members)")
+            return
+        if repo.count() > 0:
+            parser.error("team_members is not empty; pass --replace to overwrite it")
+        started = time.perf_counter()
+        try:
+            members, moods = seed_synthetic_data(
+                db, args.members, args.moods, args.seed, args.end, args.days, args.chunk_size
+            )
+        except ValueError as e:
+            parser.error(str(e))
+        elapsed = time.perf_counter() - started
+        print(f"Seeded {members} members and {moods} mood entries in {elapsed:.1f}s")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Synthetic team data for performance datasets.
+
+Generates N members with M mood entries each, deterministically from a
+seed. Entries cluster on weekdays during working hours across a window of
+`days` ending at `end`, newest first like the fixture data. Members are
+produced lazily and written through `TeamRepository.bulk_insert_members`,
+so large datasets never sit in memory at once.
+"""
+
+import random
+from collections.abc import Iterator
+from datetime import datetime, timedelta
+
+from sqlalchemy.orm import Session
+
+from src.domain.models.mood_entry import MoodEntry
+from src.domain.models.team_member import TeamMember
+from src.infrastructure.database.repositories.team_repo import TeamRepository
+from src.seeds.team_seed import BASE_TIME
+
+FIRST_NAMES = [
+    "Sarah", "Marcus", "Priya", "David", "Aisha", "Tom", "Elena", "James",
+    "Mei", "Lucas", "Fatima", "Noah", "Ingrid", "Kwame", "Sofia", "Ravi",
+]  # fmt: skip
+LAST_NAMES = [
+    "Chen", "Johnson", "Patel", "Kim", "Mohammed", "Rivera", "Volkov", "O'Brien",
+    "Nakamura", "Silva", "Haddad", "Müller", "Okafor", "Rossi", "Larsen", "Singh",
+]  # fmt: skip
+ROLES = [
+    "Engineering Lead", "Senior Developer", "UX Designer", "Backend Developer",
+    "Product Manager", "QA Engineer", "DevOps Engineer", "Data Analyst",
+]  # fmt: skip
+STATUSES = (["active", "away", "offline"], [0.6, 0.25, 0.15])
+MOODS = (
+    [
+        ("\U0001f60a", "Happy"),
+        ("\U0001f525", "Fired Up"),
+        ("\U0001f914", "Thinking"),
+        ("\U0001f610", "Neutral"),
+        ("\U0001f634", "Tired"),
+        ("\U0001f624", "Stressed"),
+    ],
+    [0.3, 0.15, 0.15, 0.2, 0.12, 0.08],
+)
+
+
+def generate_members(
+    count: int,
+    moods_per_member: int,
+    seed: int = 0,
+    end: datetime = BASE_TIME,
+    days: int = 30,
+) -> Iterator[TeamMember]:
+    """Yield `count` members; the same arguments always yield the same data."""
+    if count < 0 or moods_per_member < 0:
+        raise ValueError("Member and mood counts must not be negative")
+    if days < 1:
+        raise ValueError("Days must be at least 1")
+
+    rng = random.Random(seed)
+    for i in range(count):
+        member_id = f"sm-{seed:04d}-{i:08d}"
+        timestamps = sorted(
+            (_working_time(rng, end, days) for _ in range(moods_per_member)), reverse=True
+        )
+        yield TeamMember(
+            id=member_id,
+            name=f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+            role=rng.choice(ROLES),
+            avatar_url=None,
+            status=rng.choices(*STATUSES)[0],
+            mood_entries=[
+                MoodEntry(
+                    id=f"{member_id}-{j:06d}",
+                    member_id=member_id,
+                    emoji=emoji,
+                    label=label,
+                    timestamp=ts,
+                )
+                for j, (ts, (emoji, label)) in enumerate(
+                    zip(timestamps, rng.choices(*MOODS, k=moods_per_member))
+                )
+            ],
+        )
+
+
+def _working_time(rng: random.Random, end: datetime, days: int) -> datetime:
+    """A moment within `days` before `end`, biased to weekday office hours."""
+    while True:
+        day = (end - timedelta(days=rng.randrange(days))).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        # Keep one in five weekend picks so weekends are quiet, not empty
+        if day.weekday() < 5 or rng.random() < 0.2:
+            break
+    moment = day + timedelta(hours=rng.triangular(7, 20, 10), seconds=rng.randrange(60))
+    return min(moment, end)
+
+
+def seed_synthetic_data(
+    db: Session,
+    members: int,
+    moods_per_member: int,
+    seed: int = 0,
+    end: datetime = BASE_TIME,
+    days: int = 30,
+    chunk_size: int = 5000,
+) -> tuple[int, int]:
+    """Bulk-insert a generated team. Returns (members, mood entries) written."""
+    repo = TeamRepository(db)
+    return repo.bulk_insert_members(
+        generate_members(members, moods_per_member, seed, end, days), chunk_size
+    )
@@ -173,5 +173,4 @@ def seed_team_data(db: Session) -> None:
     if repo.count() > 0:
         return
 
-    for member in _build_members():
-        repo.save_member(member)
+    repo.bulk_insert_members(_build_members())
@@ -0,0 +1,128 @@
+"""Routes served through an AsyncSession (aiosqlite) instead of the thread pool."""
+
+import asyncio
+import json
+from collections.abc import AsyncGenerator, Awaitable, Callable
+
+import httpx
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from src.api.main import app
+from src.api.v1.dependencies import (
+    get_background_runner,
+    get_preferences_cache,
+    get_session_runner,
+    get_team_cache,
+)
+from src.infrastructure.cache.ttl_cache import TTLCache
+from src.infrastructure.database.connection import Base
+from src.infrastructure.database.session_runner import (
+    AsyncSessionRunner,
+    SessionFactoryRunner,
+    SessionRunner,
+)
+
+import src.infrastructure.database.models.change_sequence_model  # noqa: F401
+import src.infrastructure.database.models.mood_entry_model  # noqa: F401
+import src.infrastructure.database.models.mood_rollup_model  # noqa: F401
+import src.infrastructure.database.models.preferences_model  # noqa: F401
+import src.infrastructure.database.models.team_member_model  # noqa: F401
+
+from src.seeds.team_seed import seed_team_data, MEMBER_IDS
+
+pytest.importorskip("aiosqlite")
+
+
+def _run_with_client(test: Callable[[httpx.AsyncClient], Awaitable[None]]) -> None:
+    async def main() -> None:
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:", poolclass=StaticPool)
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        TestSession = async_sessionmaker(engine, expire_on_commit=False)
+        async with TestSession() as session:
+            await session.run_sync(seed_team_data)
+
+        async def _override_runner() -> AsyncGenerator[SessionRunner, None]:
+            async with TestSession() as session:
+                yield AsyncSessionRunner(session)
+
+        app.dependency_overrides[get_session_runner] = _override_runner
+        sessions = SessionFactoryRunner(TestSession)
+        app.dependency_overrides[get_background_runner] = lambda: sessions
+        app.dependency_overrides[get_team_cache] = lambda: None
+        # A fresh cache per test so the cached read and eviction paths are exercised
+        preferences_cache: TTLCache = TTLCache(maxsize=16, ttl=60)
+        app.dependency_overrides[get_preferences_cache] = lambda: preferences_cache
+        try:
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                await test(client)
+        finally:
+            app.dependency_overrides.clear()
+            await engine.dispose()
+
+    asyncio.run(main())
+
+
+class TestAsyncTeamRoutes:
+    def test_list_team_members(self) -> None:
+        async def check(client: httpx.AsyncClient) -> None:
+            resp = await client.get("/api/v1/team")
+            assert resp.status_code == 200
+            assert len(resp.json()) == 8
+
+        _run_with_client(check)
+
+    def test_submit_mood_then_read_back(self) -> None:
+        async def check(client: httpx.AsyncClient) -> None:
+            resp = await client.post(
+                f"/api/v1/team/{MEMBER_IDS[0]}/mood",
+                json={"emoji": "🎉", "label": "Celebrating"},
+            )
+            assert resp.status_code == 201
+            member = (
+                await client.get(f"/api/v1/team/{MEMBER_IDS[0]}", params={"include": "history"})
+            ).json()
+            assert member["currentMood"]["emoji"] == "🎉"
+            assert len(member["moodHistory"]) == 7
+
+        _run_with_client(check)
+
+    def test_concurrent_reads(self) -> None:
+        async def check(client: httpx.AsyncClient) -> None:
+            responses = await asyncio.gather(
+                *(client.get(f"/api/v1/team/{member_id}") for member_id in MEMBER_IDS)
+            )
+            assert [r.json()["id"] for r in responses] == MEMBER_IDS
+
+        _run_with_client(check)
+
+    def test_stream_team_members(self) -> None:
+        async def check(client: httpx.AsyncClient) -> None:
+            params = {"stream": 1, "include": "history"}
+            async with client.stream("GET", "/api/v1/team", params=params) as resp:
+                assert resp.status_code == 200
+                lines = [line async for line in resp.aiter_lines() if line]
+            assert [json.loads(line)["id"] for line in lines] == MEMBER_IDS
+
+        _run_with_client(check)
+
+    def test_unknown_member_returns_404(self) -> None:
+        async def check(client: httpx.AsyncClient) -> None:
+            resp = await client.get("/api/v1/team/nonexistent")
+            assert resp.status_code == 404
+
+        _run_with_client(check)
+
+
+class TestAsyncPreferencesRoutes:
+    def test_put_then_get(self) -> None:
+        async def check(client: httpx.AsyncClient) -> None:
+            resp = await client.put("/api/v1/preferences/u1", json={"username": "Ada"})
+            assert resp.status_code == 200
+            resp = await client.get("/api/v1/preferences/u1")
+            assert resp.json()["username"] == "Ada"
+
+        _run_with_client(check)
@@ -0,0 +1,71 @@
+"""GET /metrics — Prometheus exposition of request and DB metrics."""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.api.instrumentation import repeated_queries, request_queries, requests_total
+from src.api.main import app
+from src.api.v1.dependencies import get_db, get_preferences_cache, get_team_cache
+from src.config.settings import settings
+from src.infrastructure.database.connection import Base
+from src.infrastructure.database.query_metrics import install_query_metrics
+from src.seeds.team_seed import MEMBER_IDS, seed_team_data
+
+
+@pytest.fixture
+def client() -> TestClient:
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    install_query_metrics(engine)
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    seed_team_data(session)
+
+    def _override_db():
+        yield session
+
+    app.dependency_overrides[get_db] = _override_db
+    app.dependency_overrides[get_team_cache] = lambda: None
+    app.dependency_overrides[get_preferences_cache] = lambda: None
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+    session.close()
+
+
+class TestMetricsEndpoint:
+    def test_records_route_template_status_and_queries(self, client: TestClient) -> None:
+        route = "/api/v1/team/{id}"
+        before = requests_total.value("GET", route, "200")
+        queries_before = request_queries.count("GET", route)
+
+        assert client.get(f"/api/v1/team/{MEMBER_IDS[0]}").status_code == 200
+        assert requests_total.value("GET", route, "200") == before + 1
+        assert request_queries.count("GET", route) == queries_before + 1
+
+        resp = client.get("/metrics")
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/plain; version=0.0.4")
+        body = resp.text
+        assert f'http_requests_total{{method="GET",route="{route}",status="200"}}' in body
+        assert "# TYPE http_request_duration_seconds histogram" in body
+        assert f'http_request_db_queries_bucket{{method="GET",route="{route}",le="0"}}' in body
+        assert "http_requests_in_flight 1" in body  # the scrape itself
+
+    def test_unmatched_paths_share_one_label(self, client: TestClient) -> None:
+        client.get("/no/such/path")
+        assert requests_total.value("GET", "<unmatched>", "404") >= 1
+
+    def test_warns_on_repeated_statements(self, client: TestClient, monkeypatch, caplog) -> None:
+        monkeypatch.setattr(settings, "query_repeat_warning", 1)
+        route = "/api/v1/team/{id}"
+        before = repeated_queries.value("GET", route)
+
+        client.get(f"/api/v1/team/{MEMBER_IDS[0]}")
+        assert repeated_queries.value("GET", route) == before + 1
+        assert "Possible N+1 on GET /api/v1/team/{id}" in caplog.text
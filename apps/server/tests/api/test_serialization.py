@@ -0,0 +1,88 @@
+"""Fast serialization path — payload builders must match the response models byte for byte."""
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from src.api.v1 import serialization
+from src.api.v1.schemas.team_schemas import (
+    MEMBER_FIELD_ALIASES,
+    MoodEntryResponse,
+    TeamChangesResponse,
+    TeamMemberResponse,
+    mood_entry_payload,
+    team_changes_payload,
+    team_member_payload,
+)
+from src.domain.models.mood_entry import MoodEntry
+from src.domain.models.team_changes import TeamChanges
+from src.domain.models.team_member import TeamMember
+
+
+def _member(timestamp: datetime) -> TeamMember:
+    history = [
+        MoodEntry(id="e2", member_id="m1", emoji="😊", label="happy", timestamp=timestamp),
+        MoodEntry(id="e1", member_id="m1", emoji="😴", label="tired", timestamp=timestamp.replace(microsecond=123456)),
+    ]
+    return TeamMember(
+        id="m1", name="Alice", role="Dev", avatar_url=None, status="active", mood_entries=history
+    )
+
+
+@pytest.fixture(params=["orjson", "pydantic"])
+def encoder(request, monkeypatch: pytest.MonkeyPatch) -> str:
+    if request.param == "pydantic":
+        monkeypatch.setattr(serialization, "orjson", None)
+    return request.param
+
+
+@pytest.mark.parametrize(
+    "timestamp",
+    [datetime(2026, 2, 25, 10, 30, tzinfo=timezone.utc), datetime(2026, 2, 25, 10, 30)],
+    ids=["aware", "naive"],
+)
+class TestPayloadsMatchModels:
+    def test_team_member(self, encoder: str, timestamp: datetime) -> None:
+        member = _member(timestamp)
+        expected = TeamMemberResponse.model_validate(member).model_dump_json(by_alias=True)
+        assert json.loads(serialization.dumps(team_member_payload(member))) == json.loads(expected)
+
+    def test_team_changes(self, encoder: str, timestamp: datetime) -> None:
+        member = _member(timestamp)
+        changes = TeamChanges(
+            next_cursor="abc", members=[member], moods=member.mood_entries, has_more=True
+        )
+        expected = TeamChangesResponse.model_validate(changes).model_dump_json(by_alias=True)
+        assert json.loads(serialization.dumps(team_changes_payload(changes))) == json.loads(
+            expected
+        )
+
+    def test_mood_entry_timestamp_format(self, encoder: str, timestamp: datetime) -> None:
+        entry = _member(timestamp).mood_entries[1]
+        expected = MoodEntryResponse.model_validate(entry).model_dump_json(by_alias=True)
+        # Compare raw bytes so datetime formatting ("Z" vs "+00:00") is pinned too
+        assert serialization.dumps(mood_entry_payload(entry)) == expected.encode()
+
+
+def test_member_without_mood_has_null_current_mood() -> None:
+    member = TeamMember(id="m1", name="Alice", role="Dev", avatar_url=None, status="away")
+    payload = team_member_payload(member)
+    assert payload["currentMood"] is None
+    assert payload["moodHistory"] == []
+
+
+def test_payload_keys_match_model_aliases() -> None:
+    member = _member(datetime(2026, 2, 25, tzinfo=timezone.utc))
+    aliases = {f.alias for f in TeamMemberResponse.model_fields.values()}
+    assert set(team_member_payload(member)) == aliases
+    assert set(MEMBER_FIELD_ALIASES) == aliases
+
+
+def test_ndjson_lines(encoder: str) -> None:
+    body = serialization.ndjson_lines([{"id": "m1"}, {"id": "m2", "avatarUrl": None}])
+    assert body.endswith(b"\n")
+    assert [json.loads(line) for line in body.splitlines()] == [
+        {"id": "m1"},
+        {"id": "m2", "avatarUrl": None},
+    ]
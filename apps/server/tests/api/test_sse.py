@@ -0,0 +1,45 @@
+"""SSE framing — messages, heartbeats, resync and cleanup of the event stream."""
+
+import asyncio
+
+from src.api.v1.sse import HEARTBEAT, event_stream, sse_message
+from src.infrastructure.events.broker import EventBroker
+
+
+def _message(event: str) -> bytes:
+    return sse_message("mood", {"value": event}, id=event)
+
+
+def test_sse_message_format() -> None:
+    assert sse_message("mood", {"a": 1}, id="e1") == b'id: e1\nevent: mood\ndata: {"a":1}\n\n'
+    assert sse_message("resync", {"dropped": 2}) == b'event: resync\ndata: {"dropped":2}\n\n'
+
+
+class TestEventStream:
+    def test_relays_events_and_heartbeats(self) -> None:
+        async def main() -> None:
+            broker: EventBroker[str] = EventBroker(key=str)
+            stream = event_stream(broker, _message, heartbeat=0.01)
+            assert await anext(stream) == b"retry: 3000\n\n"
+            assert await anext(stream) == HEARTBEAT
+            broker.publish("e1")
+            assert await anext(stream) == _message("e1")
+            await stream.aclose()
+            assert broker.stats().subscribers == 0
+
+        asyncio.run(main())
+
+    def test_signals_resync_after_overflow(self) -> None:
+        async def main() -> None:
+            broker: EventBroker[str] = EventBroker(key=str, maxsize=1)
+            stream = event_stream(broker, _message, heartbeat=1)
+            await anext(stream)
+            first = asyncio.create_task(anext(stream))
+            await asyncio.sleep(0)  # let the stream subscribe and wait
+            broker.publish("e1")
+            broker.publish("e2")
+            assert await first == b'event: resync\ndata: {"dropped":1}\n\n'
+            assert await anext(stream) == _message("e2")
+            await stream.aclose()
+
+        asyncio.run(main())
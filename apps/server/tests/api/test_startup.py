@@ -0,0 +1,54 @@
+"""App startup: cold boots create the schema and seed, warm boots skip both."""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import src.api.startup as startup
+from src.api.main import app
+from src.infrastructure.database.connection import create_tables
+from src.infrastructure.database.repositories.team_repo import TeamRepository
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    monkeypatch.setattr(startup, "create_tables", lambda: create_tables(engine))
+    monkeypatch.setattr(startup, "SessionLocal", sessionmaker(bind=engine))
+    yield engine
+    engine.dispose()
+
+
+def _member_count(engine) -> int:
+    with sessionmaker(bind=engine)() as db:
+        return TeamRepository(db).count()
+
+
+class TestStartup:
+    def test_cold_then_warm_boot(self, engine) -> None:
+        cold = startup.run_startup()
+        assert cold.boot == "cold"
+        assert set(cold.seconds) == {"schema", "data", "warm_up", "total"}
+        assert _member_count(engine) == 8
+
+        warm = startup.run_startup()
+        assert warm.boot == "warm"
+        assert set(warm.seconds) == {"schema", "warm_up", "total"}
+        assert startup.startup_seconds.value("total", "warm") == warm.seconds["total"]
+
+    def test_seeding_can_be_turned_off(self, engine, monkeypatch) -> None:
+        monkeypatch.setattr(startup.settings, "seed_on_startup", False)
+        assert startup.run_startup().boot == "cold"
+        assert _member_count(engine) == 0
+
+    def test_health_reports_lifespan_startup(self, engine) -> None:
+        with TestClient(app) as client:
+            data = client.get("/health/startup").json()
+        assert data["boot"] == "cold"
+        assert data["seconds"]["total"] > 0
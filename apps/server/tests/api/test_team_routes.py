@@ -1,5 +1,7 @@
 """API route tests — verify camelCase JSON, status codes, and error handling."""
 
+import json
+
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
@@ -7,10 +9,19 @@ from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from src.api.main import app
-from src.api.v1.dependencies import get_db
+from src.api.v1.dependencies import (
+    get_background_runner,
+    get_db,
+    get_preferences_cache,
+    get_team_cache,
+)
 from src.infrastructure.database.connection import Base
+from src.infrastructure.database.query_metrics import query_budget
+from src.infrastructure.database.session_runner import SessionFactoryRunner
 
+import src.infrastructure.database.models.change_sequence_model  # noqa: F401
 import src.infrastructure.database.models.mood_entry_model  # noqa: F401
+import src.infrastructure.database.models.mood_rollup_model  # noqa: F401
 import src.infrastructure.database.models.preferences_model  # noqa: F401
 import src.infrastructure.database.models.team_member_model  # noqa: F401
 
@@ -40,11 +51,28 @@ def client(test_db: Session) -> TestClient:
         yield test_db
 
     app.dependency_overrides[get_db] = _override_db
+    # Streamed listings and background refreshes open their own sessions
+    sessions = SessionFactoryRunner(sessionmaker(bind=test_db.get_bind()))
+    app.dependency_overrides[get_background_runner] = lambda: sessions
+    # The process-wide cache would leak state between per-test databases
+    app.dependency_overrides[get_team_cache] = lambda: None
+    app.dependency_overrides[get_preferences_cache] = lambda: None
     c = TestClient(app)
     yield c
     app.dependency_overrides.clear()
 
 
+@pytest.fixture
+def budget(test_db: Session):
+    """`with budget(n):` fails if the block runs more than n statements, or
+    any one statement shape more than once (pass max_repeats to allow more)."""
+
+    def _budget(max_queries: int, max_repeats: int | None = 1):
+        return query_budget(test_db.get_bind(), max_queries, max_repeats)
+
+    return _budget
+
+
 class TestListTeamMembers:
     def test_returns_200_with_list(self, client: TestClient) -> None:
         resp = client.get("/api/v1/team")
@@ -54,7 +82,7 @@ class TestListTeamMembers:
         assert len(data) == 8
 
     def test_response_has_camel_case_keys(self, client: TestClient) -> None:
-        resp = client.get("/api/v1/team")
+        resp = client.get("/api/v1/team", params={"include": "history"})
         member = resp.json()[0]
         assert "avatarUrl" in member
         assert "currentMood" in member
@@ -75,9 +103,112 @@ class TestListTeamMembers:
     def test_member_has_expected_fields(self, client: TestClient) -> None:
         resp = client.get("/api/v1/team")
         member = resp.json()[0]
-        expected_keys = {"id", "name", "role", "avatarUrl", "status", "currentMood", "moodHistory"}
+        expected_keys = {"id", "name", "role", "avatarUrl", "status", "currentMood"}
         assert set(member.keys()) == expected_keys
 
+    def test_include_history_adds_mood_history(self, client: TestClient) -> None:
+        resp = client.get("/api/v1/team", params={"include": "history"})
+        member = resp.json()[0]
+        assert len(member["moodHistory"]) == 6
+        assert member["currentMood"] == member["moodHistory"][0]
+
+    def test_fields_selects_keys_and_always_keeps_id(self, client: TestClient) -> None:
+        resp = client.get("/api/v1/team", params={"fields": "name,currentMood"})
+        assert resp.status_code == 200
+        member = resp.json()[0]
+        assert set(member) == {"id", "name", "currentMood"}
+        assert member["currentMood"]["label"] == "Happy"
+
+    def test_fields_and_include_combine(self, client: TestClient) -> None:
+        resp = client.get("/api/v1/team", params={"fields": "id", "include": "history"})
+        assert set(resp.json()[0]) == {"id", "moodHistory"}
+
+    def test_returns_400_for_unknown_field(self, client: TestClient) -> None:
+        resp = client.get("/api/v1/team", params={"fields": "id,password"})
+        assert resp.status_code == 400
+        assert "password" in resp.json()["detail"]
+
+    def test_returns_400_for_unknown_include(self, client: TestClient) -> None:
+        resp = client.get("/api/v1/team", params={"include": "friends"})
+        assert resp.status_code == 400
+
+    def test_unpaginated_list_has_no_next_cursor(self, client: TestClient) -> None:
+        resp = client.get("/api/v1/team")
+        assert "x-next-cursor" not in resp.headers
+
+    def test_paginates_with_next_cursor(self, client: TestClient) -> None:
+        first = client.get("/api/v1/team", params={"limit": 5})
+        assert first.status_code == 200
+        page = first.json()
+        assert [m["id"] for m in page["items"]] == MEMBER_IDS[:5]
+        # Also in a header, for clients that read it
+        assert first.headers["x-next-cursor"] == page["nextCursor"]
+
+        rest = client.get("/api/v1/team", params={"limit": 5, "cursor": page["nextCursor"]})
+        assert [m["id"] for m in rest.json()["items"]] == MEMBER_IDS[5:]
+        assert rest.json()["nextCursor"] is None
+        assert "x-next-cursor" not in rest.headers
+
+    def test_cursor_without_limit_returns_page(self, client: TestClient) -> None:
+        cursor = client.get("/api/v1/team", params={"limit": 7}).json()["nextCursor"]
+        resp = client.get("/api/v1/team", params={"cursor": cursor})
+        assert resp.json() == {"items": [client.get("/api/v1/team").json()[7]], "nextCursor": None}
+
+    def test_history_limit_caps_mood_history(self, client: TestClient) -> None:
+        resp = client.get("/api/v1/team", params={"history_limit": 2})
+        for member in resp.json():
+            assert len(member["moodHistory"]) <= 2
+            assert member["currentMood"] == member["moodHistory"][0]
+
+    def test_history_limit_zero_still_returns_current_mood(self, client: TestClient) -> None:
+        resp = client.get("/api/v1/team", params={"history_limit": 0})
+        member = resp.json()[0]
+        assert member["moodHistory"] == []
+        assert member["currentMood"]["label"] == "Happy"
+
+    def test_returns_400_for_invalid_cursor(self, client: TestClient) -> None:
+        resp = client.get("/api/v1/team", params={"cursor": "garbage!"})
+        assert resp.status_code == 400
+
+    def test_returns_400_for_oversized_limit(self, client: TestClient) -> None:
+        resp = client.get("/api/v1/team", params={"limit": 10_000})
+        assert resp.status_code == 400
+
+
+class TestStreamTeamMembers:
+    def test_stream_lines_match_json_list(self, client: TestClient) -> None:
+        params = {"include": "history", "history_limit": 2}
+        resp = client.get("/api/v1/team", params={**params, "stream": 1})
+        assert resp.status_code == 200
+        assert resp.headers["content-type"] == "application/x-ndjson"
+        lines = resp.text.splitlines()
+        assert [json.loads(line) for line in lines] == client.get(
+            "/api/v1/team", params=params
+        ).json()
+
+    def test_accept_header_selects_stream(self, client: TestClient) -> None:
+        resp = client.get(
+            "/api/v1/team",
+            params={"fields": "id", "limit": 3},
+            headers={"Accept": "application/x-ndjson"},
+        )
+        assert resp.headers["content-type"] == "application/x-ndjson"
+        assert [json.loads(line) for line in resp.text.splitlines()] == [
+            {"id": member_id} for member_id in MEMBER_IDS[:3]
+        ]
+        # The end of the listing is unknown when headers are sent
+        assert "X-Next-Cursor" not in resp.headers
+
+    def test_stream_resumes_after_cursor(self, client: TestClient) -> None:
+        cursor = client.get("/api/v1/team", params={"limit": 5}).headers["X-Next-Cursor"]
+        resp = client.get("/api/v1/team", params={"stream": 1, "cursor": cursor})
+        assert [json.loads(line)["id"] for line in resp.text.splitlines()] == MEMBER_IDS[5:]
+
+    def test_invalid_params_fail_before_streaming(self, client: TestClient) -> None:
+        resp = client.get("/api/v1/team", params={"stream": 1, "limit": 0})
+        assert resp.status_code == 400
+        assert resp.headers["content-type"] == "application/json"
+
 
 class TestGetTeamMember:
     def test_returns_200_for_existing_member(self, client: TestClient) -> None:
@@ -95,11 +226,138 @@ class TestGetTeamMember:
         resp = client.get("/api/v1/team/bad@id")
         assert resp.status_code == 400
 
-    def test_includes_full_mood_history(self, client: TestClient) -> None:
-        resp = client.get(f"/api/v1/team/{MEMBER_IDS[0]}")
+    def test_includes_full_mood_history_on_request(self, client: TestClient) -> None:
+        resp = client.get(f"/api/v1/team/{MEMBER_IDS[0]}", params={"include": "history"})
         data = resp.json()
         assert len(data["moodHistory"]) == 6  # Sarah Chen has 6 mood entries
 
+    def test_omits_mood_history_by_default(self, client: TestClient) -> None:
+        data = client.get(f"/api/v1/team/{MEMBER_IDS[0]}").json()
+        assert "moodHistory" not in data
+        assert data["currentMood"]["label"] == "Happy"
+
+    def test_fields_projection(self, client: TestClient) -> None:
+        resp = client.get(f"/api/v1/team/{MEMBER_IDS[0]}", params={"fields": "name,avatarUrl"})
+        assert resp.json() == {
+            "id": MEMBER_IDS[0],
+            "name": "Sarah Chen",
+            "avatarUrl": resp.json()["avatarUrl"],
+        }
+
+
+class TestGetMoodHistory:
+    def test_returns_first_page_newest_first(self, client: TestClient) -> None:
+        resp = client.get(f"/api/v1/team/{MEMBER_IDS[0]}/moods", params={"limit": 4})
+        assert resp.status_code == 200
+        data = resp.json()
+        assert len(data["items"]) == 4
+        timestamps = [e["timestamp"] for e in data["items"]]
+        assert timestamps == sorted(timestamps, reverse=True)
+        assert data["nextCursor"] is not None
+
+    def test_walks_all_pages_without_overlap(self, client: TestClient) -> None:
+        seen: list[str] = []
+        cursor = None
+        while True:
+            params = {"limit": 4, **({"cursor": cursor} if cursor else {})}
+            data = client.get(f"/api/v1/team/{MEMBER_IDS[1]}/moods", params=params).json()
+            seen.extend(e["timestamp"] for e in data["items"])
+            cursor = data["nextCursor"]
+            if cursor is None:
+                break
+        assert len(seen) == 7  # Marcus Johnson has 7 mood entries
+        assert len(set(seen)) == 7
+
+    def test_filters_by_time_range(self, client: TestClient) -> None:
+        resp = client.get(
+            f"/api/v1/team/{MEMBER_IDS[0]}/moods",
+            params={"since": "2026-02-25T00:00:00Z", "until": "2026-02-26T00:00:00Z"},
+        )
+        labels = [e["label"] for e in resp.json()["items"]]
+        assert labels == ["Happy"]  # the entry 24h before BASE_TIME
+
+    def test_returns_404_for_nonexistent_member(self, client: TestClient) -> None:
+        resp = client.get("/api/v1/team/nonexistent/moods")
+        assert resp.status_code == 404
+
+    def test_returns_400_for_inverted_range(self, client: TestClient) -> None:
+        resp = client.get(
+            f"/api/v1/team/{MEMBER_IDS[0]}/moods",
+            params={"since": "2026-02-26T00:00:00Z", "until": "2026-02-25T00:00:00Z"},
+        )
+        assert resp.status_code == 400
+
+
+class TestMoodAnalytics:
+    PARAMS = {"since": "2026-02-20T00:00:00Z", "until": "2026-02-27T00:00:00Z"}
+
+    def test_returns_bucketed_counts(self, client: TestClient) -> None:
+        resp = client.get("/api/v1/team/analytics/moods", params=self.PARAMS)
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["bucket"] == "day"
+        assert data["since"] == "2026-02-20T00:00:00Z"
+        first = data["buckets"][0]
+        assert set(first) == {"start", "total", "counts"}
+        assert first["total"] == sum(first["counts"].values())
+        starts = [b["start"] for b in data["buckets"]]
+        assert starts == sorted(starts)
+
+    def test_whole_team_sums_every_entry_in_window(self, client: TestClient) -> None:
+        data = client.get(
+            "/api/v1/team/analytics/moods", params={**self.PARAMS, "bucket": "week"}
+        ).json()
+        history_total = 0
+        for member_id in MEMBER_IDS:
+            items = client.get(
+                f"/api/v1/team/{member_id}/moods", params={**self.PARAMS, "limit": 500}
+            ).json()["items"]
+            history_total += len(items)
+        assert sum(b["total"] for b in data["buckets"]) == history_total
+
+    def test_filters_by_status(self, client: TestClient) -> None:
+        everyone = client.get("/api/v1/team/analytics/moods", params=self.PARAMS).json()
+        offline = client.get(
+            "/api/v1/team/analytics/moods", params={**self.PARAMS, "status": "offline"}
+        ).json()
+        assert 0 < sum(b["total"] for b in offline["buckets"]) < sum(
+            b["total"] for b in everyone["buckets"]
+        )
+
+    def test_returns_400_for_unknown_bucket(self, client: TestClient) -> None:
+        resp = client.get("/api/v1/team/analytics/moods", params={"bucket": "minute"})
+        assert resp.status_code == 400
+
+
+class TestTeamChanges:
+    def test_first_sync_returns_everything(self, client: TestClient) -> None:
+        resp = client.get("/api/v1/team/changes")
+        assert resp.status_code == 200
+        data = resp.json()
+        assert set(data) == {"members", "moods", "nextCursor", "hasMore"}
+        assert sorted(m["id"] for m in data["members"]) == sorted(MEMBER_IDS)
+        assert "moodHistory" not in data["members"][0]
+        assert set(data["moods"][0]) == {"id", "memberId", "emoji", "label", "timestamp"}
+        assert data["hasMore"] is False
+
+    def test_resync_returns_only_new_writes(self, client: TestClient) -> None:
+        cursor = client.get("/api/v1/team/changes").json()["nextCursor"]
+        client.post(
+            f"/api/v1/team/{MEMBER_IDS[0]}/mood",
+            json={"emoji": "🎉", "label": "Celebrating"},
+        )
+
+        data = client.get("/api/v1/team/changes", params={"since": cursor}).json()
+        assert [m["id"] for m in data["members"]] == [MEMBER_IDS[0]]
+        assert data["members"][0]["currentMood"]["label"] == "Celebrating"
+        assert [(e["memberId"], e["label"]) for e in data["moods"]] == [
+            (MEMBER_IDS[0], "Celebrating")
+        ]
+
+    def test_returns_400_for_invalid_cursor(self, client: TestClient) -> None:
+        resp = client.get("/api/v1/team/changes", params={"since": "garbage"})
+        assert resp.status_code == 400
+
 
 class TestSubmitMood:
     def test_returns_201_on_success(self, client: TestClient) -> None:
@@ -118,7 +376,7 @@ class TestSubmitMood:
             f"/api/v1/team/{MEMBER_IDS[0]}/mood",
             json={"emoji": "🎉", "label": "Celebrating"},
         )
-        resp = client.get(f"/api/v1/team/{MEMBER_IDS[0]}")
+        resp = client.get(f"/api/v1/team/{MEMBER_IDS[0]}", params={"include": "history"})
         data = resp.json()
         assert data["currentMood"]["emoji"] == "🎉"
         assert len(data["moodHistory"]) == 7  # was 6, now 7
@@ -144,3 +402,73 @@ class TestSubmitMood:
             json={"emoji": "😊", "label": ""},
         )
         assert resp.status_code == 400
+
+
+class TestSubmitMoodsBatch:
+    def test_creates_valid_items_and_rejects_others(self, client: TestClient) -> None:
+        resp = client.post(
+            "/api/v1/team/moods:batch",
+            json=[
+                {"memberId": MEMBER_IDS[0], "emoji": "🎉", "label": "Celebrating"},
+                {"memberId": "nonexistent", "emoji": "😊", "label": "Happy"},
+                {"memberId": MEMBER_IDS[1], "emoji": "🔥", "label": ""},
+            ],
+        )
+        assert resp.status_code == 200
+        results = resp.json()
+        assert [r["status"] for r in results] == ["created", "rejected", "rejected"]
+        assert results[0]["entry"]["emoji"] == "🎉"
+        assert results[0]["error"] is None
+        assert "not found" in results[1]["error"]
+        assert results[2]["entry"] is None
+
+        member = client.get(f"/api/v1/team/{MEMBER_IDS[0]}").json()
+        assert member["currentMood"]["emoji"] == "🎉"
+
+    def test_empty_batch_returns_empty_list(self, client: TestClient) -> None:
+        resp = client.post("/api/v1/team/moods:batch", json=[])
+        assert resp.status_code == 200
+        assert resp.json() == []
+
+    def test_oversized_batch_returns_400(self, client: TestClient) -> None:
+        item = {"memberId": MEMBER_IDS[0], "emoji": "😊", "label": "Happy"}
+        resp = client.post("/api/v1/team/moods:batch", json=[item] * 501)
+        assert resp.status_code == 400
+
+
+class TestQueryBudgets:
+    """Statement counts per endpoint, independent of team size. A failure
+    here usually means a new lazy load or per-row query."""
+
+    @pytest.mark.parametrize(
+        ("path", "params", "max_queries", "max_repeats"),
+        [
+            ("/api/v1/team", {}, 1, 1),
+            ("/api/v1/team", {"include": "history"}, 1, 1),
+            ("/api/v1/team", {"limit": 3}, 1, 1),
+            ("/api/v1/team", {"stream": 1, "include": "history"}, 1, 1),
+            (f"/api/v1/team/{MEMBER_IDS[0]}", {}, 1, 1),
+            (f"/api/v1/team/{MEMBER_IDS[0]}", {"include": "history"}, 1, 1),
+            (f"/api/v1/team/{MEMBER_IDS[0]}/moods", {}, 2, 1),
+            # The partial first and last days each count raw entries with one shape
+            ("/api/v1/team/analytics/moods", {}, 3, 2),
+            ("/api/v1/team/changes", {}, 2, 1),
+        ],
+    )
+    def test_reads(self, client, budget, path, params, max_queries, max_repeats) -> None:
+        with budget(max_queries, max_repeats):
+            assert client.get(path, params=params).status_code == 200
+
+    def test_submit_mood(self, client: TestClient, budget) -> None:
+        with budget(4):
+            resp = client.post(
+                f"/api/v1/team/{MEMBER_IDS[0]}/mood",
+                json={"emoji": "🎉", "label": "Celebrating"},
+            )
+        assert resp.status_code == 201
+
+    def test_batch_does_not_scale_with_items(self, client: TestClient, budget) -> None:
+        items = [{"memberId": i, "emoji": "🎉", "label": "Celebrating"} for i in MEMBER_IDS]
+        with budget(5):
+            resp = client.post("/api/v1/team/moods:batch", json=items)
+        assert [r["status"] for r in resp.json()] == ["created"] * len(MEMBER_IDS)
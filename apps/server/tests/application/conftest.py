@@ -0,0 +1,21 @@
+"""Fixtures shared by the application service tests."""
+
+import pytest
+from sqlalchemy.orm import Session
+
+
+class CountingRunner:
+    """Runs use cases inline on the test session and counts round trips."""
+
+    def __init__(self, db: Session) -> None:
+        self._db = db
+        self.calls = 0
+
+    async def __call__(self, fn):
+        self.calls += 1
+        return fn(self._db)
+
+
+@pytest.fixture
+def run(db: Session) -> CountingRunner:
+    return CountingRunner(db)
@@ -0,0 +1,117 @@
+import asyncio
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from src.application.services.preferences_service import (
+    AsyncPreferencesService,
+    PreferencesService,
+)
+from src.infrastructure.cache.ttl_cache import TTLCache
+from src.infrastructure.database.repositories.preferences_repo import PreferencesRepository
+from tests.application.conftest import CountingRunner
+
+
+class TestPreferencesService:
+    def test_get_unknown_user_returns_defaults_without_writing(self, db: Session) -> None:
+        statements: list[str] = []
+        engine = db.get_bind()
+
+        def listener(conn, cursor, statement, *args) -> None:
+            statements.append(statement)
+
+        service = PreferencesService(PreferencesRepository(db))
+        event.listen(engine, "before_cursor_execute", listener)
+        try:
+            prefs = service.get_preferences("u1")
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+        assert prefs.username == "Guest"
+        assert prefs.created_at == prefs.updated_at
+        assert [s.split()[0] for s in statements] == ["SELECT"]
+        assert PreferencesRepository(db).get_by_user_id("u1") is None
+
+    def test_persist_defaults_stores_them_on_first_read(self, db: Session) -> None:
+        service = PreferencesService(PreferencesRepository(db), persist_defaults=True)
+
+        service.get_preferences("u1")
+        assert PreferencesRepository(db).get_by_user_id("u1") is not None
+
+    def test_update_creates_row_and_keeps_created_at(self, db: Session) -> None:
+        service = PreferencesService(PreferencesRepository(db))
+
+        created = service.update_preferences("u1", username=" Ada ")
+        updated = service.update_preferences("u1", dark_mode=True)
+        assert (updated.username, updated.dark_mode) == ("Ada", True)
+        assert updated.created_at == created.created_at
+        assert service.get_preferences("u1") == updated
+
+    def test_update_validates_username(self, db: Session) -> None:
+        service = PreferencesService(PreferencesRepository(db))
+        with pytest.raises(ValueError, match="must not be empty"):
+            service.update_preferences("u1", username="  ")
+
+
+class TestAsyncPreferencesServiceCache:
+    def test_unknown_user_is_cached_as_defaults(self, db: Session, run: CountingRunner) -> None:
+        cache: TTLCache = TTLCache(maxsize=16, ttl=60)
+        service = AsyncPreferencesService(run, cache=cache)
+
+        async def main() -> None:
+            for _ in range(3):
+                prefs = await service.get_preferences("u1")
+                assert prefs.username == "Guest"
+
+        asyncio.run(main())
+        assert run.calls == 1
+        assert cache.stats().hits == 2
+        assert PreferencesRepository(db).get_by_user_id("u1") is None
+
+    def test_update_evicts(self, run: CountingRunner) -> None:
+        service = AsyncPreferencesService(run, cache=TTLCache(maxsize=16, ttl=60))
+
+        async def main() -> None:
+            await service.get_preferences("u1")
+            await service.update_preferences("u1", username="Ada")
+            assert (await service.get_preferences("u1")).username == "Ada"
+            assert (await service.get_preferences("u1")).username == "Ada"
+
+        asyncio.run(main())
+        assert run.calls == 3
+
+    def test_out_of_order_updates_do_not_cache_the_older_row(self, db: Session) -> None:
+        newer_returned = asyncio.Event()
+        calls = 0
+
+        async def run(fn):
+            # Commits in call order, but the first call returns last
+            nonlocal calls
+            calls += 1
+            result = fn(db)
+            if calls == 1:
+                await newer_returned.wait()
+            return result
+
+        service = AsyncPreferencesService(run, cache=TTLCache(maxsize=16, ttl=60))
+
+        async def newer() -> None:
+            await service.update_preferences("u1", username="Bob")
+            newer_returned.set()
+
+        async def main() -> None:
+            await asyncio.gather(service.update_preferences("u1", username="Ada"), newer())
+            assert (await service.get_preferences("u1")).username == "Bob"
+
+        asyncio.run(main())
+
+    def test_delete_evicts(self, run: CountingRunner) -> None:
+        service = AsyncPreferencesService(run, cache=TTLCache(maxsize=16, ttl=60))
+
+        async def main() -> None:
+            await service.update_preferences("u1", username="Ada")
+            assert await service.delete_preferences("u1")
+            assert (await service.get_preferences("u1")).username == "Guest"
+
+        asyncio.run(main())
+        assert run.calls == 3
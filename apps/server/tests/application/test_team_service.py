@@ -1,12 +1,21 @@
+import asyncio
 from datetime import datetime, timezone
+from pathlib import Path
 
 import pytest
-from sqlalchemy.orm import Session
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool
 
-from src.application.services.team_service import TeamService
+from src.application.services.team_service import AsyncTeamService, TeamService
 from src.domain.models.mood_entry import MoodEntry
 from src.domain.models.team_member import TeamMember
+from src.infrastructure.cache.ttl_cache import TTLCache
+from src.infrastructure.database.connection import Base
 from src.infrastructure.database.repositories.team_repo import TeamRepository
+from src.infrastructure.database.session_runner import SessionFactoryRunner
+from src.infrastructure.events.broker import EventBroker
+from tests.application.conftest import CountingRunner
 
 
 def _seed_member(db: Session, member_id: str = "m1") -> None:
@@ -38,6 +47,47 @@ class TestTeamService:
         members = service.get_all_members()
         assert len(members) == 2
 
+    def test_get_members_page_returns_next_cursor(self, db: Session) -> None:
+        for member_id in ("m1", "m2", "m3"):
+            _seed_member(db, member_id)
+        service = TeamService(TeamRepository(db))
+
+        first = service.get_members_page(limit=2)
+        assert [m.id for m in first.items] == ["m1", "m2"]
+        assert first.next_cursor is not None
+
+        last = service.get_members_page(cursor=first.next_cursor, limit=2)
+        assert [m.id for m in last.items] == ["m3"]
+        assert last.next_cursor is None
+
+    def test_get_members_page_without_limit_returns_all(self, db: Session) -> None:
+        _seed_member(db, "m1")
+        _seed_member(db, "m2")
+        service = TeamService(TeamRepository(db))
+
+        page = service.get_members_page()
+        assert len(page.items) == 2
+        assert page.next_cursor is None
+
+    def test_get_members_page_invalid_cursor_raises(self, db: Session) -> None:
+        service = TeamService(TeamRepository(db))
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            service.get_members_page(cursor="%%%")
+
+    def test_iter_members_follows_cursor_and_limit(self, db: Session) -> None:
+        for member_id in ("m1", "m2", "m3", "m4"):
+            _seed_member(db, member_id)
+        service = TeamService(TeamRepository(db))
+        cursor = service.get_members_page(limit=1).next_cursor
+
+        members = service.iter_members(cursor=cursor, limit=2, yield_per=1)
+        assert [m.id for m in members] == ["m2", "m3"]
+
+    def test_iter_members_validates_before_reading(self, db: Session) -> None:
+        service = TeamService(TeamRepository(db))
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            service.iter_members(cursor="%%%")
+
     def test_get_member_found(self, db: Session) -> None:
         _seed_member(db, "m1")
         service = TeamService(TeamRepository(db))
@@ -46,6 +96,24 @@ class TestTeamService:
         assert member is not None
         assert member.name == "Test User"
 
+    def test_get_member_loads_only_selected_fields(self, db: Session) -> None:
+        _seed_member(db, "m1")
+        service = TeamService(TeamRepository(db))
+
+        member = service.get_member("m1", fields={"name", "current_mood"})
+        assert member is not None
+        assert member.mood_entries == []
+        assert member.current_mood is not None
+        full = service.get_member("m1")
+        assert full is not None and len(full.mood_entries) == 1
+
+    def test_get_members_page_without_history(self, db: Session) -> None:
+        _seed_member(db, "m1")
+        service = TeamService(TeamRepository(db))
+
+        page = service.get_members_page(history_limit=5, fields={"name"})
+        assert page.items[0].mood_entries == []
+
     def test_get_member_not_found(self, db: Session) -> None:
         service = TeamService(TeamRepository(db))
         assert service.get_member("nonexistent") is None
@@ -91,3 +159,194 @@ class TestTeamService:
         assert member.current_mood is not None
         assert member.current_mood.emoji == "🔥"
         assert len(member.mood_entries) == 2
+
+    def test_submit_moods_reports_per_item_results(self, db: Session) -> None:
+        _seed_member(db, "m1")
+        _seed_member(db, "m2")
+        service = TeamService(TeamRepository(db))
+
+        results = service.submit_moods(
+            [
+                ("m1", "🎉", "Celebrating"),
+                ("ghost", "😊", "Happy"),
+                ("m2", "x" * 11, "Happy"),
+                ("m2", "🔥", "Fired Up"),
+            ]
+        )
+        assert [r.status for r in results] == ["created", "rejected", "rejected", "created"]
+        assert results[1].error is not None and "not found" in results[1].error
+        assert results[2].error is not None and "10 characters" in results[2].error
+        member = service.get_member("m1")
+        assert member is not None
+        assert len(member.mood_entries) == 2
+
+    def test_submit_moods_rejects_oversized_batch(self, db: Session) -> None:
+        service = TeamService(TeamRepository(db))
+        with pytest.raises(ValueError, match="500 items or fewer"):
+            service.submit_moods([("m1", "😊", "Happy")] * 501)
+
+
+class TestChanges:
+    def test_full_sync_then_delta(self, db: Session) -> None:
+        _seed_member(db, "m1")
+        _seed_member(db, "m2")
+        service = TeamService(TeamRepository(db))
+
+        full = service.get_changes()
+        assert [m.id for m in full.members] == ["m1", "m2"]
+        assert [e.id for e in full.moods] == ["m1-e1", "m2-e1"]
+        assert not full.has_more
+
+        entry = service.submit_mood("m2", "🔥", "Fired Up")
+        delta = service.get_changes(full.next_cursor)
+        assert [m.id for m in delta.members] == ["m2"]
+        assert [e.id for e in delta.moods] == [entry.id]
+
+        idle = service.get_changes(delta.next_cursor)
+        assert idle.members == [] and idle.moods == []
+        assert idle.next_cursor == delta.next_cursor
+
+    def test_limit_pages_through_changes(self, db: Session) -> None:
+        for member_id in ("m1", "m2", "m3"):
+            _seed_member(db, member_id)
+        service = TeamService(TeamRepository(db))
+
+        first = service.get_changes(limit=2)
+        assert first.has_more
+        rest = service.get_changes(first.next_cursor, limit=2)
+        assert not rest.has_more
+        assert [m.id for m in first.members + rest.members] == ["m1", "m2", "m3"]
+
+    @pytest.mark.parametrize("cursor", ["%%%", "WyJ4IiwiYSIsIjAiLCIiXQ"])
+    def test_invalid_cursor_raises(self, db: Session, cursor: str) -> None:
+        service = TeamService(TeamRepository(db))
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            service.get_changes(cursor)
+
+
+class TestMoodDistribution:
+    def test_resolves_window_and_counts(self, db: Session) -> None:
+        _seed_member(db, "m1")
+        service = TeamService(TeamRepository(db))
+
+        result = service.get_mood_distribution(
+            "DAY", since=datetime(2026, 2, 20), until=datetime(2026, 2, 27)
+        )
+        assert result.bucket == "day"
+        assert result.since == datetime(2026, 2, 20, tzinfo=timezone.utc)
+        assert [b.counts for b in result.buckets] == [{"Happy": 1}]
+
+    def test_rejects_unknown_status(self, db: Session) -> None:
+        service = TeamService(TeamRepository(db))
+        with pytest.raises(ValueError, match="Status must be one of"):
+            service.get_mood_distribution(status="busy")
+
+
+class TestAsyncTeamServiceCache:
+    def test_member_reads_are_served_from_cache(self, db: Session, run: CountingRunner) -> None:
+        _seed_member(db, "m1")
+        service = AsyncTeamService(run, TTLCache(maxsize=16, ttl=60))
+
+        async def main() -> None:
+            first = await service.get_member("m1")
+            second = await service.get_member(" m1 ")
+            assert first is second
+
+        asyncio.run(main())
+        assert run.calls == 1
+
+    def test_submit_mood_invalidates_member_and_lists(
+        self, db: Session, run: CountingRunner
+    ) -> None:
+        _seed_member(db, "m1")
+        cache: TTLCache = TTLCache(maxsize=16, ttl=60)
+        service = AsyncTeamService(run, cache)
+
+        async def main() -> None:
+            await service.get_members_page()
+            await service.get_member("m1")
+            await service.submit_mood("m1", "🔥", "Fired Up")
+            assert cache.stats().size == 0
+            member = await service.get_member("m1")
+            assert member is not None
+            assert member.current_mood is not None
+            assert member.current_mood.emoji == "🔥"
+
+        asyncio.run(main())
+
+    def test_submit_mood_invalidates_analytics(self, db: Session, run: CountingRunner) -> None:
+        _seed_member(db, "m1")
+        cache: TTLCache = TTLCache(maxsize=16, ttl=60)
+        service = AsyncTeamService(run, cache)
+
+        async def main() -> None:
+            await service.get_mood_distribution("week")
+            assert cache.stats().size == 1
+            await service.submit_mood("m1", "🔥", "Fired Up")
+            assert cache.stats().size == 0
+            result = await service.get_mood_distribution("week")
+            assert sum(b.total for b in result.buckets) == 1
+
+        asyncio.run(main())
+
+
+class TestAsyncTeamServiceStream:
+    def test_streams_batches_one_runner_call_each(self, db: Session, run: CountingRunner) -> None:
+        for member_id in ("m1", "m2", "m3"):
+            _seed_member(db, member_id)
+        service = AsyncTeamService(run, TTLCache(maxsize=16, ttl=60))
+
+        async def main() -> list[list[str]]:
+            batches = await service.stream_members(batch_size=2)
+            return [[m.id for m in batch] async for batch in batches]
+
+        assert asyncio.run(main()) == [["m1", "m2"], ["m3"]]
+        # Open the cursor, two batches, then the empty read that ends it
+        assert run.calls == 4
+
+    def test_streams_on_its_own_session_and_closes_it(
+        self, tmp_path: Path, run: CountingRunner
+    ) -> None:
+        engine = create_engine(f"sqlite:///{tmp_path / 'team.db'}", poolclass=QueuePool)
+        Base.metadata.create_all(engine)
+        factory = sessionmaker(bind=engine)
+        with factory() as db:
+            for member_id in ("m1", "m2", "m3"):
+                _seed_member(db, member_id)
+        service = AsyncTeamService(run, sessions=SessionFactoryRunner(factory))
+
+        async def main() -> list[str]:
+            batches = await service.stream_members(batch_size=2)
+            # The request's session may already be closed while streaming
+            ids = [m.id async for batch in batches for m in batch]
+            assert engine.pool.checkedout() == 0
+            return ids
+
+        assert asyncio.run(main()) == ["m1", "m2", "m3"]
+        assert run.calls == 0
+        engine.dispose()
+
+    def test_invalid_arguments_raise_before_streaming(self, run: CountingRunner) -> None:
+        service = AsyncTeamService(run)
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            asyncio.run(service.stream_members(cursor="%%%"))
+
+
+class TestAsyncTeamServiceEvents:
+    def test_publishes_committed_moods(self, db: Session, run: CountingRunner) -> None:
+        _seed_member(db, "m1")
+        events: EventBroker[MoodEntry] = EventBroker(key=lambda e: e.member_id)
+        service = AsyncTeamService(run, events=events)
+
+        async def main() -> None:
+            with events.subscribe() as sub:
+                entry = await service.submit_mood("m1", "🔥", "Fired Up")
+                await service.submit_moods([("m1", "😊", "Happy"), ("ghost", "😊", "Happy")])
+                with pytest.raises(ValueError):
+                    await service.submit_mood("ghost", "😊", "Happy")
+                batch = await sub.next_batch(timeout=1)
+                # Both m1 events coalesce; rejected items publish nothing
+                assert [e.label for e in batch] == ["Happy"]
+                assert batch[0].id != entry.id
+
+        asyncio.run(main())
@@ -0,0 +1,153 @@
+"""Load-test harness — report math, run comparison, and the app contract."""
+
+import asyncio
+import random
+from collections.abc import Awaitable, Callable
+
+import httpx
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from benchmarks.loadtest import (
+    ENDPOINTS,
+    Workload,
+    _member_ids,
+    build_report,
+    compare_reports,
+    parse_mix,
+    percentile,
+    Samples,
+)
+from src.api.main import app
+from src.api.v1.dependencies import (
+    get_background_runner,
+    get_db,
+    get_preferences_cache,
+    get_team_cache,
+)
+from src.infrastructure.database.connection import Base
+from src.infrastructure.database.session_runner import SessionFactoryRunner
+from src.seeds.team_seed import seed_team_data, MEMBER_IDS
+
+
+class TestPercentile:
+    def test_nearest_rank(self) -> None:
+        values = [float(v) for v in range(1, 101)]
+        assert percentile(values, 50) == 50.0
+        assert percentile(values, 95) == 95.0
+        assert percentile(values, 99) == 99.0
+
+    def test_small_and_empty(self) -> None:
+        assert percentile([3.0], 99) == 3.0
+        assert percentile([], 50) == 0.0
+
+
+class TestParseMix:
+    def test_weights(self) -> None:
+        assert parse_mix("team_list=3,member_get") == {"team_list": 3.0, "member_get": 1.0}
+
+    def test_rejects_unknown_endpoint(self) -> None:
+        with pytest.raises(ValueError, match="Unknown endpoint"):
+            parse_mix("team_list=1,nope=2")
+
+    def test_rejects_all_zero(self) -> None:
+        with pytest.raises(ValueError, match="positive weight"):
+            parse_mix("team_list=0")
+
+
+def _report(latency_s: float, count: int, errors: int = 0) -> dict:
+    samples = Samples()
+    for i in range(count):
+        samples.record("member_get", latency_s, ok=i >= errors)
+    return build_report(samples, duration=1.0, meta={})
+
+
+class TestBuildReport:
+    def test_per_endpoint_and_total(self) -> None:
+        report = _report(0.010, 20, errors=2)
+        ep = report["endpoints"]["member_get"]
+        assert ep["requests"] == 20
+        assert ep["errors"] == 2
+        assert ep["rps"] == 20.0
+        assert ep["latency_ms"]["p95"] == 10.0
+        assert report["total"]["requests"] == 20
+
+
+class TestCompareReports:
+    def test_no_regression_within_threshold(self) -> None:
+        result = compare_reports(_report(0.010, 100), _report(0.0105, 100), threshold=0.10)
+        assert result["regressions"] == []
+        assert result["endpoints"]["member_get"]["p95_ms"]["change"] == pytest.approx(0.05)
+
+    def test_flags_latency_and_throughput(self) -> None:
+        result = compare_reports(_report(0.010, 100), _report(0.020, 50), threshold=0.10)
+        assert "member_get.p95_ms +100.0%" in result["regressions"]
+        assert "member_get.rps -50.0%" in result["regressions"]
+
+    def test_flags_new_errors(self) -> None:
+        result = compare_reports(_report(0.010, 100), _report(0.010, 100, errors=1), threshold=0.10)
+        assert result["regressions"] == ["member_get.errors 0 -> 1"]
+
+
+def _run_against_app(test: Callable[[httpx.AsyncClient], Awaitable[None]]) -> None:
+    """Run `test` with a client on the in-process app over a seeded database."""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    TestSession = sessionmaker(bind=engine)
+    with TestSession() as session:
+        seed_team_data(session)
+
+    def _override_db():
+        with TestSession() as session:
+            yield session
+
+    sessions = SessionFactoryRunner(TestSession)
+    app.dependency_overrides[get_db] = _override_db
+    app.dependency_overrides[get_background_runner] = lambda: sessions
+    app.dependency_overrides[get_team_cache] = lambda: None
+    app.dependency_overrides[get_preferences_cache] = lambda: None
+
+    async def main() -> None:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            await test(client)
+
+    try:
+        asyncio.run(main())
+    finally:
+        app.dependency_overrides.clear()
+        engine.dispose()
+
+
+class TestAgainstApp:
+    def test_member_ids_reads_the_team_page(self) -> None:
+        async def check(client: httpx.AsyncClient) -> None:
+            assert await _member_ids(client) == MEMBER_IDS
+            assert await _member_ids(client, limit=3) == MEMBER_IDS[:3]
+
+        _run_against_app(check)
+
+    def test_every_endpoint_succeeds(self) -> None:
+        async def check(client: httpx.AsyncClient) -> None:
+            workload = Workload(
+                client, await _member_ids(client), ["u1"], "", random.Random(0)
+            )
+            for name in ENDPOINTS:
+                resp = await getattr(workload, name)()
+                assert resp.is_success, (name, resp.status_code, resp.text)
+
+        _run_against_app(check)
+
+    def test_preferences_put_changes_dark_mode(self) -> None:
+        async def check(client: httpx.AsyncClient) -> None:
+            workload = Workload(client, [], ["u1"], "", random.Random(0))
+            responses = [await workload.preferences_put() for _ in range(8)]
+            assert {r.json()["dark_mode"] for r in responses} == {False, True}
+
+        _run_against_app(check)
@@ -7,7 +7,9 @@ from sqlalchemy.orm import Session, sessionmaker
 from src.infrastructure.database.connection import Base
 
 # Import all models so they register with Base
+import src.infrastructure.database.models.change_sequence_model  # noqa: F401
 import src.infrastructure.database.models.mood_entry_model  # noqa: F401
+import src.infrastructure.database.models.mood_rollup_model  # noqa: F401
 import src.infrastructure.database.models.preferences_model  # noqa: F401
 import src.infrastructure.database.models.team_member_model  # noqa: F401
 
@@ -0,0 +1,51 @@
+import pytest
+
+from src.domain.services.pagination import (
+    MAX_PAGE_LIMIT,
+    decode_cursor,
+    encode_cursor,
+    validate_history_limit,
+    validate_page_limit,
+)
+
+
+class TestCursor:
+    def test_round_trip(self) -> None:
+        cursor = encode_cursor("tm-1", "2026-02-26T10:00:00")
+        assert decode_cursor(cursor, 2) == ["tm-1", "2026-02-26T10:00:00"]
+
+    def test_cursor_is_url_safe(self) -> None:
+        cursor = encode_cursor("a/b+c?d")
+        assert "=" not in cursor
+        assert "/" not in cursor
+        assert "+" not in cursor
+
+    def test_garbage_raises(self) -> None:
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            decode_cursor("not a cursor!", 1)
+
+    def test_wrong_arity_raises(self) -> None:
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            decode_cursor(encode_cursor("a", "b"), 1)
+
+
+class TestValidatePageLimit:
+    def test_valid_limit(self) -> None:
+        assert validate_page_limit(20) == 20
+
+    def test_zero_raises(self) -> None:
+        with pytest.raises(ValueError, match="at least 1"):
+            validate_page_limit(0)
+
+    def test_too_large_raises(self) -> None:
+        with pytest.raises(ValueError, match=f"{MAX_PAGE_LIMIT} or fewer"):
+            validate_page_limit(MAX_PAGE_LIMIT + 1)
+
+
+class TestValidateHistoryLimit:
+    def test_zero_is_valid(self) -> None:
+        assert validate_history_limit(0) == 0
+
+    def test_negative_raises(self) -> None:
+        with pytest.raises(ValueError, match="must not be negative"):
+            validate_history_limit(-1)
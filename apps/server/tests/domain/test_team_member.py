@@ -1,5 +1,8 @@
+from dataclasses import FrozenInstanceError
 from datetime import datetime, timezone
 
+import pytest
+
 from src.domain.models.mood_entry import MoodEntry, create_mood_entry
 from src.domain.models.team_member import TeamMember, create_team_member
 
@@ -18,6 +21,11 @@ class TestTeamMemberDataclass:
         member = TeamMember(id="m1", name="Test", role="Dev", status="active")
         assert member.current_mood is None
 
+    def test_current_mood_falls_back_to_latest_mood(self) -> None:
+        latest = MoodEntry(id="9", member_id="m1", emoji="a", label="A", timestamp=datetime(2026, 1, 3, tzinfo=timezone.utc))
+        member = TeamMember(id="m1", name="Test", role="Dev", status="active", latest_mood=latest)
+        assert member.current_mood is latest
+
     def test_mood_history_is_alias_for_mood_entries(self) -> None:
         entries = [
             MoodEntry(id="1", member_id="m1", emoji="a", label="A", timestamp=datetime(2026, 1, 1, tzinfo=timezone.utc)),
@@ -33,6 +41,14 @@ class TestTeamMemberDataclass:
         member = TeamMember(id="m1", name="Test", role="Dev", status="active")
         assert member.avatar_url is None
 
+    def test_is_frozen_and_slotted(self) -> None:
+        member = TeamMember(id="m1", name="Test", role="Dev", status="active")
+        with pytest.raises(FrozenInstanceError):
+            member.name = "Other"  # type: ignore[misc]
+        assert not hasattr(member, "__dict__")
+        entry = create_mood_entry("m1", "a", "A")
+        assert not hasattr(entry, "__dict__")
+
 
 class TestCreateTeamMember:
     def test_factory_generates_uuid_id(self) -> None:
@@ -1,10 +1,17 @@
+from datetime import datetime, timedelta, timezone
+
 import pytest
 
 from src.domain.services.team_validation import (
+    validate_analytics_window,
+    validate_bucket,
+    validate_member_fields,
     validate_member_id,
     validate_mood_emoji,
     validate_mood_label,
+    validate_role,
     validate_status,
+    validate_time_range,
 )
 
 
@@ -78,3 +85,70 @@ class TestValidateStatus:
     def test_invalid_raises(self) -> None:
         with pytest.raises(ValueError, match="must be one of"):
             validate_status("busy")
+
+
+class TestValidateTimeRange:
+    def test_open_range(self) -> None:
+        assert validate_time_range(None, None) == (None, None)
+
+    def test_normalizes_to_utc(self) -> None:
+        plus_two = timezone(timedelta(hours=2))
+        since, _ = validate_time_range(datetime(2026, 1, 1, 12, 0, tzinfo=plus_two), None)
+        assert since == datetime(2026, 1, 1, 10, 0, tzinfo=timezone.utc)
+
+    def test_naive_is_treated_as_utc(self) -> None:
+        since, _ = validate_time_range(datetime(2026, 1, 1), None)
+        assert since is not None
+        assert since.tzinfo is timezone.utc
+
+    def test_inverted_range_raises(self) -> None:
+        with pytest.raises(ValueError, match="must not be after"):
+            validate_time_range(datetime(2026, 1, 2), datetime(2026, 1, 1))
+
+
+class TestValidateRole:
+    def test_strips(self) -> None:
+        assert validate_role("  QA Engineer ") == "QA Engineer"
+
+    def test_empty_raises(self) -> None:
+        with pytest.raises(ValueError, match="must not be empty"):
+            validate_role("   ")
+
+
+class TestValidateMemberFields:
+    def test_always_includes_id(self) -> None:
+        assert validate_member_fields(["name"]) == {"id", "name"}
+
+    def test_unknown_field_raises(self) -> None:
+        with pytest.raises(ValueError, match="Unknown field"):
+            validate_member_fields(["name", "moodHistory"])
+
+
+class TestValidateBucket:
+    def test_normalizes_case(self) -> None:
+        assert validate_bucket(" Week ") == "week"
+
+    def test_unknown_bucket_raises(self) -> None:
+        with pytest.raises(ValueError, match="Bucket must be one of"):
+            validate_bucket("minute")
+
+
+class TestValidateAnalyticsWindow:
+    NOW = datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc)
+
+    def test_defaults_end_at_now(self) -> None:
+        since, until = validate_analytics_window("day", None, None, self.NOW)
+        assert until == self.NOW
+        assert since == self.NOW - timedelta(days=7)
+
+    def test_default_window_follows_bucket(self) -> None:
+        since, _ = validate_analytics_window("hour", None, None, self.NOW)
+        assert since == self.NOW - timedelta(hours=24)
+
+    def test_too_many_buckets_raises(self) -> None:
+        with pytest.raises(ValueError, match="more than 1000 hour buckets"):
+            validate_analytics_window("hour", datetime(2020, 1, 1), None, self.NOW)
+
+    def test_since_after_default_until_raises(self) -> None:
+        with pytest.raises(ValueError, match="must not be after"):
+            validate_analytics_window("day", datetime(2027, 1, 1), None, self.NOW)
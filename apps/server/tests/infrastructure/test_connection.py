@@ -0,0 +1,119 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, event, inspect, text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool
+
+from src.config.database_profiles import DATABASE_PROFILES, DatabaseProfile
+from src.config.settings import Settings
+from src.infrastructure.database.connection import (
+    create_tables,
+    engine_options,
+    install_sqlite_pragmas,
+    sqlite_pragmas,
+)
+
+
+def _pragma(conn, name: str):
+    return conn.execute(text(f"PRAGMA {name}")).scalar()
+
+
+class TestSqlitePragmas:
+    def test_production_profile_applied_on_connect(self, tmp_path: Path) -> None:
+        engine = create_engine(f"sqlite:///{tmp_path / 'prod.db'}")
+        install_sqlite_pragmas(engine, DATABASE_PROFILES["production"])
+
+        with engine.connect() as conn:
+            assert _pragma(conn, "journal_mode") == "wal"
+            assert _pragma(conn, "synchronous") == 1  # NORMAL
+            assert _pragma(conn, "cache_size") == -64_000
+            assert _pragma(conn, "temp_store") == 2  # MEMORY
+            assert _pragma(conn, "busy_timeout") == 5_000
+            assert _pragma(conn, "foreign_keys") == 1
+        engine.dispose()
+
+    def test_applied_through_async_engine(self, tmp_path: Path) -> None:
+        pytest.importorskip("aiosqlite")
+
+        async def main() -> str:
+            engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'async.db'}")
+            install_sqlite_pragmas(engine.sync_engine, DATABASE_PROFILES["dev"])
+            async with engine.connect() as conn:
+                mode = (await conn.execute(text("PRAGMA journal_mode"))).scalar()
+            await engine.dispose()
+            return mode
+
+        assert asyncio.run(main()) == "wal"
+
+    def test_empty_profile_issues_no_pragmas(self) -> None:
+        assert sqlite_pragmas(DatabaseProfile()) == []
+
+    def test_rejects_injected_values(self) -> None:
+        with pytest.raises(ValueError, match="Invalid SQLite pragma value"):
+            sqlite_pragmas(DatabaseProfile(journal_mode="WAL; DROP TABLE x"))
+
+
+class TestEngineOptions:
+    def test_sqlite_gets_check_same_thread(self) -> None:
+        options = engine_options("sqlite:///x.db", DatabaseProfile())
+        assert options["connect_args"] == {"check_same_thread": False}
+
+    def test_queue_pool_settings(self) -> None:
+        options = engine_options("sqlite:///x.db", DATABASE_PROFILES["production"])
+        assert options["poolclass"] is QueuePool
+        assert options["pool_size"] == 10
+        assert options["max_overflow"] == 20
+        assert options["pool_pre_ping"] is True
+
+    def test_async_queue_pool_is_adapted(self) -> None:
+        options = engine_options(
+            "sqlite+aiosqlite:///x.db", DATABASE_PROFILES["production"], is_async=True
+        )
+        assert options["poolclass"] is AsyncAdaptedQueuePool
+
+    def test_null_pool(self) -> None:
+        options = engine_options("sqlite:///x.db", DatabaseProfile(pool_class="null"))
+        assert options["poolclass"] is NullPool
+
+    def test_unknown_pool_class_raises(self) -> None:
+        with pytest.raises(ValueError, match="Pool class must be one of"):
+            engine_options("sqlite:///x.db", DatabaseProfile(pool_class="bogus"))
+
+
+class TestDatabaseProfileSetting:
+    def test_overrides_replace_preset_fields(self) -> None:
+        profile = Settings(db_profile="production", sqlite_cache_size=-1_000).database_profile
+        assert profile.cache_size == -1_000
+        assert profile.journal_mode == "WAL"
+
+    def test_unknown_profile_raises(self) -> None:
+        with pytest.raises(ValueError, match="DB_PROFILE must be one of"):
+            Settings(db_profile="turbo").database_profile
+
+
+class TestCreateTables:
+    def test_warm_call_runs_no_ddl(self, tmp_path: Path) -> None:
+        engine = create_engine(f"sqlite:///{tmp_path / 'app.db'}")
+        assert create_tables(engine) is True
+
+        statements: list[str] = []
+        event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+        assert create_tables(engine) is False
+        assert not any(s.lstrip().upper().startswith("CREATE") for s in statements)
+        engine.dispose()
+
+    def test_stale_version_reapplies_missing_indexes(self, tmp_path: Path) -> None:
+        engine = create_engine(f"sqlite:///{tmp_path / 'app.db'}")
+        create_tables(engine)
+        with engine.begin() as conn:
+            conn.execute(text("DROP INDEX ix_mood_entries_change_seq"))
+            conn.execute(text("UPDATE schema_version SET version = 'old'"))
+
+        assert create_tables(engine) is True
+        with engine.connect() as conn:
+            indexes = {i["name"] for i in inspect(conn).get_indexes("mood_entries")}
+        assert "ix_mood_entries_change_seq" in indexes
+        assert create_tables(engine) is False
+        engine.dispose()
@@ -0,0 +1,70 @@
+import asyncio
+
+from src.infrastructure.events.broker import EventBroker
+
+
+def _broker(maxsize: int = 8) -> EventBroker[tuple[str, int]]:
+    return EventBroker(key=lambda event: event[0], maxsize=maxsize)
+
+
+class TestEventBroker:
+    def test_fans_out_to_every_subscriber(self) -> None:
+        async def main() -> None:
+            broker = _broker()
+            with broker.subscribe() as a, broker.subscribe() as b:
+                broker.publish(("m1", 1))
+                assert await a.next_batch(timeout=1) == [("m1", 1)]
+                assert await b.next_batch(timeout=1) == [("m1", 1)]
+
+        asyncio.run(main())
+
+    def test_wakes_a_waiting_subscriber(self) -> None:
+        async def main() -> None:
+            broker = _broker()
+            with broker.subscribe() as sub:
+                waiter = asyncio.create_task(sub.next_batch(timeout=1))
+                await asyncio.sleep(0)
+                broker.publish(("m1", 1))
+                assert await waiter == [("m1", 1)]
+
+        asyncio.run(main())
+
+    def test_times_out_with_empty_batch(self) -> None:
+        async def main() -> None:
+            with _broker().subscribe() as sub:
+                assert await sub.next_batch(timeout=0.01) == []
+
+        asyncio.run(main())
+
+    def test_coalesces_pending_events_per_key(self) -> None:
+        async def main() -> None:
+            broker = _broker()
+            with broker.subscribe() as sub:
+                for event in [("m1", 1), ("m2", 1), ("m1", 2)]:
+                    broker.publish(event)
+                assert await sub.next_batch(timeout=1) == [("m2", 1), ("m1", 2)]
+                assert sub.take_dropped() == 0
+            assert broker.stats().coalesced == 1
+
+        asyncio.run(main())
+
+    def test_drops_oldest_when_full(self) -> None:
+        async def main() -> None:
+            broker = _broker(maxsize=2)
+            with broker.subscribe() as sub:
+                for member in ["m1", "m2", "m3"]:
+                    broker.publish((member, 1))
+                assert await sub.next_batch(timeout=1) == [("m2", 1), ("m3", 1)]
+                assert sub.take_dropped() == 1
+                assert sub.take_dropped() == 0
+            assert broker.stats().dropped == 1
+
+        asyncio.run(main())
+
+    def test_closing_unsubscribes(self) -> None:
+        broker = _broker()
+        with broker.subscribe():
+            assert broker.stats().subscribers == 1
+        assert broker.stats().subscribers == 0
+        broker.publish(("m1", 1))
+        assert broker.stats().published == 1
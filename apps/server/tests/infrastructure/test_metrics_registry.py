@@ -0,0 +1,50 @@
+import pytest
+
+from src.infrastructure.metrics.registry import MetricsRegistry
+
+
+class TestMetricsRegistry:
+    def test_counter_and_gauge_render(self) -> None:
+        registry = MetricsRegistry()
+        hits = registry.counter("hits_total", "Hits.", ["route"])
+        busy = registry.gauge("busy", "Busy workers.")
+        hits.inc("/a")
+        hits.inc("/a", amount=2)
+        busy.inc()
+        busy.dec()
+
+        assert registry.render().splitlines() == [
+            "# HELP hits_total Hits.",
+            "# TYPE hits_total counter",
+            'hits_total{route="/a"} 3',
+            "# HELP busy Busy workers.",
+            "# TYPE busy gauge",
+            "busy 0",
+        ]
+
+    def test_histogram_buckets_are_cumulative_and_inclusive(self) -> None:
+        registry = MetricsRegistry()
+        latency = registry.histogram("latency_seconds", "Latency.", ["m"], buckets=[0.1, 1])
+        for value in (0.05, 0.1, 0.5, 3):
+            latency.observe(value, "GET")
+
+        lines = registry.render().splitlines()[2:]
+        assert lines == [
+            'latency_seconds_bucket{m="GET",le="0.1"} 2',
+            'latency_seconds_bucket{m="GET",le="1"} 3',
+            'latency_seconds_bucket{m="GET",le="+Inf"} 4',
+            'latency_seconds_sum{m="GET"} 3.65',
+            'latency_seconds_count{m="GET"} 4',
+        ]
+        assert latency.count("GET") == 4
+
+    def test_label_values_are_escaped(self) -> None:
+        registry = MetricsRegistry()
+        registry.counter("c", "C.", ["path"]).inc('a"b\\')
+        assert 'c{path="a\\"b\\\\"} 1' in registry.render()
+
+    def test_duplicate_name_raises(self) -> None:
+        registry = MetricsRegistry()
+        registry.counter("c", "C.")
+        with pytest.raises(ValueError, match="already registered"):
+            registry.gauge("c", "C.")
@@ -0,0 +1,116 @@
+"""Upgrading database files created by the original schema in place."""
+
+from pathlib import Path
+
+import pytest
+from sqlalchemy import Engine, create_engine, inspect, text
+from sqlalchemy.orm import Session
+
+from src.application.services.team_service import TeamService
+from src.infrastructure.database.connection import create_tables
+from src.infrastructure.database.migrations import SchemaMigrationError
+from src.infrastructure.database.repositories.team_repo import TeamRepository
+
+# The schema the first release created, before any column was added
+BASELINE_DDL = [
+    """CREATE TABLE team_members (
+        id VARCHAR(36) NOT NULL, name VARCHAR(100) NOT NULL, role VARCHAR(100) NOT NULL,
+        avatar_url VARCHAR(500), status VARCHAR(20) NOT NULL, PRIMARY KEY (id))""",
+    """CREATE TABLE mood_entries (
+        id VARCHAR(36) NOT NULL, member_id VARCHAR(36) NOT NULL, emoji VARCHAR(10) NOT NULL,
+        label VARCHAR(50) NOT NULL, timestamp DATETIME NOT NULL, PRIMARY KEY (id),
+        FOREIGN KEY(member_id) REFERENCES team_members (id))""",
+    "CREATE INDEX ix_mood_entries_member_id ON mood_entries (member_id)",
+    """CREATE TABLE user_preferences (
+        user_id VARCHAR(100) NOT NULL, username VARCHAR(50) NOT NULL, dark_mode BOOLEAN NOT NULL,
+        created_at DATETIME NOT NULL, updated_at DATETIME NOT NULL, PRIMARY KEY (user_id))""",
+    "INSERT INTO team_members VALUES ('m1', 'Alice', 'Dev', NULL, 'active')",
+    "INSERT INTO team_members VALUES ('m2', 'Bob', 'Dev', NULL, 'active')",
+    "INSERT INTO mood_entries VALUES ('e1', 'm1', '😴', 'Tired', '2026-02-25 09:00:00.000000')",
+    "INSERT INTO mood_entries VALUES ('e2', 'm1', '😊', 'Happy', '2026-02-26 09:00:00.000000')",
+]
+
+
+@pytest.fixture
+def baseline_engine(tmp_path: Path) -> Engine:
+    engine = create_engine(f"sqlite:///{tmp_path / 'baseline.db'}")
+    with engine.begin() as conn:
+        for statement in BASELINE_DDL:
+            conn.execute(text(statement))
+    yield engine
+    engine.dispose()
+
+
+def _columns(engine: Engine, table: str) -> set[str]:
+    with engine.connect() as conn:
+        return {c["name"] for c in inspect(conn).get_columns(table)}
+
+
+class TestBaselineUpgrade:
+    def test_adds_current_mood_columns_and_backfills(self, baseline_engine: Engine) -> None:
+        assert create_tables(baseline_engine) is True
+
+        assert {"current_mood_id", "current_mood_emoji", "current_mood_at"} <= _columns(
+            baseline_engine, "team_members"
+        )
+        with Session(baseline_engine) as db:
+            repo = TeamRepository(db)
+            alice = repo.get_by_id("m1", history=False)
+            assert alice is not None and alice.latest_mood is not None
+            assert (alice.latest_mood.id, alice.latest_mood.label) == ("e2", "Happy")
+            assert repo.get_by_id("m2", history=False).latest_mood is None
+
+    def test_maintenance_backfill_runs_after_upgrade(self, baseline_engine: Engine) -> None:
+        create_tables(baseline_engine)
+        with Session(baseline_engine) as db:
+            assert TeamRepository(db).backfill_current_moods() == 2
+
+    def test_adds_and_stamps_change_seq(self, baseline_engine: Engine) -> None:
+        # Used to crash creating ix_team_members_change_seq on the missing column
+        assert create_tables(baseline_engine) is True
+
+        with baseline_engine.connect() as conn:
+            counter = conn.execute(text("SELECT value FROM change_sequence")).scalar_one()
+            stamped = conn.execute(
+                text("SELECT DISTINCT change_seq FROM mood_entries")
+            ).scalars().all()
+            indexes = {i["name"] for i in inspect(conn).get_indexes("team_members")}
+        assert counter > 0 and stamped == [counter - 1]
+        assert "ix_team_members_change_seq" in indexes
+
+        with Session(baseline_engine) as db:
+            changes = TeamService(TeamRepository(db)).get_changes()
+        assert [m.id for m in changes.members] == ["m1", "m2"]
+        assert [e.id for e in changes.moods] == ["e1", "e2"]
+
+    def test_upgraded_file_is_current(self, baseline_engine: Engine) -> None:
+        create_tables(baseline_engine)
+        assert create_tables(baseline_engine) is False
+
+
+class TestUnsupportedUpgrade:
+    def test_required_column_without_default_fails_before_altering(
+        self, baseline_engine: Engine
+    ) -> None:
+        with baseline_engine.begin() as conn:
+            conn.execute(text("ALTER TABLE user_preferences DROP COLUMN created_at"))
+
+        with pytest.raises(SchemaMigrationError, match="user_preferences.created_at"):
+            create_tables(baseline_engine)
+        # Nothing was altered and the version was not recorded
+        assert "change_seq" not in _columns(baseline_engine, "team_members")
+        with pytest.raises(SchemaMigrationError):
+            create_tables(baseline_engine)
+
+    def test_index_failure_is_reported_by_name(self, tmp_path: Path) -> None:
+        engine = create_engine(f"sqlite:///{tmp_path / 'app.db'}")
+        create_tables(engine)
+        with engine.begin() as conn:
+            conn.execute(text("DROP INDEX ix_mood_entries_change_seq"))
+            conn.execute(text("UPDATE schema_version SET version = 'old'"))
+            # An index name already taken by another object
+            conn.execute(text("CREATE TABLE ix_mood_entries_change_seq (id INTEGER)"))
+
+        with pytest.raises(SchemaMigrationError, match="ix_mood_entries_change_seq"):
+            create_tables(engine)
+        engine.dispose()
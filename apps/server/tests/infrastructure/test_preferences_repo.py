@@ -0,0 +1,49 @@
+from dataclasses import replace
+from datetime import timedelta
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from src.domain.models.user_preferences import create_default_preferences
+from src.infrastructure.database.repositories.preferences_repo import PreferencesRepository
+
+
+class TestPreferencesUpsert:
+    def test_first_write_inserts_defaults_plus_changes(self, db: Session) -> None:
+        repo = PreferencesRepository(db)
+
+        prefs = repo.upsert(create_default_preferences("u1"), {"dark_mode": True})
+        assert prefs.username == "Guest"
+        assert prefs.dark_mode is True
+        assert repo.get_by_user_id("u1") == prefs
+
+    def test_later_write_touches_only_given_fields(self, db: Session) -> None:
+        repo = PreferencesRepository(db)
+        first = repo.upsert(create_default_preferences("u1"), {"username": "Ada"})
+
+        later_at = first.created_at + timedelta(hours=1)
+        later = replace(create_default_preferences("u1"), created_at=later_at, updated_at=later_at)
+        prefs = repo.upsert(later, {"dark_mode": True})
+        assert prefs.username == "Ada"
+        assert prefs.dark_mode is True
+        assert prefs.created_at == first.created_at
+        assert prefs.updated_at == later.updated_at.replace(tzinfo=None)
+
+    def test_is_one_statement(self, db: Session) -> None:
+        repo = PreferencesRepository(db)
+        repo.upsert(create_default_preferences("u1"), {})
+
+        statements: list[str] = []
+        engine = db.get_bind()
+
+        def listener(conn, cursor, statement, *args) -> None:
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", listener)
+        try:
+            repo.upsert(create_default_preferences("u1"), {"username": "Ada"})
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+        assert len(statements) == 1
+        assert statements[0].startswith("INSERT INTO user_preferences")
+        assert "ON CONFLICT" in statements[0]
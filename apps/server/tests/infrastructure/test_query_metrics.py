@@ -0,0 +1,101 @@
+import anyio.to_thread
+import pytest
+from sqlalchemy import create_engine, text
+
+from src.infrastructure.database.query_metrics import (
+    QueryBudgetExceeded,
+    fingerprint,
+    install_query_metrics,
+    query_budget,
+    track_queries,
+)
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite:///:memory:")
+    install_query_metrics(engine)
+    yield engine
+    engine.dispose()
+
+
+class TestQueryMetrics:
+    def test_counts_statements_inside_block_only(self, engine) -> None:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            with track_queries() as stats:
+                conn.execute(text("SELECT 1"))
+                conn.execute(text("SELECT 2"))
+            conn.execute(text("SELECT 3"))
+        assert stats.count == 2
+        assert stats.seconds > 0
+
+    def test_failed_statements_are_counted(self, engine) -> None:
+        with engine.connect() as conn, track_queries() as stats:
+            with pytest.raises(Exception):
+                conn.execute(text("SELECT * FROM missing"))
+            conn.execute(text("SELECT 1"))
+        assert stats.count == 2
+
+    def test_worker_threads_report_to_caller(self, engine) -> None:
+        def query() -> None:
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+
+        async def main() -> int:
+            with track_queries() as stats:
+                await anyio.to_thread.run_sync(query)
+            return stats.count
+
+        assert anyio.run(main) == 1
+
+    def test_repeated_groups_statements_by_shape(self, engine) -> None:
+        with engine.connect() as conn, track_queries() as stats:
+            for n in range(3):
+                conn.execute(text(f"SELECT {n}"))
+            conn.execute(text("SELECT 'x'"))
+        assert stats.repeated(3) == [("SELECT ?", 4)]
+        assert stats.repeated(5) == []
+
+
+class TestFingerprint:
+    def test_collapses_literals_and_in_lists(self) -> None:
+        assert fingerprint("SELECT * FROM t WHERE a = 'it''s' AND b = 42") == (
+            "SELECT * FROM t WHERE a = ? AND b = ?"
+        )
+        assert fingerprint("SELECT * FROM t WHERE id IN (?, ?, ?)") == fingerprint(
+            "SELECT * FROM t WHERE id IN (?)"
+        )
+        assert fingerprint("SELECT *\n  FROM t WHERE id IN (%(a)s, %(b)s)") == (
+            "SELECT * FROM t WHERE id IN (?)"
+        )
+
+    def test_keeps_identifiers_with_digits(self) -> None:
+        assert fingerprint("SELECT t1.id FROM t1") == "SELECT t1.id FROM t1"
+
+
+class TestQueryBudget:
+    def test_passes_within_budget(self, engine) -> None:
+        with query_budget(engine, 2) as stats, engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            conn.execute(text("SELECT 2"))
+        assert stats.count == 2
+
+    def test_fails_over_budget(self, engine) -> None:
+        with pytest.raises(QueryBudgetExceeded, match="budget of 1"):
+            with query_budget(engine, 1), engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+                conn.execute(text("SELECT 2"))
+
+    def test_fails_on_repeated_shape(self, engine) -> None:
+        with pytest.raises(QueryBudgetExceeded, match="N\\+1"):
+            with query_budget(engine, 10, max_repeats=1), engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+                conn.execute(text("SELECT 2"))
+
+    def test_stops_listening_after_block(self, engine) -> None:
+        with query_budget(engine, 1) as stats:
+            pass
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        assert stats.count == 0
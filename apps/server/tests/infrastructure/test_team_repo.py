@@ -1,10 +1,18 @@
-from datetime import datetime, timezone
+from collections import Counter
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
 
+from sqlalchemy import event, select, update
 from sqlalchemy.orm import Session
 
 from src.domain.models.mood_entry import MoodEntry
 from src.domain.models.team_member import TeamMember
+from src.infrastructure.database.maintenance import ensure_mood_rollups
+from src.infrastructure.database.models.mood_rollup_model import MoodDailyRollupModel
+from src.infrastructure.database.models.team_member_model import TeamMemberModel
+from src.infrastructure.database.query_metrics import track_engine_queries
 from src.infrastructure.database.repositories.team_repo import TeamRepository
+from src.seeds.synthetic import generate_members
 
 
 def _make_member(member_id: str = "m1", name: str = "Test") -> TeamMember:
@@ -43,6 +51,95 @@ class TestTeamRepository:
         names = {m.name for m in members}
         assert names == {"Alice", "Bob"}
 
+    def test_get_page_is_keyset_ordered_by_id(self, db: Session) -> None:
+        repo = TeamRepository(db)
+        for member_id in ("m3", "m1", "m2"):
+            repo.save_member(_make_member(member_id))
+
+        first = repo.get_page(limit=2)
+        assert [m.id for m in first] == ["m1", "m2"]
+        rest = repo.get_page(after_id="m2", limit=2)
+        assert [m.id for m in rest] == ["m3"]
+
+    def test_get_page_history_stays_within_page(self, db: Session) -> None:
+        repo = TeamRepository(db)
+        for member_id in ("m1", "m2", "m3"):
+            repo.save_member(_make_member(member_id))
+
+        page = repo.get_page(after_id="m1", limit=1)
+        assert [m.id for m in page] == ["m2"]
+        assert {e.member_id for e in page[0].mood_entries} == {"m2"}
+        assert len(page[0].mood_entries) == 2
+
+    def test_reads_skip_orm_identity_map(self, db: Session) -> None:
+        repo = TeamRepository(db)
+        repo.save_member(_make_member("m1"))
+        db.expunge_all()
+
+        repo.get_page()
+        repo.get_by_id("m1")
+        repo.get_mood_history("m1")
+        assert len(db.identity_map) == 0
+
+    def test_get_page_caps_history_per_member(self, db: Session) -> None:
+        repo = TeamRepository(db)
+        repo.save_member(_make_member("m1"))
+        repo.save_member(_make_member("m2"))
+
+        members = repo.get_page(history_limit=1)
+        assert [len(m.mood_entries) for m in members] == [1, 1]
+        assert members[0].mood_entries[0].id == "m1-e1"  # newest kept
+
+    def test_get_page_reads_history_in_one_statement(self, db: Session) -> None:
+        repo = TeamRepository(db)
+        repo.save_member(_make_member("m1"))
+        repo.save_member(replace(_make_member("m2"), mood_entries=[]))
+        repo.save_member(_make_member("m3"))
+
+        with track_engine_queries(db.get_bind()) as stats:
+            members = repo.get_page(limit=2, history_limit=1)
+        assert stats.count == 1
+        # The outer join keeps members without entries
+        assert [(m.id, len(m.mood_entries)) for m in members] == [("m1", 1), ("m2", 0)]
+
+    def test_capped_history_looks_entries_up_by_primary_key(self, db: Session) -> None:
+        repo = TeamRepository(db)
+        repo.save_member(_make_member("m1"))
+        engine = db.get_bind()
+        executed: list[tuple] = []
+
+        def listener(conn, cursor, statement, parameters, *args) -> None:
+            executed.append((statement, parameters))
+
+        event.listen(engine, "before_cursor_execute", listener)
+        try:
+            repo.get_page(limit=10, history_limit=5)
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+        statement, parameters = executed[-1]
+        plan = [
+            row[3]
+            for row in db.connection().exec_driver_sql(
+                f"EXPLAIN QUERY PLAN {statement}", parameters
+            )
+        ]
+        # The joined entries come from the capped id list, not from a walk
+        # of the member's whole history
+        assert any(
+            step.startswith("SEARCH mood_entries USING INDEX sqlite_autoindex_mood_entries_1")
+            for step in plan
+        )
+        assert not any(
+            step.startswith("SEARCH mood_entries") and "member_id=?" in step for step in plan
+        )
+
+    def test_get_page_history_limit_zero_skips_moods(self, db: Session) -> None:
+        repo = TeamRepository(db)
+        repo.save_member(_make_member("m1"))
+
+        members = repo.get_page(history_limit=0)
+        assert members[0].mood_entries == []
+
     def test_get_by_id_found(self, db: Session) -> None:
         repo = TeamRepository(db)
         repo.save_member(_make_member("m1", "Alice"))
@@ -52,6 +149,38 @@ class TestTeamRepository:
         assert member.name == "Alice"
         assert len(member.mood_entries) == 2
 
+    def test_get_by_id_without_history_or_current_mood(self, db: Session) -> None:
+        repo = TeamRepository(db)
+        repo.save_member(_make_member("m1"))
+
+        statements: list[str] = []
+        engine = db.get_bind()
+
+        def listener(conn, cursor, statement, *args) -> None:
+            statements.append(statement)
+
+        db.expunge_all()
+        event.listen(engine, "before_cursor_execute", listener)
+        try:
+            member = repo.get_by_id("m1", history=False, current_mood=False)
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+        assert member is not None
+        assert member.mood_entries == [] and member.current_mood is None
+        # One SELECT on team_members, without the denormalized mood columns
+        assert len(statements) == 1
+        assert "mood_entries" not in statements[0]
+        assert "current_mood" not in statements[0]
+
+    def test_get_page_without_current_mood(self, db: Session) -> None:
+        repo = TeamRepository(db)
+        repo.save_member(_make_member("m1"))
+        db.expunge_all()
+
+        member = repo.get_page(history_limit=0, current_mood=False)[0]
+        assert member.current_mood is None
+        assert repo.get_page(history_limit=0)[0].current_mood is not None
+
     def test_get_by_id_not_found(self, db: Session) -> None:
         repo = TeamRepository(db)
         assert repo.get_by_id("nonexistent") is None
@@ -65,6 +194,34 @@ class TestTeamRepository:
         timestamps = [e.timestamp for e in member.mood_entries]
         assert timestamps == sorted(timestamps, reverse=True)
 
+    def test_exists(self, db: Session) -> None:
+        repo = TeamRepository(db)
+        repo.save_member(_make_member("m1"))
+        assert repo.exists("m1")
+        assert not repo.exists("m2")
+
+    def test_get_mood_history_keyset_pages(self, db: Session) -> None:
+        repo = TeamRepository(db)
+        repo.save_member(_make_member("m1"))
+
+        first = repo.get_mood_history("m1", limit=1)
+        assert [e.id for e in first] == ["m1-e1"]
+        rest = repo.get_mood_history(
+            "m1", after=(first[-1].timestamp, first[-1].id), limit=1
+        )
+        assert [e.id for e in rest] == ["m1-e2"]
+
+    def test_get_mood_history_time_range(self, db: Session) -> None:
+        repo = TeamRepository(db)
+        repo.save_member(_make_member("m1"))
+
+        entries = repo.get_mood_history(
+            "m1",
+            since=datetime(2026, 2, 25, 0, 0, tzinfo=timezone.utc),
+            until=datetime(2026, 2, 26, 0, 0, tzinfo=timezone.utc),
+        )
+        assert [e.id for e in entries] == ["m1-e2"]
+
     def test_add_mood_entry(self, db: Session) -> None:
         repo = TeamRepository(db)
         repo.save_member(_make_member("m1"))
@@ -85,6 +242,146 @@ class TestTeamRepository:
         assert len(member.mood_entries) == 3
         assert member.mood_entries[0].id == "m1-e3"  # newest first
 
+    def test_add_mood_entry_unknown_member_writes_nothing(self, db: Session) -> None:
+        repo = TeamRepository(db)
+        entry = MoodEntry(
+            id="x-e1",
+            member_id="ghost",
+            emoji="😊",
+            label="Happy",
+            timestamp=datetime(2026, 2, 27, 10, 0, tzinfo=timezone.utc),
+        )
+        assert repo.add_mood_entry(entry) is None
+        assert repo.get_mood_history("ghost") == []
+
+    def test_add_mood_entry_is_four_statements(self, db: Session) -> None:
+        repo = TeamRepository(db)
+        history = [
+            MoodEntry(
+                id=f"m1-h{i}",
+                member_id="m1",
+                emoji="😊",
+                label="Happy",
+                timestamp=datetime(2026, 1, 1, tzinfo=timezone.utc),
+            )
+            for i in range(50)
+        ]
+        repo.save_member(replace(_make_member("m1"), mood_entries=history))
+
+        statements: list[str] = []
+        engine = db.get_bind()
+
+        def listener(conn, cursor, statement, *args) -> None:
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", listener)
+        try:
+            repo.add_mood_entry(
+                MoodEntry(
+                    id="m1-new",
+                    member_id="m1",
+                    emoji="🎉",
+                    label="Celebrating",
+                    timestamp=datetime(2026, 2, 27, 10, 0, tzinfo=timezone.utc),
+                )
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+        assert len(statements) == 4
+        assert statements[0].startswith("INSERT INTO change_sequence")
+        assert statements[1].startswith("INSERT INTO mood_entries")
+        assert statements[2].startswith("UPDATE team_members")
+        assert statements[3].startswith("INSERT INTO mood_daily_rollups")
+
+    def test_add_mood_entry_updates_denormalized_current_mood(self, db: Session) -> None:
+        repo = TeamRepository(db)
+        repo.save_member(_make_member("m1"))
+
+        repo.add_mood_entry(
+            MoodEntry(
+                id="m1-e3",
+                member_id="m1",
+                emoji="🎉",
+                label="Celebrating",
+                timestamp=datetime(2026, 2, 27, 10, 0, tzinfo=timezone.utc),
+            )
+        )
+        member = repo.get_page(history_limit=0)[0]
+        assert member.mood_entries == []
+        assert member.current_mood is not None
+        assert member.current_mood.id == "m1-e3"
+
+    def test_add_older_mood_entry_keeps_current_mood(self, db: Session) -> None:
+        repo = TeamRepository(db)
+        repo.save_member(_make_member("m1"))
+
+        repo.add_mood_entry(
+            MoodEntry(
+                id="m1-old",
+                member_id="m1",
+                emoji="😴",
+                label="Tired",
+                timestamp=datetime(2026, 1, 1, 10, 0, tzinfo=timezone.utc),
+            )
+        )
+        member = repo.get_page(history_limit=0)[0]
+        assert member.current_mood is not None
+        assert member.current_mood.id == "m1-e1"
+
+    def test_backfill_current_moods_repairs_stale_rows(self, db: Session) -> None:
+        repo = TeamRepository(db)
+        repo.save_member(_make_member("m1"))
+        repo.save_member(TeamMember(id="m2", name="Empty", role="Dev", status="active"))
+        db.execute(
+            update(TeamMemberModel).values(
+                current_mood_id=None,
+                current_mood_emoji=None,
+                current_mood_label=None,
+                current_mood_at=None,
+            )
+        )
+        db.commit()
+
+        assert repo.backfill_current_moods() == 2
+        m1, m2 = repo.get_page(history_limit=0)
+        assert m1.current_mood is not None
+        assert m1.current_mood.id == "m1-e1"
+        assert m1.current_mood.label == "Happy"
+        assert m2.current_mood is None
+
+    def test_existing_ids(self, db: Session) -> None:
+        repo = TeamRepository(db)
+        repo.save_member(_make_member("m1"))
+        assert repo.existing_ids(["m1", "m2", "m1"]) == {"m1"}
+        assert repo.existing_ids([]) == set()
+
+    def test_add_mood_entries_bulk(self, db: Session) -> None:
+        repo = TeamRepository(db)
+        repo.save_member(_make_member("m1"))
+        repo.save_member(_make_member("m2"))
+
+        repo.add_mood_entries(
+            [
+                MoodEntry(
+                    id=f"{member_id}-b{i}",
+                    member_id=member_id,
+                    emoji="🎉",
+                    label=f"Batch {i}",
+                    timestamp=datetime(2026, 2, 27, 10, i, tzinfo=timezone.utc),
+                )
+                for i, member_id in enumerate(["m1", "m2", "m1"])
+            ]
+        )
+        m1, m2 = repo.get_page()
+        assert len(m1.mood_entries) == 4
+        assert len(m2.mood_entries) == 3
+        assert m1.current_mood is not None
+        assert m1.current_mood.id == "m1-b2"
+
+        m1_latest = repo.get_page(history_limit=0)[0].current_mood
+        assert m1_latest is not None
+        assert m1_latest.id == "m1-b2"
+
     def test_count(self, db: Session) -> None:
         repo = TeamRepository(db)
         assert repo.count() == 0
@@ -101,3 +398,246 @@ class TestTeamRepository:
         result = repo.get_by_id("m1")
         assert result is not None
         assert result.mood_entries == []
+
+    def test_bulk_insert_members_in_chunks(self, db: Session) -> None:
+        repo = TeamRepository(db)
+        commits = []
+        event.listen(db, "after_commit", lambda _s: commits.append(1))
+        members = [_make_member(f"m{i}") for i in range(5)]
+        members.append(TeamMember(id="m5", name="Quiet", role="Dev", status="away"))
+
+        assert repo.bulk_insert_members(iter(members), chunk_size=4) == (6, 10)
+        assert len(commits) == 3
+        assert repo.count() == 6
+        loaded = repo.get_by_id("m3")
+        assert loaded is not None
+        assert [e.id for e in loaded.mood_entries] == ["m3-e1", "m3-e2"]
+        # Denormalized current mood is written from the newest entry
+        latest = repo.get_by_id("m3", history=False).latest_mood
+        assert latest is not None
+        assert latest.id == "m3-e1"
+        quiet = repo.get_by_id("m5")
+        assert quiet is not None and quiet.current_mood is None
+
+    def test_delete_all(self, db: Session) -> None:
+        repo = TeamRepository(db)
+        repo.save_member(_make_member("m1"))
+        repo.delete_all()
+        assert repo.count() == 0
+        assert repo.get_mood_history("m1") == []
+
+
+class TestChangeTracking:
+    def test_each_write_gets_a_later_change_seq(self, db: Session) -> None:
+        repo = TeamRepository(db)
+        repo.save_member(_make_member("m1"))
+        repo.save_member(_make_member("m2"))
+
+        members = repo.get_member_changes((0, ""), limit=10)
+        assert [(seq, m.id) for seq, m in members] == [(1, "m1"), (2, "m2")]
+        assert members[0][1].mood_entries == []
+        moods = repo.get_mood_changes((0, ""), limit=10)
+        assert [(seq, e.id) for seq, e in moods] == [
+            (1, "m1-e1"), (1, "m1-e2"), (2, "m2-e1"), (2, "m2-e2")
+        ]
+
+    def test_changes_resume_after_cursor(self, db: Session) -> None:
+        repo = TeamRepository(db)
+        repo.save_member(_make_member("m1"))
+        repo.save_member(_make_member("m2"))
+
+        repo.add_mood_entry(
+            MoodEntry(
+                id="m1-e3",
+                member_id="m1",
+                emoji="🎉",
+                label="Celebrating",
+                timestamp=datetime(2026, 2, 27, 10, 0, tzinfo=timezone.utc),
+            )
+        )
+        # The new entry and its member's current mood share one change_seq
+        assert [(s, e.id) for s, e in repo.get_mood_changes((2, "m2-e2"), 10)] == [(3, "m1-e3")]
+        changed = repo.get_member_changes((2, "m2"), 10)
+        assert [(s, m.id) for s, m in changed] == [(3, "m1")]
+        assert changed[0][1].current_mood is not None
+        assert changed[0][1].current_mood.id == "m1-e3"
+        # Ties on change_seq continue by id
+        assert [e.id for _, e in repo.get_mood_changes((1, "m1-e1"), 10)][:2] == [
+            "m1-e2", "m2-e1"
+        ]
+
+    def test_bulk_writes_are_tracked(self, db: Session) -> None:
+        repo = TeamRepository(db)
+        repo.bulk_insert_members(generate_members(3, 2, seed=1), chunk_size=2)
+        assert len(repo.get_member_changes((0, ""), 10)) == 3
+        assert len(repo.get_mood_changes((0, ""), 10)) == 6
+
+        last_seq = repo.get_mood_changes((0, ""), 10)[-1][0]
+        member_id = repo.get_page(limit=1)[0].id
+        repo.add_mood_entries(
+            [
+                MoodEntry(
+                    id="bulk-1",
+                    member_id=member_id,
+                    emoji="🎉",
+                    label="Celebrating",
+                    timestamp=datetime(2026, 2, 27, tzinfo=timezone.utc),
+                )
+            ]
+        )
+        assert [e.id for _, e in repo.get_mood_changes((last_seq, "~"), 10)] == ["bulk-1"]
+        assert [m.id for _, m in repo.get_member_changes((last_seq, "~"), 10)] == [member_id]
+
+
+class TestCountMoodsByBucket:
+    SINCE = datetime(2026, 2, 1, tzinfo=timezone.utc)
+    UNTIL = datetime(2026, 3, 1, tzinfo=timezone.utc)
+
+    def _seed(self, db: Session) -> TeamRepository:
+        repo = TeamRepository(db)
+        repo.save_member(_make_member("m1"))  # 26 Feb Happy, 25 Feb Fired Up
+        other = replace(_make_member("m2"), role="QA", status="away")
+        repo.save_member(other)
+        return repo
+
+    def test_daily_counts_per_label(self, db: Session) -> None:
+        buckets = self._seed(db).count_moods_by_bucket("day", self.SINCE, self.UNTIL)
+        assert [(b.start.day, b.counts) for b in buckets] == [
+            (25, {"Fired Up": 2}),
+            (26, {"Happy": 2}),
+        ]
+        assert buckets[0].start == datetime(2026, 2, 25, tzinfo=timezone.utc)
+        assert buckets[0].total == 2
+
+    def test_weeks_start_on_monday(self, db: Session) -> None:
+        buckets = self._seed(db).count_moods_by_bucket("week", self.SINCE, self.UNTIL)
+        assert len(buckets) == 1
+        assert buckets[0].start == datetime(2026, 2, 23, tzinfo=timezone.utc)
+        assert buckets[0].counts == {"Fired Up": 2, "Happy": 2}
+
+    def test_hourly_buckets(self, db: Session) -> None:
+        buckets = self._seed(db).count_moods_by_bucket("hour", self.SINCE, self.UNTIL)
+        assert [b.start.hour for b in buckets] == [10, 10]
+
+    def test_filters_by_role_and_status(self, db: Session) -> None:
+        repo = self._seed(db)
+        by_role = repo.count_moods_by_bucket("week", self.SINCE, self.UNTIL, role="QA")
+        assert by_role[0].total == 2
+        by_status = repo.count_moods_by_bucket("week", self.SINCE, self.UNTIL, status="active")
+        assert by_status[0].total == 2
+        assert repo.count_moods_by_bucket("week", self.SINCE, self.UNTIL, "QA", "active") == []
+
+    def test_until_is_exclusive(self, db: Session) -> None:
+        until = datetime(2026, 2, 26, 10, 0, tzinfo=timezone.utc)
+        buckets = self._seed(db).count_moods_by_bucket("day", self.SINCE, until)
+        assert [b.counts for b in buckets] == [{"Fired Up": 2}]
+
+
+def _rollups(db: Session) -> dict[tuple[str, str, str], int]:
+    rows = db.execute(select(MoodDailyRollupModel)).scalars()
+    return {(r.member_id, r.day.isoformat(), r.label): r.count for r in rows}
+
+
+class TestMoodDailyRollups:
+    def test_save_member_counts_history(self, db: Session) -> None:
+        TeamRepository(db).save_member(_make_member("m1"))
+        assert _rollups(db) == {
+            ("m1", "2026-02-26", "Happy"): 1,
+            ("m1", "2026-02-25", "Fired Up"): 1,
+        }
+
+    def test_add_mood_entry_increments(self, db: Session) -> None:
+        repo = TeamRepository(db)
+        repo.save_member(_make_member("m1"))
+        for i in range(2):
+            repo.add_mood_entry(
+                MoodEntry(
+                    id=f"m1-x{i}",
+                    member_id="m1",
+                    emoji="😊",
+                    label="Happy",
+                    timestamp=datetime(2026, 2, 26, 23, 59, tzinfo=timezone.utc),
+                )
+            )
+        assert _rollups(db)[("m1", "2026-02-26", "Happy")] == 3
+        assert repo.check_mood_rollups() == 0
+
+    def test_unknown_member_leaves_rollups_untouched(self, db: Session) -> None:
+        repo = TeamRepository(db)
+        entry = MoodEntry(
+            id="x",
+            member_id="ghost",
+            emoji="😊",
+            label="Happy",
+            timestamp=datetime.now(timezone.utc),
+        )
+        assert repo.add_mood_entry(entry) is None
+        assert _rollups(db) == {}
+
+    def test_bulk_paths_keep_rollups_consistent(self, db: Session) -> None:
+        repo = TeamRepository(db)
+        repo.bulk_insert_members(generate_members(10, 20), chunk_size=30)
+        repo.add_mood_entries(
+            [
+                MoodEntry(
+                    id=f"b{i}",
+                    member_id="sm-0000-00000001",
+                    emoji="😴",
+                    label="Tired",
+                    timestamp=datetime(2026, 2, 26, 9, 0, tzinfo=timezone.utc),
+                )
+                for i in range(3)
+            ]
+        )
+        assert repo.check_mood_rollups() == 0
+
+    def test_check_detects_drift_and_rebuild_repairs_it(self, db: Session) -> None:
+        repo = TeamRepository(db)
+        repo.save_member(_make_member("m1"))
+        repo.save_member(_make_member("m2"))
+        rollup = MoodDailyRollupModel
+        db.execute(update(rollup).values(count=5).where(rollup.member_id == "m1"))
+        db.execute(rollup.__table__.delete().where(rollup.member_id == "m2"))
+        db.commit()
+        # two overcounted m1 keys (each missing and extra) + two missing m2 keys
+        assert repo.check_mood_rollups() == 6
+
+        assert repo.rebuild_mood_rollups() == 4
+        assert repo.check_mood_rollups() == 0
+        assert _rollups(db)[("m1", "2026-02-26", "Happy")] == 1
+
+    def test_analytics_match_raw_entries(self, db: Session) -> None:
+        repo = TeamRepository(db)
+        members = list(generate_members(15, 40, seed=5))
+        repo.bulk_insert_members(members)
+        entries = [e for m in members for e in m.mood_entries]
+        # Window with partial days at both ends around whole rollup days
+        since = datetime(2026, 2, 3, 13, 30, tzinfo=timezone.utc)
+        until = datetime(2026, 2, 24, 8, 15, tzinfo=timezone.utc)
+
+        for bucket, width in (("day", 1), ("week", 7)):
+            expected: Counter = Counter()
+            for e in entries:
+                if since <= e.timestamp < until:
+                    day = e.timestamp.date()
+                    start = day - timedelta(days=day.weekday() if width == 7 else 0)
+                    expected[(start.isoformat(), e.label)] += 1
+            actual = Counter(
+                {
+                    (b.start.date().isoformat(), label): n
+                    for b in repo.count_moods_by_bucket(bucket, since, until)
+                    for label, n in b.counts.items()
+                }
+            )
+            assert actual == expected, bucket
+
+    def test_ensure_mood_rollups_backfills_once(self, db: Session) -> None:
+        repo = TeamRepository(db)
+        repo.save_member(_make_member("m1"))
+        db.execute(MoodDailyRollupModel.__table__.delete())
+        db.commit()
+        assert repo.mood_rollups_missing()
+
+        assert ensure_mood_rollups(db) is True
+        assert repo.check_mood_rollups() == 0
+        assert ensure_mood_rollups(db) is False
@@ -0,0 +1,114 @@
+import asyncio
+
+import pytest
+
+from src.infrastructure.cache.ttl_cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+class TestTTLCache:
+    def test_fresh_then_stale_then_expired(self, clock: FakeClock) -> None:
+        cache: TTLCache[str, int] = TTLCache(maxsize=10, ttl=5, stale_ttl=10, clock=clock)
+        cache.set("k", 1)
+
+        assert cache.lookup("k") == (True, False, 1)
+        clock.now = 6
+        assert cache.lookup("k") == (True, True, 1)
+        clock.now = 16
+        assert cache.lookup("k") == (False, False, None)
+
+    def test_lru_eviction(self, clock: FakeClock) -> None:
+        cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=60, clock=clock)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.lookup("a")  # a becomes most recently used
+        cache.set("c", 3)
+
+        assert cache.lookup("b")[0] is False
+        assert cache.lookup("a")[0] is True
+        assert cache.stats().evictions == 1
+
+    def test_invalidate_by_predicate(self, clock: FakeClock) -> None:
+        cache: TTLCache[tuple, int] = TTLCache(maxsize=10, ttl=60, clock=clock)
+        cache.set(("member", "m1"), 1)
+        cache.set(("member", "m2"), 2)
+
+        assert cache.invalidate(lambda key: key[1] == "m1") == 1
+        assert cache.lookup(("member", "m1"))[0] is False
+        assert cache.lookup(("member", "m2"))[0] is True
+
+    def test_set_after_invalidation_is_discarded(self, clock: FakeClock) -> None:
+        cache: TTLCache[str, int] = TTLCache(maxsize=10, ttl=60, clock=clock)
+        generation = cache.generation
+        cache.invalidate()
+
+        assert cache.set("k", 1, generation) is False
+        assert cache.lookup("k")[0] is False
+
+    def test_stats_count_hits_and_misses(self, clock: FakeClock) -> None:
+        cache: TTLCache[str, int] = TTLCache(maxsize=10, ttl=60, clock=clock)
+        cache.lookup("k")
+        cache.set("k", 1)
+        cache.lookup("k")
+        cache.lookup("k")
+
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.size) == (2, 1, 1)
+        assert stats.as_dict()["hit_ratio"] == pytest.approx(2 / 3, abs=1e-4)
+
+
+class TestGetOrLoad:
+    def test_miss_loads_and_caches(self, clock: FakeClock) -> None:
+        cache: TTLCache[str, int] = TTLCache(maxsize=10, ttl=60, clock=clock)
+        calls = 0
+
+        async def load() -> int:
+            nonlocal calls
+            calls += 1
+            return 42
+
+        async def main() -> None:
+            assert await cache.get_or_load("k", load) == 42
+            assert await cache.get_or_load("k", load) == 42
+
+        asyncio.run(main())
+        assert calls == 1
+
+    def test_stale_read_returns_old_value_and_refreshes_once(self, clock: FakeClock) -> None:
+        cache: TTLCache[str, int] = TTLCache(maxsize=10, ttl=5, stale_ttl=60, clock=clock)
+        cache.set("k", 1)
+        clock.now = 10
+        refreshes = 0
+        release = asyncio.Event()
+
+        async def load() -> int:
+            raise AssertionError("stale reads must not load on the caller's path")
+
+        async def refresh() -> int:
+            nonlocal refreshes
+            refreshes += 1
+            await release.wait()
+            return 2
+
+        async def main() -> None:
+            results = [await cache.get_or_load("k", load, refresh) for _ in range(3)]
+            assert results == [1, 1, 1]
+            release.set()
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+            assert await cache.get_or_load("k", load, refresh) == 2
+
+        asyncio.run(main())
+        assert refreshes == 1
@@ -0,0 +1,50 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy.orm import Session
+
+from src.infrastructure.database.repositories.team_repo import TeamRepository
+from src.seeds.synthetic import generate_members, seed_synthetic_data
+from src.seeds.team_seed import MEMBER_IDS, seed_team_data
+
+END = datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc)
+
+
+class TestGenerateMembers:
+    def test_counts(self) -> None:
+        members = list(generate_members(7, 4, end=END))
+        assert len(members) == 7
+        assert all(len(m.mood_entries) == 4 for m in members)
+        assert len({e.id for m in members for e in m.mood_entries}) == 28
+
+    def test_deterministic_per_seed(self) -> None:
+        first = list(generate_members(5, 10, seed=3, end=END))
+        assert first == list(generate_members(5, 10, seed=3, end=END))
+        assert first != list(generate_members(5, 10, seed=4, end=END))
+
+    def test_history_newest_first_within_window(self) -> None:
+        for member in generate_members(20, 30, end=END, days=14):
+            stamps = [e.timestamp for e in member.mood_entries]
+            assert stamps == sorted(stamps, reverse=True)
+            assert all(END - timedelta(days=14) <= ts <= END for ts in stamps)
+
+    def test_rejects_negative_counts(self) -> None:
+        with pytest.raises(ValueError, match="must not be negative"):
+            list(generate_members(-1, 5))
+
+
+class TestSeeding:
+    def test_seed_synthetic_data(self, db: Session) -> None:
+        assert seed_synthetic_data(db, 12, 3, end=END, chunk_size=10) == (12, 36)
+        repo = TeamRepository(db)
+        assert repo.count() == 12
+        member = repo.get_all()[0]
+        stored = repo.get_by_id(member.id, history=False)
+        assert stored.latest_mood == member.mood_entries[0]
+
+    def test_fixture_stays_default_and_idempotent(self, db: Session) -> None:
+        seed_team_data(db)
+        seed_team_data(db)
+        repo = TeamRepository(db)
+        assert repo.count() == 8
+        assert repo.get_by_id(MEMBER_IDS[0]) is not None
@@ -23,6 +23,7 @@ import { customFetch } from '../../../fetcher';
 type SecondParameter<T extends (...args: never) => unknown> = Parameters<T>[1];
 
 /**
+ * Users without stored preferences get the defaults, with `createdAt` and `updatedAt` set to the request time. Nothing is written until the first PUT.
  * @summary Get user preferences
  */
 export type getPreferencesResponse200 = {
@@ -84,6 +85,7 @@ export type GetPreferencesQueryResult = NonNullable<
 export type GetPreferencesQueryError = unknown;
 
 /**
+ * Users without stored preferences get the defaults, with `createdAt` and `updatedAt` set to the request time. Nothing is written until the first PUT.
  * @summary Get user preferences
  */
 
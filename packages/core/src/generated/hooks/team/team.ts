@@ -16,17 +16,35 @@ import type {
   UseQueryResult,
 } from '@tanstack/react-query';
 
-import type { ApiError, MoodEntry, SubmitMoodRequest, TeamMember } from '../../models';
+import type {
+  ApiError,
+  BatchMoodItem,
+  BatchMoodResult,
+  GetTeamChangesParams,
+  GetTeamMemberByIdParams,
+  GetTeamMemberMoodHistoryParams,
+  GetTeamMembers200,
+  GetTeamMembersParams,
+  GetTeamMoodDistributionParams,
+  MoodDistribution,
+  MoodEntry,
+  MoodEvent,
+  MoodHistoryPage,
+  SubmitMoodRequest,
+  TeamChanges,
+  TeamMember,
+} from '../../models';
 
 import { customFetch } from '../../../fetcher';
 
 type SecondParameter<T extends (...args: never) => unknown> = Parameters<T>[1];
 
 /**
+ * Mood history is omitted unless `include=history` is passed. `fields` limits each member to the listed keys; `id` is always returned. With `stream=1` or `Accept: application/x-ndjson`, members are streamed one JSON object per line as they are read; `limit` then caps the total and no next cursor is sent. Passing `limit` or `cursor` returns a `TeamMemberPage` envelope instead of a bare list.
  * @summary List all team members with current status and mood
  */
 export type getTeamMembersResponse200 = {
-  data: TeamMember[];
+  data: GetTeamMembers200;
   status: 200;
 };
 
@@ -35,37 +53,51 @@ export type getTeamMembersResponseSuccess = getTeamMembersResponse200 & {
 };
 export type getTeamMembersResponse = getTeamMembersResponseSuccess;
 
-export const getGetTeamMembersUrl = () => {
-  return `/team`;
+export const getGetTeamMembersUrl = (params?: GetTeamMembersParams) => {
+  const normalizedParams = new URLSearchParams();
+
+  Object.entries(params || {}).forEach(([key, value]) => {
+    if (value !== undefined) {
+      normalizedParams.append(key, value === null ? 'null' : value.toString());
+    }
+  });
+
+  const stringifiedParams = normalizedParams.toString();
+
+  return stringifiedParams.length > 0 ? `/team?${stringifiedParams}` : `/team`;
 };
 
 export const getTeamMembers = async (
+  params?: GetTeamMembersParams,
   options?: RequestInit,
 ): Promise<getTeamMembersResponse> => {
-  return customFetch<getTeamMembersResponse>(getGetTeamMembersUrl(), {
+  return customFetch<getTeamMembersResponse>(getGetTeamMembersUrl(params), {
     ...options,
     method: 'GET',
   });
 };
 
-export const getGetTeamMembersQueryKey = () => {
-  return [`/team`] as const;
+export const getGetTeamMembersQueryKey = (params?: GetTeamMembersParams) => {
+  return [`/team`, ...(params ? [params] : [])] as const;
 };
 
 export const getGetTeamMembersQueryOptions = <
   TData = Awaited<ReturnType<typeof getTeamMembers>>,
   TError = unknown,
->(options?: {
-  query?: UseQueryOptions<Awaited<ReturnType<typeof getTeamMembers>>, TError, TData>;
-  request?: SecondParameter<typeof customFetch>;
-}) => {
+>(
+  params?: GetTeamMembersParams,
+  options?: {
+    query?: UseQueryOptions<Awaited<ReturnType<typeof getTeamMembers>>, TError, TData>;
+    request?: SecondParameter<typeof customFetch>;
+  },
+) => {
   const { query: queryOptions, request: requestOptions } = options ?? {};
 
-  const queryKey = queryOptions?.queryKey ?? getGetTeamMembersQueryKey();
+  const queryKey = queryOptions?.queryKey ?? getGetTeamMembersQueryKey(params);
 
   const queryFn: QueryFunction<Awaited<ReturnType<typeof getTeamMembers>>> = ({
     signal,
-  }) => getTeamMembers({ signal, ...requestOptions });
+  }) => getTeamMembers(params, { signal, ...requestOptions });
 
   return { queryKey, queryFn, ...queryOptions } as UseQueryOptions<
     Awaited<ReturnType<typeof getTeamMembers>>,
@@ -86,11 +118,185 @@ export type GetTeamMembersQueryError = unknown;
 export function useGetTeamMembers<
   TData = Awaited<ReturnType<typeof getTeamMembers>>,
   TError = unknown,
+>(
+  params?: GetTeamMembersParams,
+  options?: {
+    query?: UseQueryOptions<Awaited<ReturnType<typeof getTeamMembers>>, TError, TData>;
+    request?: SecondParameter<typeof customFetch>;
+  },
+): UseQueryResult<TData, TError> & { queryKey: QueryKey } {
+  const queryOptions = getGetTeamMembersQueryOptions(params, options);
+
+  const query = useQuery(queryOptions) as UseQueryResult<TData, TError> & {
+    queryKey: QueryKey;
+  };
+
+  return { ...query, queryKey: queryOptions.queryKey };
+}
+
+/**
+ * @summary Submit moods for many team members in one transaction
+ */
+export type submitTeamMoodsBatchResponse200 = {
+  data: BatchMoodResult[];
+  status: 200;
+};
+
+export type submitTeamMoodsBatchResponseSuccess = submitTeamMoodsBatchResponse200 & {
+  headers: Headers;
+};
+export type submitTeamMoodsBatchResponse = submitTeamMoodsBatchResponseSuccess;
+
+export const getSubmitTeamMoodsBatchUrl = () => {
+  return `/team/moods:batch`;
+};
+
+export const submitTeamMoodsBatch = async (
+  batchMoodItem: BatchMoodItem[],
+  options?: RequestInit,
+): Promise<submitTeamMoodsBatchResponse> => {
+  return customFetch<submitTeamMoodsBatchResponse>(getSubmitTeamMoodsBatchUrl(), {
+    ...options,
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json', ...options?.headers },
+    body: JSON.stringify(batchMoodItem),
+  });
+};
+
+export const getSubmitTeamMoodsBatchMutationOptions = <
+  TError = unknown,
+  TContext = unknown,
 >(options?: {
-  query?: UseQueryOptions<Awaited<ReturnType<typeof getTeamMembers>>, TError, TData>;
+  mutation?: UseMutationOptions<
+    Awaited<ReturnType<typeof submitTeamMoodsBatch>>,
+    TError,
+    { data: BatchMoodItem[] },
+    TContext
+  >;
+  request?: SecondParameter<typeof customFetch>;
+}): UseMutationOptions<
+  Awaited<ReturnType<typeof submitTeamMoodsBatch>>,
+  TError,
+  { data: BatchMoodItem[] },
+  TContext
+> => {
+  const mutationKey = ['submitTeamMoodsBatch'];
+  const { mutation: mutationOptions, request: requestOptions } = options
+    ? options.mutation &&
+      'mutationKey' in options.mutation &&
+      options.mutation.mutationKey
+      ? options
+      : { ...options, mutation: { ...options.mutation, mutationKey } }
+    : { mutation: { mutationKey }, request: undefined };
+
+  const mutationFn: MutationFunction<
+    Awaited<ReturnType<typeof submitTeamMoodsBatch>>,
+    { data: BatchMoodItem[] }
+  > = (props) => {
+    const { data } = props ?? {};
+
+    return submitTeamMoodsBatch(data, requestOptions);
+  };
+
+  return { mutationFn, ...mutationOptions };
+};
+
+export type SubmitTeamMoodsBatchMutationResult = NonNullable<
+  Awaited<ReturnType<typeof submitTeamMoodsBatch>>
+>;
+export type SubmitTeamMoodsBatchMutationBody = BatchMoodItem[];
+export type SubmitTeamMoodsBatchMutationError = unknown;
+
+/**
+ * @summary Submit moods for many team members in one transaction
+ */
+export const useSubmitTeamMoodsBatch = <TError = unknown, TContext = unknown>(options?: {
+  mutation?: UseMutationOptions<
+    Awaited<ReturnType<typeof submitTeamMoodsBatch>>,
+    TError,
+    { data: BatchMoodItem[] },
+    TContext
+  >;
+  request?: SecondParameter<typeof customFetch>;
+}): UseMutationResult<
+  Awaited<ReturnType<typeof submitTeamMoodsBatch>>,
+  TError,
+  { data: BatchMoodItem[] },
+  TContext
+> => {
+  return useMutation(getSubmitTeamMoodsBatchMutationOptions(options));
+};
+
+/**
+ * Emits `mood` events (data: MoodEvent, id: mood entry id) after each committed submission. Events still queued for a slow client are coalesced per member; if its queue overflows, a `resync` event (data: {"dropped": n}) asks the client to refetch /team. A `: keepalive` comment is sent when idle.
+ * @summary Live mood updates as Server-Sent Events
+ */
+export type streamTeamMoodsResponse200 = {
+  data: MoodEvent;
+  status: 200;
+};
+
+export type streamTeamMoodsResponseSuccess = streamTeamMoodsResponse200 & {
+  headers: Headers;
+};
+export type streamTeamMoodsResponse = streamTeamMoodsResponseSuccess;
+
+export const getStreamTeamMoodsUrl = () => {
+  return `/team/stream`;
+};
+
+export const streamTeamMoods = async (
+  options?: RequestInit,
+): Promise<streamTeamMoodsResponse> => {
+  return customFetch<streamTeamMoodsResponse>(getStreamTeamMoodsUrl(), {
+    ...options,
+    method: 'GET',
+  });
+};
+
+export const getStreamTeamMoodsQueryKey = () => {
+  return [`/team/stream`] as const;
+};
+
+export const getStreamTeamMoodsQueryOptions = <
+  TData = Awaited<ReturnType<typeof streamTeamMoods>>,
+  TError = unknown,
+>(options?: {
+  query?: UseQueryOptions<Awaited<ReturnType<typeof streamTeamMoods>>, TError, TData>;
+  request?: SecondParameter<typeof customFetch>;
+}) => {
+  const { query: queryOptions, request: requestOptions } = options ?? {};
+
+  const queryKey = queryOptions?.queryKey ?? getStreamTeamMoodsQueryKey();
+
+  const queryFn: QueryFunction<Awaited<ReturnType<typeof streamTeamMoods>>> = ({
+    signal,
+  }) => streamTeamMoods({ signal, ...requestOptions });
+
+  return { queryKey, queryFn, ...queryOptions } as UseQueryOptions<
+    Awaited<ReturnType<typeof streamTeamMoods>>,
+    TError,
+    TData
+  > & { queryKey: QueryKey };
+};
+
+export type StreamTeamMoodsQueryResult = NonNullable<
+  Awaited<ReturnType<typeof streamTeamMoods>>
+>;
+export type StreamTeamMoodsQueryError = unknown;
+
+/**
+ * @summary Live mood updates as Server-Sent Events
+ */
+
+export function useStreamTeamMoods<
+  TData = Awaited<ReturnType<typeof streamTeamMoods>>,
+  TError = unknown,
+>(options?: {
+  query?: UseQueryOptions<Awaited<ReturnType<typeof streamTeamMoods>>, TError, TData>;
   request?: SecondParameter<typeof customFetch>;
 }): UseQueryResult<TData, TError> & { queryKey: QueryKey } {
-  const queryOptions = getGetTeamMembersQueryOptions(options);
+  const queryOptions = getStreamTeamMoodsQueryOptions(options);
 
   const query = useQuery(queryOptions) as UseQueryResult<TData, TError> & {
     queryKey: QueryKey;
@@ -100,13 +306,248 @@ export function useGetTeamMembers<
 }
 
 /**
- * @summary Get a single team member with full mood history
+ * @summary Mood counts per label over time buckets
+ */
+export type getTeamMoodDistributionResponse200 = {
+  data: MoodDistribution;
+  status: 200;
+};
+
+export type getTeamMoodDistributionResponse400 = {
+  data: ApiError;
+  status: 400;
+};
+
+export type getTeamMoodDistributionResponseSuccess =
+  getTeamMoodDistributionResponse200 & {
+    headers: Headers;
+  };
+export type getTeamMoodDistributionResponseError = getTeamMoodDistributionResponse400 & {
+  headers: Headers;
+};
+
+export type getTeamMoodDistributionResponse =
+  | getTeamMoodDistributionResponseSuccess
+  | getTeamMoodDistributionResponseError;
+
+export const getGetTeamMoodDistributionUrl = (params?: GetTeamMoodDistributionParams) => {
+  const normalizedParams = new URLSearchParams();
+
+  Object.entries(params || {}).forEach(([key, value]) => {
+    if (value !== undefined) {
+      normalizedParams.append(key, value === null ? 'null' : value.toString());
+    }
+  });
+
+  const stringifiedParams = normalizedParams.toString();
+
+  return stringifiedParams.length > 0
+    ? `/team/analytics/moods?${stringifiedParams}`
+    : `/team/analytics/moods`;
+};
+
+export const getTeamMoodDistribution = async (
+  params?: GetTeamMoodDistributionParams,
+  options?: RequestInit,
+): Promise<getTeamMoodDistributionResponse> => {
+  return customFetch<getTeamMoodDistributionResponse>(
+    getGetTeamMoodDistributionUrl(params),
+    {
+      ...options,
+      method: 'GET',
+    },
+  );
+};
+
+export const getGetTeamMoodDistributionQueryKey = (
+  params?: GetTeamMoodDistributionParams,
+) => {
+  return [`/team/analytics/moods`, ...(params ? [params] : [])] as const;
+};
+
+export const getGetTeamMoodDistributionQueryOptions = <
+  TData = Awaited<ReturnType<typeof getTeamMoodDistribution>>,
+  TError = ApiError,
+>(
+  params?: GetTeamMoodDistributionParams,
+  options?: {
+    query?: UseQueryOptions<
+      Awaited<ReturnType<typeof getTeamMoodDistribution>>,
+      TError,
+      TData
+    >;
+    request?: SecondParameter<typeof customFetch>;
+  },
+) => {
+  const { query: queryOptions, request: requestOptions } = options ?? {};
+
+  const queryKey = queryOptions?.queryKey ?? getGetTeamMoodDistributionQueryKey(params);
+
+  const queryFn: QueryFunction<Awaited<ReturnType<typeof getTeamMoodDistribution>>> = ({
+    signal,
+  }) => getTeamMoodDistribution(params, { signal, ...requestOptions });
+
+  return { queryKey, queryFn, ...queryOptions } as UseQueryOptions<
+    Awaited<ReturnType<typeof getTeamMoodDistribution>>,
+    TError,
+    TData
+  > & { queryKey: QueryKey };
+};
+
+export type GetTeamMoodDistributionQueryResult = NonNullable<
+  Awaited<ReturnType<typeof getTeamMoodDistribution>>
+>;
+export type GetTeamMoodDistributionQueryError = ApiError;
+
+/**
+ * @summary Mood counts per label over time buckets
+ */
+
+export function useGetTeamMoodDistribution<
+  TData = Awaited<ReturnType<typeof getTeamMoodDistribution>>,
+  TError = ApiError,
+>(
+  params?: GetTeamMoodDistributionParams,
+  options?: {
+    query?: UseQueryOptions<
+      Awaited<ReturnType<typeof getTeamMoodDistribution>>,
+      TError,
+      TData
+    >;
+    request?: SecondParameter<typeof customFetch>;
+  },
+): UseQueryResult<TData, TError> & { queryKey: QueryKey } {
+  const queryOptions = getGetTeamMoodDistributionQueryOptions(params, options);
+
+  const query = useQuery(queryOptions) as UseQueryResult<TData, TError> & {
+    queryKey: QueryKey;
+  };
+
+  return { ...query, queryKey: queryOptions.queryKey };
+}
+
+/**
+ * Omit `since` for a full sync. Store `nextCursor` and pass it back as `since` to receive only rows created or changed afterwards. Members carry no history; their new entries are listed in `moods`. Deletions are not reported. While `hasMore` is true, call again right away.
+ * @summary Members and mood entries written since a sync cursor
+ */
+export type getTeamChangesResponse200 = {
+  data: TeamChanges;
+  status: 200;
+};
+
+export type getTeamChangesResponse400 = {
+  data: ApiError;
+  status: 400;
+};
+
+export type getTeamChangesResponseSuccess = getTeamChangesResponse200 & {
+  headers: Headers;
+};
+export type getTeamChangesResponseError = getTeamChangesResponse400 & {
+  headers: Headers;
+};
+
+export type getTeamChangesResponse =
+  | getTeamChangesResponseSuccess
+  | getTeamChangesResponseError;
+
+export const getGetTeamChangesUrl = (params?: GetTeamChangesParams) => {
+  const normalizedParams = new URLSearchParams();
+
+  Object.entries(params || {}).forEach(([key, value]) => {
+    if (value !== undefined) {
+      normalizedParams.append(key, value === null ? 'null' : value.toString());
+    }
+  });
+
+  const stringifiedParams = normalizedParams.toString();
+
+  return stringifiedParams.length > 0
+    ? `/team/changes?${stringifiedParams}`
+    : `/team/changes`;
+};
+
+export const getTeamChanges = async (
+  params?: GetTeamChangesParams,
+  options?: RequestInit,
+): Promise<getTeamChangesResponse> => {
+  return customFetch<getTeamChangesResponse>(getGetTeamChangesUrl(params), {
+    ...options,
+    method: 'GET',
+  });
+};
+
+export const getGetTeamChangesQueryKey = (params?: GetTeamChangesParams) => {
+  return [`/team/changes`, ...(params ? [params] : [])] as const;
+};
+
+export const getGetTeamChangesQueryOptions = <
+  TData = Awaited<ReturnType<typeof getTeamChanges>>,
+  TError = ApiError,
+>(
+  params?: GetTeamChangesParams,
+  options?: {
+    query?: UseQueryOptions<Awaited<ReturnType<typeof getTeamChanges>>, TError, TData>;
+    request?: SecondParameter<typeof customFetch>;
+  },
+) => {
+  const { query: queryOptions, request: requestOptions } = options ?? {};
+
+  const queryKey = queryOptions?.queryKey ?? getGetTeamChangesQueryKey(params);
+
+  const queryFn: QueryFunction<Awaited<ReturnType<typeof getTeamChanges>>> = ({
+    signal,
+  }) => getTeamChanges(params, { signal, ...requestOptions });
+
+  return { queryKey, queryFn, ...queryOptions } as UseQueryOptions<
+    Awaited<ReturnType<typeof getTeamChanges>>,
+    TError,
+    TData
+  > & { queryKey: QueryKey };
+};
+
+export type GetTeamChangesQueryResult = NonNullable<
+  Awaited<ReturnType<typeof getTeamChanges>>
+>;
+export type GetTeamChangesQueryError = ApiError;
+
+/**
+ * @summary Members and mood entries written since a sync cursor
+ */
+
+export function useGetTeamChanges<
+  TData = Awaited<ReturnType<typeof getTeamChanges>>,
+  TError = ApiError,
+>(
+  params?: GetTeamChangesParams,
+  options?: {
+    query?: UseQueryOptions<Awaited<ReturnType<typeof getTeamChanges>>, TError, TData>;
+    request?: SecondParameter<typeof customFetch>;
+  },
+): UseQueryResult<TData, TError> & { queryKey: QueryKey } {
+  const queryOptions = getGetTeamChangesQueryOptions(params, options);
+
+  const query = useQuery(queryOptions) as UseQueryResult<TData, TError> & {
+    queryKey: QueryKey;
+  };
+
+  return { ...query, queryKey: queryOptions.queryKey };
+}
+
+/**
+ * Pass `include=history` for the full mood history. `fields` limits the member to the listed keys; `id` is always returned.
+ * @summary Get a single team member
  */
 export type getTeamMemberByIdResponse200 = {
   data: TeamMember;
   status: 200;
 };
 
+export type getTeamMemberByIdResponse400 = {
+  data: ApiError;
+  status: 400;
+};
+
 export type getTeamMemberByIdResponse404 = {
   data: ApiError;
   status: 404;
@@ -115,7 +556,10 @@ export type getTeamMemberByIdResponse404 = {
 export type getTeamMemberByIdResponseSuccess = getTeamMemberByIdResponse200 & {
   headers: Headers;
 };
-export type getTeamMemberByIdResponseError = getTeamMemberByIdResponse404 & {
+export type getTeamMemberByIdResponseError = (
+  | getTeamMemberByIdResponse400
+  | getTeamMemberByIdResponse404
+) & {
   headers: Headers;
 };
 
@@ -123,22 +567,38 @@ export type getTeamMemberByIdResponse =
   | getTeamMemberByIdResponseSuccess
   | getTeamMemberByIdResponseError;
 
-export const getGetTeamMemberByIdUrl = (id: string) => {
-  return `/team/${id}`;
+export const getGetTeamMemberByIdUrl = (id: string, params?: GetTeamMemberByIdParams) => {
+  const normalizedParams = new URLSearchParams();
+
+  Object.entries(params || {}).forEach(([key, value]) => {
+    if (value !== undefined) {
+      normalizedParams.append(key, value === null ? 'null' : value.toString());
+    }
+  });
+
+  const stringifiedParams = normalizedParams.toString();
+
+  return stringifiedParams.length > 0
+    ? `/team/${id}?${stringifiedParams}`
+    : `/team/${id}`;
 };
 
 export const getTeamMemberById = async (
   id: string,
+  params?: GetTeamMemberByIdParams,
   options?: RequestInit,
 ): Promise<getTeamMemberByIdResponse> => {
-  return customFetch<getTeamMemberByIdResponse>(getGetTeamMemberByIdUrl(id), {
+  return customFetch<getTeamMemberByIdResponse>(getGetTeamMemberByIdUrl(id, params), {
     ...options,
     method: 'GET',
   });
 };
 
-export const getGetTeamMemberByIdQueryKey = (id: string) => {
-  return [`/team/${id}`] as const;
+export const getGetTeamMemberByIdQueryKey = (
+  id: string,
+  params?: GetTeamMemberByIdParams,
+) => {
+  return [`/team/${id}`, ...(params ? [params] : [])] as const;
 };
 
 export const getGetTeamMemberByIdQueryOptions = <
@@ -146,6 +606,7 @@ export const getGetTeamMemberByIdQueryOptions = <
   TError = ApiError,
 >(
   id: string,
+  params?: GetTeamMemberByIdParams,
   options?: {
     query?: UseQueryOptions<Awaited<ReturnType<typeof getTeamMemberById>>, TError, TData>;
     request?: SecondParameter<typeof customFetch>;
@@ -153,11 +614,11 @@ export const getGetTeamMemberByIdQueryOptions = <
 ) => {
   const { query: queryOptions, request: requestOptions } = options ?? {};
 
-  const queryKey = queryOptions?.queryKey ?? getGetTeamMemberByIdQueryKey(id);
+  const queryKey = queryOptions?.queryKey ?? getGetTeamMemberByIdQueryKey(id, params);
 
   const queryFn: QueryFunction<Awaited<ReturnType<typeof getTeamMemberById>>> = ({
     signal,
-  }) => getTeamMemberById(id, { signal, ...requestOptions });
+  }) => getTeamMemberById(id, params, { signal, ...requestOptions });
 
   return { queryKey, queryFn, enabled: !!id, ...queryOptions } as UseQueryOptions<
     Awaited<ReturnType<typeof getTeamMemberById>>,
@@ -172,7 +633,7 @@ export type GetTeamMemberByIdQueryResult = NonNullable<
 export type GetTeamMemberByIdQueryError = ApiError;
 
 /**
- * @summary Get a single team member with full mood history
+ * @summary Get a single team member
  */
 
 export function useGetTeamMemberById<
@@ -180,12 +641,143 @@ export function useGetTeamMemberById<
   TError = ApiError,
 >(
   id: string,
+  params?: GetTeamMemberByIdParams,
   options?: {
     query?: UseQueryOptions<Awaited<ReturnType<typeof getTeamMemberById>>, TError, TData>;
     request?: SecondParameter<typeof customFetch>;
   },
 ): UseQueryResult<TData, TError> & { queryKey: QueryKey } {
-  const queryOptions = getGetTeamMemberByIdQueryOptions(id, options);
+  const queryOptions = getGetTeamMemberByIdQueryOptions(id, params, options);
+
+  const query = useQuery(queryOptions) as UseQueryResult<TData, TError> & {
+    queryKey: QueryKey;
+  };
+
+  return { ...query, queryKey: queryOptions.queryKey };
+}
+
+/**
+ * @summary Page through a team member's mood history, newest first
+ */
+export type getTeamMemberMoodHistoryResponse200 = {
+  data: MoodHistoryPage;
+  status: 200;
+};
+
+export type getTeamMemberMoodHistoryResponse404 = {
+  data: ApiError;
+  status: 404;
+};
+
+export type getTeamMemberMoodHistoryResponseSuccess =
+  getTeamMemberMoodHistoryResponse200 & {
+    headers: Headers;
+  };
+export type getTeamMemberMoodHistoryResponseError =
+  getTeamMemberMoodHistoryResponse404 & {
+    headers: Headers;
+  };
+
+export type getTeamMemberMoodHistoryResponse =
+  | getTeamMemberMoodHistoryResponseSuccess
+  | getTeamMemberMoodHistoryResponseError;
+
+export const getGetTeamMemberMoodHistoryUrl = (
+  id: string,
+  params?: GetTeamMemberMoodHistoryParams,
+) => {
+  const normalizedParams = new URLSearchParams();
+
+  Object.entries(params || {}).forEach(([key, value]) => {
+    if (value !== undefined) {
+      normalizedParams.append(key, value === null ? 'null' : value.toString());
+    }
+  });
+
+  const stringifiedParams = normalizedParams.toString();
+
+  return stringifiedParams.length > 0
+    ? `/team/${id}/moods?${stringifiedParams}`
+    : `/team/${id}/moods`;
+};
+
+export const getTeamMemberMoodHistory = async (
+  id: string,
+  params?: GetTeamMemberMoodHistoryParams,
+  options?: RequestInit,
+): Promise<getTeamMemberMoodHistoryResponse> => {
+  return customFetch<getTeamMemberMoodHistoryResponse>(
+    getGetTeamMemberMoodHistoryUrl(id, params),
+    {
+      ...options,
+      method: 'GET',
+    },
+  );
+};
+
+export const getGetTeamMemberMoodHistoryQueryKey = (
+  id: string,
+  params?: GetTeamMemberMoodHistoryParams,
+) => {
+  return [`/team/${id}/moods`, ...(params ? [params] : [])] as const;
+};
+
+export const getGetTeamMemberMoodHistoryQueryOptions = <
+  TData = Awaited<ReturnType<typeof getTeamMemberMoodHistory>>,
+  TError = ApiError,
+>(
+  id: string,
+  params?: GetTeamMemberMoodHistoryParams,
+  options?: {
+    query?: UseQueryOptions<
+      Awaited<ReturnType<typeof getTeamMemberMoodHistory>>,
+      TError,
+      TData
+    >;
+    request?: SecondParameter<typeof customFetch>;
+  },
+) => {
+  const { query: queryOptions, request: requestOptions } = options ?? {};
+
+  const queryKey =
+    queryOptions?.queryKey ?? getGetTeamMemberMoodHistoryQueryKey(id, params);
+
+  const queryFn: QueryFunction<
+    Awaited<ReturnType<typeof getTeamMemberMoodHistory>>
+  > = ({ signal }) => getTeamMemberMoodHistory(id, params, { signal, ...requestOptions });
+
+  return { queryKey, queryFn, enabled: !!id, ...queryOptions } as UseQueryOptions<
+    Awaited<ReturnType<typeof getTeamMemberMoodHistory>>,
+    TError,
+    TData
+  > & { queryKey: QueryKey };
+};
+
+export type GetTeamMemberMoodHistoryQueryResult = NonNullable<
+  Awaited<ReturnType<typeof getTeamMemberMoodHistory>>
+>;
+export type GetTeamMemberMoodHistoryQueryError = ApiError;
+
+/**
+ * @summary Page through a team member's mood history, newest first
+ */
+
+export function useGetTeamMemberMoodHistory<
+  TData = Awaited<ReturnType<typeof getTeamMemberMoodHistory>>,
+  TError = ApiError,
+>(
+  id: string,
+  params?: GetTeamMemberMoodHistoryParams,
+  options?: {
+    query?: UseQueryOptions<
+      Awaited<ReturnType<typeof getTeamMemberMoodHistory>>,
+      TError,
+      TData
+    >;
+    request?: SecondParameter<typeof customFetch>;
+  },
+): UseQueryResult<TData, TError> & { queryKey: QueryKey } {
+  const queryOptions = getGetTeamMemberMoodHistoryQueryOptions(id, params, options);
 
   const query = useQuery(queryOptions) as UseQueryResult<TData, TError> & {
     queryKey: QueryKey;
@@ -0,0 +1,20 @@
+/**
+ * Generated by orval v8.5.0 🍺
+ * Do not edit manually.
+ * Agentic RN Demo API
+ * FastAPI backend for the agentic-rn-demo monorepo. This spec is the single source of truth for frontend type generation via orval.
+ * OpenAPI spec version: 0.1.0
+ */
+import type { MemberFieldsParameter } from './memberFieldsParameter';
+import type { MemberIncludeParameter } from './memberIncludeParameter';
+
+export type GetTeamMemberByIdParams = {
+  /**
+   * Comma-separated member keys to return, e.g. `id,name,currentMood`
+   */
+  fields?: MemberFieldsParameter;
+  /**
+   * Comma-separated relations to load; `history` adds `moodHistory`
+   */
+  include?: MemberIncludeParameter;
+};
@@ -0,0 +1,39 @@
+/**
+ * Generated by orval v8.5.0 🍺
+ * Do not edit manually.
+ * Agentic RN Demo API
+ * FastAPI backend for the agentic-rn-demo monorepo. This spec is the single source of truth for frontend type generation via orval.
+ * OpenAPI spec version: 0.1.0
+ */
+import type { MemberFieldsParameter } from './memberFieldsParameter';
+import type { MemberIncludeParameter } from './memberIncludeParameter';
+
+export type GetTeamMembersParams = {
+  /**
+   * Opaque `nextCursor` from a previous page
+   */
+  cursor?: string;
+  /**
+   * Page size; omit, along with `cursor`, to return every member as a list
+   * @minimum 1
+   * @maximum 500
+   */
+  limit?: number;
+  /**
+   * Maximum mood entries returned per member; implies include=history
+   * @minimum 0
+   */
+  history_limit?: number;
+  /**
+   * Comma-separated member keys to return, e.g. `id,name,currentMood`
+   */
+  fields?: MemberFieldsParameter;
+  /**
+   * Comma-separated relations to load; `history` adds `moodHistory`
+   */
+  include?: MemberIncludeParameter;
+  /**
+   * Stream members as NDJSON, same as Accept: application/x-ndjson
+   */
+  stream?: boolean;
+};
@@ -0,0 +1,16 @@
+/**
+ * Generated by orval v8.5.0 🍺
+ * Do not edit manually.
+ * Agentic RN Demo API
+ * FastAPI backend for the agentic-rn-demo monorepo. This spec is the single source of truth for frontend type generation via orval.
+ * OpenAPI spec version: 0.1.0
+ */
+
+export type GetTeamMoodDistributionBucket =
+  (typeof GetTeamMoodDistributionBucket)[keyof typeof GetTeamMoodDistributionBucket];
+
+export const GetTeamMoodDistributionBucket = {
+  hour: 'hour',
+  day: 'day',
+  week: 'week',
+} as const;
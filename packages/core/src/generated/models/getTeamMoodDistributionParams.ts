@@ -0,0 +1,23 @@
+/**
+ * Generated by orval v8.5.0 🍺
+ * Do not edit manually.
+ * Agentic RN Demo API
+ * FastAPI backend for the agentic-rn-demo monorepo. This spec is the single source of truth for frontend type generation via orval.
+ * OpenAPI spec version: 0.1.0
+ */
+import type { GetTeamMoodDistributionBucket } from './getTeamMoodDistributionBucket';
+import type { GetTeamMoodDistributionStatus } from './getTeamMoodDistributionStatus';
+
+export type GetTeamMoodDistributionParams = {
+  bucket?: GetTeamMoodDistributionBucket;
+  /**
+   * Inclusive start; defaults to 24 hours, 7 days or 12 weeks before until
+   */
+  since?: string;
+  /**
+   * Exclusive end; defaults to now
+   */
+  until?: string;
+  role?: string;
+  status?: GetTeamMoodDistributionStatus;
+};
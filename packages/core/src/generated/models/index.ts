@@ -7,10 +7,36 @@
  */
 
 export * from './apiError';
+export * from './batchMoodItem';
+export * from './batchMoodResult';
+export * from './batchMoodResultStatus';
+export * from './getTeamChangesParams';
+export * from './getTeamMemberByIdParams';
+export * from './getTeamMemberMoodHistoryParams';
+export * from './getTeamMembers200';
+export * from './getTeamMembersParams';
+export * from './getTeamMoodDistributionBucket';
+export * from './getTeamMoodDistributionParams';
+export * from './getTeamMoodDistributionStatus';
 export * from './healthResponse';
+export * from './memberFieldsParameter';
+export * from './memberFieldsParameterItem';
+export * from './memberIncludeParameter';
+export * from './memberIncludeParameterItem';
+export * from './moodBucket';
+export * from './moodBucketCounts';
+export * from './moodChange';
+export * from './moodDistribution';
+export * from './moodDistributionBucket';
 export * from './moodEntry';
+export * from './moodEvent';
+export * from './moodHistoryPage';
 export * from './submitMoodRequest';
+export * from './teamChanges';
 export * from './teamMember';
+export * from './teamMemberChange';
+export * from './teamMemberChangeStatus';
+export * from './teamMemberPage';
 export * from './teamMemberStatus';
 export * from './updatePreferencesRequest';
 export * from './userPreferences';
@@ -0,0 +1,13 @@
+/**
+ * Generated by orval v8.5.0 🍺
+ * Do not edit manually.
+ * Agentic RN Demo API
+ * FastAPI backend for the agentic-rn-demo monorepo. This spec is the single source of truth for frontend type generation via orval.
+ * OpenAPI spec version: 0.1.0
+ */
+import type { MoodEntry } from './moodEntry';
+
+export interface MoodHistoryPage {
+  items: MoodEntry[];
+  nextCursor: string | null;
+}
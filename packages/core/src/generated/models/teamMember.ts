@@ -8,12 +8,15 @@
 import type { MoodEntry } from './moodEntry';
 import type { TeamMemberStatus } from './teamMemberStatus';
 
+/**
+ * Every key except `moodHistory` is present unless `fields` narrows the selection; `moodHistory` only with `include=history`.
+ */
 export interface TeamMember {
   id: string;
-  name: string;
-  role: string;
-  avatarUrl: string | null;
-  status: TeamMemberStatus;
-  currentMood: MoodEntry;
-  moodHistory: MoodEntry[];
+  name?: string;
+  role?: string;
+  avatarUrl?: string | null;
+  status?: TeamMemberStatus;
+  currentMood?: MoodEntry | null;
+  moodHistory?: MoodEntry[];
 }
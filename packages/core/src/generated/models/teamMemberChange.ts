@@ -0,0 +1,18 @@
+/**
+ * Generated by orval v8.5.0 🍺
+ * Do not edit manually.
+ * Agentic RN Demo API
+ * FastAPI backend for the agentic-rn-demo monorepo. This spec is the single source of truth for frontend type generation via orval.
+ * OpenAPI spec version: 0.1.0
+ */
+import type { MoodEntry } from './moodEntry';
+import type { TeamMemberChangeStatus } from './teamMemberChangeStatus';
+
+export interface TeamMemberChange {
+  id: string;
+  name: string;
+  role: string;
+  avatarUrl: string | null;
+  status: TeamMemberChangeStatus;
+  currentMood: MoodEntry | null;
+}